@@ -1,13 +1,39 @@
+import io
 import os
-import re
+import json
+import contextlib
+import math
+import time
+import datetime
 import logging
+import zipfile
+import tempfile
+import threading
 import requests
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, Response, g, request, jsonify, send_file, stream_with_context
 from flask_cors import CORS
 from docx import Document
 from docx.shared import Pt
-from fpdf import FPDF
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Dict, Any, Iterator, List, Optional, Tuple, Union
+from werkzeug.exceptions import RequestEntityTooLarge
+from job_queue import JobQueue, QueueFullError
+from llm_client import LLMClient
+from llm_scheduler import BATCH, INTERACTIVE, LLMBusyError, LLMRetryLaterError, LLMScheduler
+from failover import CircuitBreaker, FailoverCaller
+from summarizer import ChunkedSummarizer
+from minutes_cache import MinutesCache, MemoryCacheBackend, SQLiteCacheBackend, make_cache_key
+from single_flight import SingleFlight
+from transcript_cache import TranscriptCache
+from retrieval import PassageIndexStore
+from docx_stream import extract_docx_text
+from pdf_renderer import render_minutes_pdf
+from artifacts import MinutesArtifacts
+from search_index import MinutesSearchIndex
+from live_sessions import LiveSessionManager, SessionConflictError, SessionFinalizedError, SessionNotFoundError
+from storage import LocalStorage, S3Storage, Storage, UploadStore, content_digest
+from metrics import HTTP_REQUEST_SECONDS, HTTP_REQUESTS_IN_FLIGHT, stage_timer
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest, multiprocess
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -21,6 +47,27 @@ app.config['UPLOAD_FOLDER'] = os.environ.get('UPLOAD_FOLDER', '/path/to/upload/f
 app.config['OUTPUT_FOLDER'] = os.environ.get('OUTPUT_FOLDER', '/path/to/output/folder')
 PORT = int(os.environ.get('FLASK_PORT', 5000))  # Default to 5000 if not set
 
+# Upload handling: 'sync' writes the upload before generating, 'async' writes it in the
+# background and 'none' never writes it (the upload is then unavailable to /ask_question).
+# Uploads for async=true jobs are always stored before the job is queued
+UPLOAD_PERSIST = os.environ.get('UPLOAD_PERSIST', 'sync')
+MAX_UPLOAD_MB = int(os.environ.get('MAX_UPLOAD_MB', 50))
+app.config['MAX_CONTENT_LENGTH'] = MAX_UPLOAD_MB * 1024 * 1024
+
+# Where uploads and generated minutes live: 'local' uses UPLOAD_FOLDER and OUTPUT_FOLDER,
+# 's3' an S3-compatible bucket shared by every replica
+STORAGE_BACKEND = os.environ.get('STORAGE_BACKEND', 'local')
+S3_BUCKET = os.environ.get('S3_BUCKET')
+S3_PREFIX = os.environ.get('S3_PREFIX', '')
+S3_ENDPOINT_URL = os.environ.get('S3_ENDPOINT_URL')  # e.g. a MinIO URL; unset for AWS
+S3_REGION = os.environ.get('S3_REGION')
+
+# 'stream' parses word/document.xml incrementally; 'python-docx' loads the full object model
+DOCX_EXTRACTOR = os.environ.get('DOCX_EXTRACTOR', 'stream')
+
+# Render PDF/DOCX on first download instead of at generation time
+LAZY_RENDER = os.environ.get('LAZY_RENDER', 'true').lower() in ('1', 'true', 'yes')
+
 # LLM Service Configuration
 PRIMARY_URL = os.environ.get('PRIMARY_LLM_URL')
 BACKUP_URL = os.environ.get('BACKUP_LLM_URL')
@@ -29,82 +76,399 @@ BACKUP_API_KEY = os.environ.get('BACKUP_LLM_API_KEY')
 PRIMARY_MODEL = os.environ.get('PRIMARY_LLM_MODEL')
 BACKUP_MODEL = os.environ.get('BACKUP_LLM_MODEL')
 
+# LLM HTTP client configuration (timeouts in seconds)
+LLM_CONNECT_TIMEOUT = float(os.environ.get('LLM_CONNECT_TIMEOUT', 5))
+LLM_READ_TIMEOUT = float(os.environ.get('LLM_READ_TIMEOUT', 120))
+QA_READ_TIMEOUT = float(os.environ.get('QA_READ_TIMEOUT', 30))
+LLM_POOL_SIZE = int(os.environ.get('LLM_POOL_SIZE', 16))
+LLM_MAX_CONCURRENCY = int(os.environ.get('LLM_MAX_CONCURRENCY', 8))  # Upstream calls in flight per process
+
+# LLM admission control: interactive QA is scheduled ahead of minutes generation (batch)
+# LLM_TOKENS_PER_MINUTE is what the gateway allows the whole deployment (0 disables the budget).
+# The budget is enforced per process, so each process gets an equal share of it:
+# LLM_TOKENS_PER_MINUTE / (GUNICORN_WORKERS * LLM_BUDGET_REPLICAS). Set LLM_BUDGET_REPLICAS to
+# the HPA's maxReplicas to stay under the gateway limit at full scale; with fewer pods running,
+# part of the budget goes unused
+LLM_TOKENS_PER_MINUTE = int(os.environ.get('LLM_TOKENS_PER_MINUTE', 0))
+LLM_BUDGET_REPLICAS = int(os.environ.get('LLM_BUDGET_REPLICAS', 1))
+LLM_PROCESS_TOKENS_PER_MINUTE = max(
+    1, LLM_TOKENS_PER_MINUTE // max(1, int(os.environ.get('GUNICORN_WORKERS', 1)) * LLM_BUDGET_REPLICAS)
+) if LLM_TOKENS_PER_MINUTE else 0
+LLM_INTERACTIVE_QUEUE = int(os.environ.get('LLM_INTERACTIVE_QUEUE', 64))  # Calls waiting before 503
+LLM_BATCH_QUEUE = int(os.environ.get('LLM_BATCH_QUEUE', 256))
+LLM_INTERACTIVE_MAX_WAIT = float(os.environ.get('LLM_INTERACTIVE_MAX_WAIT', 30))  # Seconds waiting before 503
+LLM_BATCH_MAX_WAIT = float(os.environ.get('LLM_BATCH_MAX_WAIT', 300))
+LLM_MAX_RETRIES = int(os.environ.get('LLM_MAX_RETRIES', 3))  # Retries of 429/503 responses
+LLM_BACKOFF_BASE = float(os.environ.get('LLM_BACKOFF_BASE', 0.5))
+LLM_BACKOFF_MAX = float(os.environ.get('LLM_BACKOFF_MAX', 30))
+QUEUE_RETRY_AFTER = int(os.environ.get('QUEUE_RETRY_AFTER', 30))  # Retry-After sent when the job queue is full
+
+# Circuit breaker and failover settings, applied to the primary and backup LLM separately
+BREAKER_WINDOW = int(os.environ.get('BREAKER_WINDOW', 20))  # Recent calls considered per endpoint
+BREAKER_MIN_CALLS = int(os.environ.get('BREAKER_MIN_CALLS', 5))
+BREAKER_ERROR_RATE = float(os.environ.get('BREAKER_ERROR_RATE', 0.5))
+BREAKER_SLOW_CALL_SECONDS = float(os.environ.get('BREAKER_SLOW_CALL_SECONDS', 60))
+BREAKER_SLOW_CALL_RATE = float(os.environ.get('BREAKER_SLOW_CALL_RATE', 0.8))
+BREAKER_OPEN_SECONDS = float(os.environ.get('BREAKER_OPEN_SECONDS', 30))  # Cool-down before a half-open probe
+BREAKER_HALF_OPEN_PROBES = int(os.environ.get('BREAKER_HALF_OPEN_PROBES', 1))
+LLM_HEDGE_PERCENTILE = float(os.environ.get('LLM_HEDGE_PERCENTILE', 0))  # e.g. 95 to hedge slow calls; 0 disables
+LLM_HEDGE_MIN_SAMPLES = int(os.environ.get('LLM_HEDGE_MIN_SAMPLES', 20))
+
+# Minutes generation configuration
+MINUTES_MAX_TOKENS = int(os.environ.get('MINUTES_MAX_TOKENS', 8000))
+MINUTES_CHUNK_CHARS = int(os.environ.get('MINUTES_CHUNK_CHARS', 24000))  # Longer transcripts are map-reduced
+MINUTES_CHUNK_MAX_TOKENS = int(os.environ.get('MINUTES_CHUNK_MAX_TOKENS', 1500))
+MINUTES_MAP_WORKERS = int(os.environ.get('MINUTES_MAP_WORKERS', 4))
+
+# Generated minutes cache configuration
+MINUTES_CACHE_BACKEND = os.environ.get('MINUTES_CACHE_BACKEND', 'memory')  # 'memory', 'sqlite' or 'none'
+MINUTES_CACHE_PATH = os.environ.get(
+    'MINUTES_CACHE_PATH', os.path.join(app.config['OUTPUT_FOLDER'], 'minutes_cache.sqlite3')
+)
+MINUTES_CACHE_MAX_ENTRIES = int(os.environ.get('MINUTES_CACHE_MAX_ENTRIES', 256))
+MINUTES_CACHE_SHARED_MAX_ENTRIES = int(os.environ.get('MINUTES_CACHE_SHARED_MAX_ENTRIES', 10000))
+MINUTES_CACHE_TTL = int(os.environ.get('MINUTES_CACHE_TTL', 86400))  # Seconds
+TRANSCRIPT_CACHE_MB = int(os.environ.get('TRANSCRIPT_CACHE_MB', 64))  # Memory bound for extracted transcripts
+
+# Question answering retrieval configuration
+QA_TOP_K = int(os.environ.get('QA_TOP_K', 6))  # Passages sent to the LLM per question
+QA_PASSAGE_CHARS = int(os.environ.get('QA_PASSAGE_CHARS', 1200))
+QA_FULL_CONTEXT = os.environ.get('QA_FULL_CONTEXT', 'false').lower() in ('1', 'true', 'yes')
+QA_BATCH_WORKERS = int(os.environ.get('QA_BATCH_WORKERS', 8))  # Questions answered concurrently by /ask_questions
+QA_BATCH_MAX_QUESTIONS = int(os.environ.get('QA_BATCH_MAX_QUESTIONS', 20))
+
+# Background job configuration
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', 4))
+JOB_QUEUE_DEPTH = int(os.environ.get('JOB_QUEUE_DEPTH', 100))
+JOB_RESULT_TTL = int(os.environ.get('JOB_RESULT_TTL', 3600))  # Seconds to keep finished jobs
+JOB_MAX_WAIT = int(os.environ.get('JOB_MAX_WAIT', 60))  # Upper bound for long-poll requests
+
+# Batch upload configuration
+BATCH_WORKERS = int(os.environ.get('BATCH_WORKERS', 4))
+BATCH_MAX_FILES = int(os.environ.get('BATCH_MAX_FILES', 50))
+# MAX_UPLOAD_MB only bounds the compressed zip; this caps what its members unpack to in total
+BATCH_MAX_UNZIPPED_MB = int(os.environ.get('BATCH_MAX_UNZIPPED_MB', 500))
+
+# Cross-meeting full-text search over generated minutes. The index is a local cache
+# that is backfilled and kept in sync from the minutes in output storage, so with S3 each
+# host keeps its own copy in a temp directory
+SEARCH_INDEX_PATH = os.environ.get('SEARCH_INDEX_PATH', os.path.join(
+    tempfile.gettempdir() if STORAGE_BACKEND == 's3' else app.config['OUTPUT_FOLDER'], 'search_index.sqlite3'
+))
+SEARCH_SYNC_INTERVAL = float(os.environ.get('SEARCH_SYNC_INTERVAL', 60))  # Seconds between syncs from storage
+SEARCH_MAX_RESULTS = int(os.environ.get('SEARCH_MAX_RESULTS', 100))
+
+# Live meeting sessions
+LIVE_UPDATE_CHARS = int(os.environ.get('LIVE_UPDATE_CHARS', 4000))  # New transcript that triggers a summary update
+LIVE_FOLD_MAX_CHARS = int(os.environ.get('LIVE_FOLD_MAX_CHARS', MINUTES_CHUNK_CHARS))  # New text per update call
+LIVE_WORKERS = int(os.environ.get('LIVE_WORKERS', 4))
+
+# Concurrency, token budget and priority lanes for every upstream LLM call
+llm_scheduler = LLMScheduler(
+    max_concurrency=LLM_MAX_CONCURRENCY,
+    tokens_per_minute=LLM_PROCESS_TOKENS_PER_MINUTE,
+    max_queue={INTERACTIVE: LLM_INTERACTIVE_QUEUE, BATCH: LLM_BATCH_QUEUE},
+    max_wait={INTERACTIVE: LLM_INTERACTIVE_MAX_WAIT, BATCH: LLM_BATCH_MAX_WAIT},
+    max_retries=LLM_MAX_RETRIES,
+    backoff_base=LLM_BACKOFF_BASE,
+    backoff_max=LLM_BACKOFF_MAX
+)
+
+# Shared keep-alive client used for every LLM call
+llm_client = LLMClient(
+    connect_timeout=LLM_CONNECT_TIMEOUT,
+    read_timeout=LLM_READ_TIMEOUT,
+    pool_maxsize=LLM_POOL_SIZE,
+    scheduler=llm_scheduler
+)
+
+
+def _circuit_breaker(name: str) -> CircuitBreaker:
+    return CircuitBreaker(
+        name,
+        window_size=BREAKER_WINDOW,
+        min_calls=BREAKER_MIN_CALLS,
+        error_rate_threshold=BREAKER_ERROR_RATE,
+        slow_call_seconds=BREAKER_SLOW_CALL_SECONDS,
+        slow_call_rate_threshold=BREAKER_SLOW_CALL_RATE,
+        open_seconds=BREAKER_OPEN_SECONDS,
+        half_open_probes=BREAKER_HALF_OPEN_PROBES
+    )
+
+
+# Health-aware routing between the primary and backup LLM
+llm_failover = FailoverCaller(
+    primary=_circuit_breaker('primary'),
+    backup=_circuit_breaker('backup'),
+    hedge_percentile=LLM_HEDGE_PERCENTILE or None,
+    hedge_min_samples=LLM_HEDGE_MIN_SAMPLES,
+    max_workers=LLM_MAX_CONCURRENCY * 2,
+    local_errors=(LLMBusyError,)
+)
+
+# Parallel chunk summarizer for long transcripts
+summarizer = ChunkedSummarizer(max_chunk_chars=MINUTES_CHUNK_CHARS, max_workers=MINUTES_MAP_WORKERS)
+
+# Cache of generated minutes keyed by transcript, model and prompt templates
+minutes_cache = MinutesCache(
+    memory=MemoryCacheBackend(max_entries=MINUTES_CACHE_MAX_ENTRIES, ttl=MINUTES_CACHE_TTL),
+    shared=SQLiteCacheBackend(
+        MINUTES_CACHE_PATH, max_entries=MINUTES_CACHE_SHARED_MAX_ENTRIES, ttl=MINUTES_CACHE_TTL
+    ) if MINUTES_CACHE_BACKEND == 'sqlite' else None,
+    enabled=MINUTES_CACHE_BACKEND != 'none'
+)
+
+# Identical requests that arrive while the first is still running share its LLM call
+minutes_flight = SingleFlight('minutes')
+qa_flight = SingleFlight('qa')
+
+
+def make_storage(folder: str, area: str) -> Storage:
+    if STORAGE_BACKEND == 's3':
+        return S3Storage(S3_BUCKET, prefix=f"{S3_PREFIX}{area}/", endpoint_url=S3_ENDPOINT_URL, region_name=S3_REGION)
+    return LocalStorage(folder)
+
+
+# Uploads (under content-hash keys) and generated minutes
+upload_storage = make_storage(app.config['UPLOAD_FOLDER'], 'uploads')
+output_storage = make_storage(app.config['OUTPUT_FOLDER'], 'output')
+upload_store = UploadStore(upload_storage)
+
+# Extracted transcript text keyed by upload digest
+transcript_cache = TranscriptCache(max_bytes=TRANSCRIPT_CACHE_MB * 1024 * 1024)
+
+# BM25 passage indexes so questions only send the relevant parts of a transcript
+passage_index_store = PassageIndexStore(passage_chars=QA_PASSAGE_CHARS, storage=upload_storage)
+
+
+# Prompt templates for meeting minutes generation
+MINUTES_SYSTEM_PROMPT = "You are an assistant that helps analyze meeting transcripts."
+MINUTES_FORMAT_INSTRUCTIONS = (
+    "Provide very detailed meeting minutes with details like the date of the meeting, the speakers, "
+    "what were the highlights of what the speakers said, the category, any conclusions, next steps, "
+    "and action items. Make sure you highlight Attendees, Categories, conclusions and Meeting Summary in bold. "
+    "The headings should be supported by pdf format, place the bold text in Markdown format."
+)
+MINUTES_PROMPT_TEMPLATE = "Analyze the following meeting transcript:\n\n{transcript}\n\n" + MINUTES_FORMAT_INSTRUCTIONS
+CHUNK_PROMPT_TEMPLATE = (
+    "The following is part {index} of {total} of a meeting transcript:\n\n{chunk}\n\n"
+    "Write detailed notes for this part only: the date of the meeting if mentioned, the speakers, "
+    "the highlights of what each speaker said, topics discussed, decisions, conclusions, next steps "
+    "and action items with owners. Do not invent content that is not in this part."
+)
+REDUCE_PROMPT_TEMPLATE = (
+    "The following are notes taken from consecutive parts of a single meeting transcript:\n\n{notes}\n\n"
+    "Combine them into one set of meeting minutes for the whole meeting, merging duplicate attendees, "
+    "topics and action items. " + MINUTES_FORMAT_INSTRUCTIONS
+)
+LIVE_FOLD_PROMPT_TEMPLATE = (
+    "The following are the draft minutes of a meeting that is still in progress:\n\n{summary}\n\n"
+    "This is the next part of the transcript:\n\n{transcript}\n\n"
+    "Update the draft minutes to cover the new part as well. Keep everything in the draft that is still "
+    "accurate, merge duplicate attendees, topics and action items, and do not invent content. "
+    + MINUTES_FORMAT_INSTRUCTIONS
+)
+
+
+class LLMResponseError(Exception):
+    """Raised when the LLM responds successfully but without a usable completion."""
+
+
+def _minutes_payload(prompt: str, max_tokens: int) -> Dict[str, Any]:
+    return {
+        "model": PRIMARY_MODEL,
+        "max_tokens": max_tokens,
+        "messages": [
+            {"role": "system", "content": MINUTES_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+    }
+
+
+def _minutes_headers() -> Dict[str, str]:
+    return {"Content-Type": "application/json", "Authorization": f"Bearer {PRIMARY_API_KEY}"}
+
+
+def completion_text(result: Dict[str, Any]) -> Optional[str]:
+    """Text of a completions-style response: ``generated_text`` or OpenAI ``choices[0].text``."""
+    if result.get('generated_text'):
+        return result['generated_text']
+    choices = result.get('choices') or []
+    return choices[0].get('text') if choices else None
+
+
+def request_backup_completion(prompt: str, max_tokens: int) -> str:
+    """Send a minutes prompt to the backup completions endpoint and return its text."""
+    payload = {
+        "prompt": f"{MINUTES_SYSTEM_PROMPT}\n\n{prompt}",
+        "max_tokens": max_tokens,
+        "model": BACKUP_MODEL
+    }
+    headers = {"Content-Type": "application/json", "Authorization": BACKUP_API_KEY}
+    text = completion_text(llm_client.post_json(BACKUP_URL, payload, headers, lane=BATCH).data)
+    if not text:
+        raise LLMResponseError("Backup LLM returned an empty completion")
+    return text
+
+
+def _primary_chat_completion(prompt: str, max_tokens: int) -> str:
+    # Pooled keep-alive session with separate connect/read timeouts
+    response = llm_client.post_json(PRIMARY_URL, _minutes_payload(prompt, max_tokens), _minutes_headers(), lane=BATCH)
+
+    # Check for the structure and existence of 'choices'
+    result = response.data
+    if 'choices' in result and len(result['choices']) > 0:
+        return result['choices'][0]['message']['content']
+
+    error_message = result.get('error', 'Unknown error')
+    logging.error(f"LLM returned an error: {error_message}")
+    raise LLMResponseError(error_message)
+
+
+@stage_timer('llm')
+def request_chat_completion(prompt: str, max_tokens: int) -> str:
+    """Send a single minutes generation request and return its text.
+
+    Goes to the primary LLM unless its circuit is open, failing over to the backup
+    completions endpoint when one is configured.
+    """
+    return llm_failover.call(
+        'minutes',
+        lambda: _primary_chat_completion(prompt, max_tokens),
+        (lambda: request_backup_completion(prompt, max_tokens)) if BACKUP_URL else None
+    )
+
+
+def _summarize_chunk(chunk: str, index: int, total: int) -> str:
+    prompt = CHUNK_PROMPT_TEMPLATE.format(chunk=chunk, index=index, total=total)
+    return request_chat_completion(prompt, MINUTES_CHUNK_MAX_TOKENS)
+
+
+def _reduce_prompt(notes: List[str]) -> str:
+    joined = '\n\n'.join(f"Part {i}:\n{note}" for i, note in enumerate(notes, start=1))
+    return REDUCE_PROMPT_TEMPLATE.format(notes=joined)
+
+
+def _reduce_chunk_notes(notes: List[str]) -> str:
+    return request_chat_completion(_reduce_prompt(notes), MINUTES_MAX_TOKENS)
+
+
+def fold_live_summary(summary: str, transcript: str) -> str:
+    """Fold new transcript text into the draft minutes of a live session."""
+    if not summary:
+        prompt = MINUTES_PROMPT_TEMPLATE.format(transcript=transcript)
+    else:
+        prompt = LIVE_FOLD_PROMPT_TEMPLATE.format(summary=summary, transcript=transcript)
+    return request_chat_completion(prompt, MINUTES_MAX_TOKENS)
+
+
+def minutes_cache_key(transcript: str) -> str:
+    """Cache key covering everything that determines the generated minutes."""
+    return make_cache_key(
+        transcript, PRIMARY_MODEL, MINUTES_SYSTEM_PROMPT, MINUTES_PROMPT_TEMPLATE,
+        CHUNK_PROMPT_TEMPLATE, REDUCE_PROMPT_TEMPLATE, str(MINUTES_CHUNK_CHARS)
+    )
+
+
+def _generate_and_cache_minutes(transcript: str, cache_key: str) -> str:
+    if summarizer.needs_chunking(transcript):
+        meeting_minutes = summarizer.summarize(transcript, _summarize_chunk, _reduce_chunk_notes)
+    else:
+        meeting_minutes = request_chat_completion(
+            MINUTES_PROMPT_TEMPLATE.format(transcript=transcript), MINUTES_MAX_TOKENS
+        )
+
+    # Cached before the flight is released so later duplicates hit the cache
+    minutes_cache.set(cache_key, meeting_minutes)
+    return meeting_minutes
+
 
 # LLM Call Function for Meeting Minutes Generation
 def generate_comprehensive_minutes(transcript: str) -> str:
     """
     Use LLM to generate comprehensive meeting minutes.
+
+    Transcripts longer than MINUTES_CHUNK_CHARS are summarized chunk by chunk in
+    parallel and the partial notes reduced into the final minutes. Successful
+    results are cached, so a repeated transcript skips the LLM entirely, and
+    duplicate requests that arrive while it is being generated wait for that result.
     
     Args:
         transcript (str): Full meeting transcript
     
     Returns:
         str: Formatted meeting minutes
+
+    Raises:
+        LLMRetryLaterError: The calls were not admitted or every endpoint is rate
+            limiting; retry later.
+        LLMResponseError, requests.RequestException: The LLM call failed. Errors are
+            never returned as minutes text.
     """
+    cache_key = minutes_cache_key(transcript)
+    cached_minutes = minutes_cache.get(cache_key)
+    if cached_minutes is not None:
+        logging.info("Using cached meeting minutes")
+        return cached_minutes
+
+    # Add more detailed logging
+    logging.info(f"Attempting to connect to {PRIMARY_URL}")
+    logging.info(f"Using API Key: {(PRIMARY_API_KEY or '')[:5]}...")  # Partial key for security
+
     try:
-        # Payload for Anthropic's Claude 3 (adjust as needed for your specific LLM)
-        payload = {
-            "model": PRIMARY_MODEL,
-            "max_tokens": 8000,
-            "messages": [
-                            {"role": "system", "content": "You are an assistant that helps analyze meeting transcripts."},
-            {"role": "user", "content": f"Analyze the following meeting transcript:\n\n{transcript}\n\nProvide very detailed meeting minutes with details like the date of the meeting, the speakers, what were the highlights of what the speakers said, the category, any conclusions, next steps, and action items. Make sure you highlight Attendees, Categories, conclusions and Meeting Summary in bold. The headings should be supported by pdf format, place the bold text in Markdown format."}
-                
-            ]
-        }
-        
-        # LLM Service Configuration (replace with your actual endpoint)
-       
-        headers = {"Content-Type": "application/json", "Authorization": f"Bearer {PRIMARY_API_KEY}"}
-          
-        
-        
-        # Add more detailed logging
-        logging.info(f"Attempting to connect to {PRIMARY_URL}")
-        logging.info(f"Using API Key: {PRIMARY_API_KEY[:5]}...")  # Partial key for security
-
-        # Increase timeout and add retry mechanism
-        response = requests.post(
-            PRIMARY_URL, 
-            json=payload, 
-            headers=headers
-           ## timeout=45,  # Increased timeout
-          ##  verify=True  # Ensure SSL certificate verification
-        )
-        
-        response.raise_for_status()  # This will raise an exception for bad HTTP status
-        
-        # Process successful response
-        result = response.json()
-         # Check for the structure and existence of 'choices'
-        if 'choices' in result and len(result['choices']) > 0:
-                return response.json()['choices'][0]['message']['content']
-               
-        else:
-                # Log the specific error or issue with the response
-                error_message = result.get('choices', [{'message': {'content': 'Unknown error'}}])[0]['message']['content']
-                logging.error(f"LLM returned an error: {error_message}")
-                return f"LLM error: {error_message}"
-        return response.json()['choices'][0]['message']['content']
-
-    except requests.exceptions.Timeout:
-        logging.error("Connection to LLM service timed out")
-        return "Error: Connection to LLM service timed out"
-    
-    except requests.exceptions.ConnectionError as e:
-        logging.error(f"Network connectivity error: {e}")
-        return f"Network Error: Unable to connect to LLM service. Details: {str(e)}"
-    
-    except requests.exceptions.RequestException as e:
-        logging.error(f"Unexpected error in LLM service call: {e}")
-        return f"Unexpected Error: {str(e)}"
-    
+        return minutes_flight.do(cache_key, lambda: _generate_and_cache_minutes(transcript, cache_key))
     except Exception as e:
-        logging.error(f"Unexpected general error: {e}")
-        return f"General Error: {str(e)}"
+        logging.error(f"Meeting minutes generation failed: {e}")
+        raise
+
+
+def stream_comprehensive_minutes(transcript: str) -> Iterator[str]:
+    """Yield meeting minutes text as the LLM generates it.
+
+    Long transcripts run the chunk summaries first and stream only the final reduce
+    pass. Raises on LLM errors; completed minutes are cached like
+    generate_comprehensive_minutes.
+    """
+    cache_key = minutes_cache_key(transcript)
+    cached_minutes = minutes_cache.get(cache_key)
+    if cached_minutes is not None:
+        logging.info("Using cached meeting minutes")
+        yield cached_minutes
+        return
+
+    if summarizer.needs_chunking(transcript):
+        prompt = _reduce_prompt(summarizer.map_notes(transcript, _summarize_chunk))
+    else:
+        prompt = MINUTES_PROMPT_TEMPLATE.format(transcript=transcript)
+
+    parts = []
+    primary_stream = lambda: llm_client.stream_chat(
+        PRIMARY_URL, _minutes_payload(prompt, MINUTES_MAX_TOKENS), _minutes_headers(), lane=BATCH
+    )
+    backup = (lambda: request_backup_completion(prompt, MINUTES_MAX_TOKENS)) if BACKUP_URL else None
+    with stage_timer('llm'):
+        for delta in llm_failover.stream('minutes', primary_stream, backup):
+            parts.append(delta)
+            yield delta
+
+    meeting_minutes = ''.join(parts)
+    if not meeting_minutes:
+        raise LLMResponseError("LLM returned an empty completion")
+    minutes_cache.set(cache_key, meeting_minutes)
+
+
 class MeetingMinutesQA:
-    def __init__(self, upload_folder, llm_urls, api_keys, models):
-        self.upload_folder = upload_folder
+    def __init__(self, upload_store: UploadStore, llm_urls, api_keys, models, client: LLMClient,
+                 failover: FailoverCaller, single_flight: SingleFlight, transcript_cache: TranscriptCache,
+                 passage_index_store: PassageIndexStore, top_k: int = 6, read_timeout: float = 30):
+        self.upload_store = upload_store
+        self.failover = failover
+        self.single_flight = single_flight
+        self.transcript_cache = transcript_cache
+        self.passage_index_store = passage_index_store
+        self.top_k = top_k
+        self.client = client
+        self.read_timeout = read_timeout
         self.primary_url = llm_urls['primary']
         self.backup_url = llm_urls['backup']
         self.primary_api_key = api_keys['primary']
@@ -113,13 +477,15 @@ class MeetingMinutesQA:
         self.backup_model = models['backup']
 
     def _extract_text_from_file(self, filename: str) -> Optional[str]:
-        """Extract text from a DOCX file."""
+        """Extract text from a DOCX upload, reusing previously extracted text when unchanged."""
         try:
-            full_path = os.path.join(self.upload_folder, filename)
-            
             if filename.lower().endswith('.docx'):
-                doc = Document(full_path)
-                return '\n'.join([para.text for para in doc.paragraphs])
+                digest = self.upload_store.digest(filename)
+                if digest is None:
+                    raise FileNotFoundError(f"No upload named {filename}")
+                return self.transcript_cache.get_or_load(
+                    digest, lambda: extract_text_from_docx(io.BytesIO(self.upload_store.read(digest)))
+                )
             
             else:
                 raise ValueError(f"Unsupported file type: {filename}")
@@ -128,86 +494,113 @@ class MeetingMinutesQA:
             logging.error(f"Error extracting text: {e}")
             return None
 
+    def _select_context(self, filename: str, transcript: str, question: str, full_context: bool = False) -> str:
+        """Return the transcript passages relevant to the question, or the full transcript."""
+        if full_context or len(transcript) <= self.top_k * self.passage_index_store.passage_chars:
+            return transcript
+
+        try:
+            digest = content_digest(transcript.encode('utf-8'))
+            index = self.passage_index_store.get_or_build(digest, lambda: transcript)
+            return '\n...\n'.join(index.top_passages(question, self.top_k))
+        except Exception as e:
+            logging.warning(f"Passage retrieval failed, using full transcript: {e}")
+            return transcript
+
+    def _primary_request(self, transcript: str, question: str):
+        payload = {
+            "model": self.primary_model,
+            "messages": [
+                {"role": "system", "content": "You are an AI assistant answering questions about meeting minutes."},
+                {"role": "user", "content": f"Meeting Minutes:\n{transcript}\n\nQuestion: {question}\n\nProvide a concise and direct answer based strictly on the meeting minutes."}
+            ]
+        }
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": self.primary_api_key,
+        }
+        return payload, headers
+
+    def _call_primary_llm(self, transcript: str, question: str) -> str:
+        """Answer with the primary chat completions endpoint."""
+        payload, headers = self._primary_request(transcript, question)
+        result = self.client.post_json(
+            self.primary_url, payload, headers, read_timeout=self.read_timeout, lane=INTERACTIVE
+        ).data
+        if not result.get('choices'):
+            raise LLMResponseError(result.get('error', 'Unknown error'))
+        return result['choices'][0]['message']['content']
+
+    def _call_backup_llm(self, transcript: str, question: str) -> str:
+        """Answer with the backup completions endpoint."""
+        backup_payload = {
+            "prompt": f"Meeting Minutes:\n{transcript}\n\nQuestion: {question}\n\nAnswer:",
+            "max_tokens": 500,
+            "model": self.backup_model
+        }
+        backup_headers = {
+            "Content-Type": "application/json",
+            "Authorization": self.backup_api_key,
+        }
+
+        backup_response = self.client.post_json(
+            self.backup_url, backup_payload, backup_headers, read_timeout=self.read_timeout, lane=INTERACTIVE
+        )
+        answer = completion_text(backup_response.data)
+        if not answer:
+            raise LLMResponseError("Backup LLM returned an empty answer")
+        return answer
+
+    def _backup_call(self, transcript: str, question: str):
+        if not self.backup_url:
+            return None
+        return lambda: self._call_backup_llm(transcript, question)
+
+    @stage_timer('qa_llm')
     def _call_llm_service(self, transcript: str, question: str) -> Optional[str]:
-        """Call LLM service with fallback mechanism."""
-        # Primary LLM call
+        """Call LLM service with fallback mechanism.
+
+        Skips the primary while its circuit is open, and may hedge a slow primary call
+        with the backup when LLM_HEDGE_PERCENTILE is set. Concurrent identical questions
+        over the same context share one call. LLMRetryLaterError (busy, or every endpoint
+        throttled) is raised rather than swallowed so callers can ask the client to retry.
+        """
+        key = make_cache_key(transcript, question, self.primary_model, self.backup_model)
         try:
-            payload = {
-                "model": self.primary_model,
-                "messages": [
-                    {"role": "system", "content": "You are an AI assistant answering questions about meeting minutes."},
-                    {"role": "user", "content": f"Meeting Minutes:\n{transcript}\n\nQuestion: {question}\n\nProvide a concise and direct answer based strictly on the meeting minutes."}
-                ]
-            }
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": self.primary_api_key,
-            }
-
-            response = requests.post(self.primary_url, json=payload, headers=headers, timeout=30)
-            response.raise_for_status()
-            result = response.json()
-            
-            return result['choices'][0]['message']['content'] if 'choices' in result else None
+            return self.single_flight.do(key, lambda: self.failover.call(
+                'qa', lambda: self._call_primary_llm(transcript, question), self._backup_call(transcript, question)
+            ))
+        except LLMRetryLaterError:
+            raise
+        except Exception as e:
+            logging.error(f"LLM service failed: {e}")
+            return None
 
-        except Exception as primary_error:
-            logging.warning(f"Primary LLM failed: {primary_error}")
-            
-            # Backup LLM call
-            try:
-                backup_payload = {
-                    "prompt": f"Meeting Minutes:\n{transcript}\n\nQuestion: {question}\n\nAnswer:",
-                    "max_tokens": 500,
-                    "model": self.backup_model
-                }
-                backup_headers = {
-                    "Content-Type": "application/json",
-                    "Authorization": self.backup_api_key,
-                }
-
-                backup_response = requests.post(self.backup_url, json=backup_payload, headers=backup_headers, timeout=30)
-                backup_response.raise_for_status()
-                
-                return backup_response.json().get('generated_text')
-
-            except Exception as backup_error:
-                logging.error(f"Backup LLM failed: {backup_error}")
-                return None
+    def _stream_llm_service(self, transcript: str, question: str) -> Iterator[str]:
+        """Stream the answer from the primary LLM, falling back to the backup before the first token."""
+        payload, headers = self._primary_request(transcript, question)
+        primary_stream = lambda: self.client.stream_chat(
+            self.primary_url, payload, headers, read_timeout=self.read_timeout, lane=INTERACTIVE
+        )
+        try:
+            with stage_timer('qa_llm'):
+                yield from self.failover.stream('qa', primary_stream, self._backup_call(transcript, question))
+        except LLMRetryLaterError:
+            raise
+        except Exception as e:
+            logging.error(f"LLM service failed: {e}")
+            raise LLMResponseError("Could not generate an answer.")
 
+@stage_timer('render_pdf')
 def write_minutes_to_pdf(meeting_minutes: str, output_pdf_path: str) -> None:
     """Write the meeting minutes to a PDF file."""
     try:
-        pdf = FPDF()
-        pdf.set_auto_page_break(auto=True, margin=15)
-        pdf.add_page()
-
-        # Set font for the body text
-        pdf.set_font("Arial", size=12)
-
-        # Add a title
-        pdf.set_font("Arial", style='B', size=16)
-        pdf.cell(200, 10, txt="Meeting Minutes", ln=True, align="C")
-        pdf.ln(10)
-
-        # Add the meeting minutes content
-        pdf.set_font("Arial", size=14)
-        for line in meeting_minutes.split('\n'):
-            # Detect and process bold text in markdown-like format (**bold**)
-            parts = re.split(r'(\*\*.*?\*\*)', line)
-            for part in parts:
-                if part.startswith('**') and part.endswith('**'):
-                    pdf.set_font("Arial", style='B', size=14)
-                    pdf.multi_cell(0, 10, part[2:-2])
-                else:
-                    pdf.set_font("Arial", size=14)
-                    if part.strip():  # Only process non-empty parts
-                        pdf.multi_cell(0, 10, part)
-
-        pdf.output(output_pdf_path)
+        render_minutes_pdf(meeting_minutes, output_pdf_path)
     except Exception as e:
         logging.error(f"Error writing PDF: {e}")
         raise
 
+@stage_timer('render_docx')
 def write_minutes_to_docx(meeting_minutes: str, output_docx_path: str) -> None:
     """Write the meeting minutes to a DOCX file."""
     try:
@@ -239,8 +632,21 @@ def write_minutes_to_docx(meeting_minutes: str, output_docx_path: str) -> None:
         logging.error(f"Error writing DOCX: {e}")
         raise
 
-def extract_text_from_docx(docx_path: str) -> str:
-    """Extract text from a DOCX file."""
+@stage_timer('extract')
+def extract_text_from_docx(docx_path: Union[str, IO[bytes]]) -> str:
+    """Extract text from a DOCX file path or binary file-like object.
+
+    Uses the streaming extractor unless DOCX_EXTRACTOR is 'python-docx', and falls back
+    to python-docx if streaming fails.
+    """
+    if DOCX_EXTRACTOR == 'stream':
+        try:
+            return extract_docx_text(docx_path)
+        except Exception as e:
+            logging.warning(f"Streaming DOCX extraction failed, falling back to python-docx: {e}")
+            if hasattr(docx_path, 'seek'):
+                docx_path.seek(0)
+
     try:
         doc = Document(docx_path)
         return '\n'.join([para.text for para in doc.paragraphs])
@@ -256,61 +662,476 @@ def analyze_meeting_transcript(transcript: str) -> str:
 
 # Initialize QA Handler
 qa_handler = MeetingMinutesQA(
-    upload_folder=app.config['UPLOAD_FOLDER'],
+    upload_store=upload_store,
     llm_urls={'primary': PRIMARY_URL, 'backup': BACKUP_URL},
     api_keys={'primary': PRIMARY_API_KEY, 'backup': BACKUP_API_KEY},
-    models={'primary': PRIMARY_MODEL, 'backup': BACKUP_MODEL}
+    models={'primary': PRIMARY_MODEL, 'backup': BACKUP_MODEL},
+    client=llm_client,
+    failover=llm_failover,
+    single_flight=qa_flight,
+    transcript_cache=transcript_cache,
+    passage_index_store=passage_index_store,
+    top_k=QA_TOP_K,
+    read_timeout=QA_READ_TIMEOUT
+)
+
+# Background job queue; job state is shared through output storage so any worker can report it
+job_queue = JobQueue(
+    max_workers=JOB_WORKERS, max_queue_depth=JOB_QUEUE_DEPTH, result_ttl=JOB_RESULT_TTL, storage=output_storage
+)
+
+# Background writer for uploads when UPLOAD_PERSIST is 'async'
+upload_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='upload-persist')
+
+# Executor shared by all batch uploads; LLM_MAX_CONCURRENCY still caps upstream calls
+batch_executor = ThreadPoolExecutor(max_workers=BATCH_WORKERS, thread_name_prefix='minutes-batch')
+
+# Executor for /ask_questions fan-out; LLM_MAX_CONCURRENCY still caps upstream calls
+qa_executor = ThreadPoolExecutor(max_workers=QA_BATCH_WORKERS, thread_name_prefix='qa-batch')
+
+# Canonical markdown minutes and their lazily rendered PDF/DOCX renditions
+minutes_artifacts = MinutesArtifacts(output_storage, {
+    'pdf': ('.pdf', write_minutes_to_pdf),
+    'docx': ('_minutes.docx', write_minutes_to_docx),
+})
+
+# Full-text index of every meeting's minutes, attendees, categories and action items
+search_index = MinutesSearchIndex(
+    SEARCH_INDEX_PATH,
+    source=output_storage,
+    suffix=MinutesArtifacts.MINUTES_SUFFIX,
+    sync_interval=SEARCH_SYNC_INTERVAL
+)
+
+# Rolling minutes for meetings in progress, kept next to the generated minutes
+live_sessions = LiveSessionManager(
+    output_storage,
+    fold_live_summary,
+    update_chars=LIVE_UPDATE_CHARS,
+    max_fold_chars=LIVE_FOLD_MAX_CHARS,
+    max_workers=LIVE_WORKERS
 )
 
+# Set once shutdown starts so /readyz stops new traffic being routed here
+draining = threading.Event()
+
+
+def drain() -> None:
+    """Stop accepting background work and wait for queued jobs, batches, upload writes and live updates."""
+    draining.set()
+    logging.info(f"Draining {job_queue.depth} queued or running jobs")
+    job_queue.shutdown(wait=True)
+    batch_executor.shutdown(wait=True)
+    upload_executor.shutdown(wait=True)
+    live_sessions.shutdown(wait=True)
+    logging.info("Drain complete")
+
+def retry_later(message: str, retry_after: float) -> Response:
+    """503 response telling the client when to retry, in the body and the Retry-After header."""
+    response = jsonify({"error": message, "retry_after": retry_after})
+    response.status_code = 503
+    response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+    return response
+
+def error_body(error: Exception) -> Dict[str, Any]:
+    """Error details for per-item results and SSE error events."""
+    if isinstance(error, LLMRetryLaterError):
+        return {"error": str(error), "retry_after": error.retry_after}
+    return {"error": str(error)}
+
+def minutes_result(docx_filename: str, output_format: str, rendered: bool) -> Dict[str, Any]:
+    """Response body describing generated minutes and where to download each format."""
+    base_filename = os.path.splitext(docx_filename)[0]
+    output_filename = minutes_artifacts.output_name(base_filename, output_format)
+    if rendered:
+        message = f"{output_format.upper()} generated successfully"
+    else:
+        message = f"Meeting minutes generated; {output_format.upper()} is rendered on first download"
+    return {
+        "message": message,
+        "filename": output_filename,
+        "docx_file": docx_filename,
+        "fullPath": output_storage.location(output_filename),
+        "minutes_file": minutes_artifacts.minutes_name(base_filename),
+        "formats": {
+            fmt: minutes_artifacts.output_name(base_filename, fmt) for fmt in minutes_artifacts.writers
+        }
+    }
+
+def store_minutes(base_filename: str, meeting_minutes: str) -> None:
+    """Save canonical minutes and add them to the cross-meeting search index."""
+    minutes_artifacts.save_minutes(base_filename, meeting_minutes)
+    try:
+        search_index.index(base_filename, meeting_minutes)
+    except Exception as e:
+        # Search is best effort; the minutes themselves are already stored
+        logging.warning(f"Could not index minutes for {base_filename}: {e}")
+
+def persist_upload(upload: bytes, docx_filename: str, transcript: Optional[str] = None) -> None:
+    """Store an upload and pre-warm the transcript cache for follow-up questions."""
+    try:
+        digest = upload_store.save(docx_filename, upload)
+        if transcript is not None:
+            transcript_cache.put(digest, transcript)
+    except Exception as e:
+        logging.error(f"Error saving upload {docx_filename}: {e}")
+        raise
+
+def load_upload(docx_filename: str, upload: Optional[bytes] = None, digest: Optional[str] = None) -> str:
+    """Extract the transcript of an upload and persist it according to UPLOAD_PERSIST.
+
+    When ``upload`` holds the DOCX bytes they are parsed in memory instead of being
+    read back from storage. Otherwise the stored upload ``digest`` is read, or the
+    latest upload named ``docx_filename``.
+    """
+    if upload is None:
+        digest = digest or upload_store.digest(docx_filename)
+        if digest is None:
+            raise FileNotFoundError(f"No upload named {docx_filename}")
+        transcript = extract_text_from_docx(io.BytesIO(upload_store.read(digest)))
+        transcript_cache.put(digest, transcript)  # Pre-warm for follow-up questions
+        return transcript
+
+    transcript = extract_text_from_docx(io.BytesIO(upload))
+    if UPLOAD_PERSIST == 'sync':
+        persist_upload(upload, docx_filename, transcript)
+    elif UPLOAD_PERSIST == 'async':
+        upload_executor.submit(persist_upload, upload, docx_filename, transcript)
+    return transcript
+
+def run_minutes_pipeline(docx_filename: str, output_format: str, upload: Optional[bytes] = None,
+                         digest: Optional[str] = None) -> Dict[str, Any]:
+    """Extract the transcript, generate minutes and store them as canonical markdown.
+
+    The requested format is rendered now unless LAZY_RENDER defers it to /download_file.
+    """
+    base_filename = os.path.splitext(docx_filename)[0]
+
+    transcript = load_upload(docx_filename, upload, digest)
+    meeting_minutes = generate_comprehensive_minutes(transcript)
+    store_minutes(base_filename, meeting_minutes)
+    if not LAZY_RENDER:
+        minutes_artifacts.render(base_filename, output_format, meeting_minutes)
+
+    return minutes_result(docx_filename, output_format, rendered=not LAZY_RENDER)
+
+def run_minutes_batch(uploads: List[Tuple[str, str]], output_format: str) -> Dict[str, Any]:
+    """Run the minutes pipeline for every (filename, digest) upload concurrently and return a manifest.
+
+    Each transcript is read by its digest, so a later upload under the same name cannot
+    swap it. A failure in one file is recorded in its manifest entry and does not affect
+    the others.
+    """
+    futures = [
+        (name, batch_executor.submit(run_minutes_pipeline, name, output_format, digest=digest))
+        for name, digest in uploads
+    ]
+
+    files = []
+    for docx_filename, future in futures:
+        try:
+            result = future.result()
+            files.append({
+                "docx_file": docx_filename,
+                "status": "completed",
+                "filename": result["filename"],
+                "download_url": f"/download_file/{result['filename']}"
+            })
+        except Exception as e:
+            logging.error(f"Batch generation failed for {docx_filename}: {e}")
+            files.append({"docx_file": docx_filename, "status": "failed", **error_body(e)})
+
+    completed = sum(1 for entry in files if entry["status"] == "completed")
+    return {
+        "message": f"Generated {completed} of {len(files)} meeting minutes",
+        "output_format": output_format,
+        "completed": completed,
+        "failed": len(files) - completed,
+        "files": files
+    }
+
+def answer_questions(filename: str, transcript: str, questions: List[str], full_context: bool) -> Dict[str, Any]:
+    """Answer several questions about one transcript concurrently.
+
+    The transcript is extracted and indexed once; each question gets its own retrieved
+    context and LLM call, so total latency is close to a single round trip. Repeated
+    questions share one call.
+    """
+    futures = {}
+    for question in questions:
+        if question not in futures:
+            context = qa_handler._select_context(filename, transcript, question, full_context)
+            futures[question] = qa_executor.submit(qa_handler._call_llm_service, context, question)
+
+    answers = []
+    for question in questions:
+        try:
+            answer = futures[question].result()
+        except Exception as e:
+            logging.error(f"Question failed for {filename}: {e}")
+            answers.append({"question": question, "status": "failed", **error_body(e)})
+            continue
+        if answer:
+            answers.append({"question": question, "status": "completed", "answer": answer})
+        else:
+            answers.append({"question": question, "status": "failed", "error": "Could not generate an answer."})
+
+    answered = sum(1 for entry in answers if entry["status"] == "completed")
+    return {
+        "filename": filename,
+        "answered": answered,
+        "failed": len(answers) - answered,
+        "answers": answers
+    }
+
+def save_batch_uploads() -> List[Tuple[str, str]]:
+    """Store the DOCX files of a batch request, unpacking ``zip_file`` if one was sent.
+
+    Returns the (filename, digest) of each stored upload. Raises ValueError, before
+    anything is stored, when the batch has too many files, two files share a name
+    (outputs are named after it) or the zip would unpack too large.
+    """
+    files = request.files.getlist('docx_files')
+    for file in files:
+        if file.filename == '' or not file.filename.endswith('.docx'):
+            raise ValueError(f"Invalid file '{file.filename}'. Please upload DOCX files.")
+
+    with contextlib.ExitStack() as stack:
+        members = []
+        zip_upload = request.files.get('zip_file')
+        if zip_upload is not None and zip_upload.filename:
+            archive = stack.enter_context(zipfile.ZipFile(zip_upload.stream))
+            for member in archive.infolist():
+                member_name = os.path.basename(member.filename)
+                if member.is_dir() or not member_name.endswith('.docx') or member_name.startswith(('.', '~$')):
+                    continue
+                members.append(member)
+
+        if len(files) + len(members) > BATCH_MAX_FILES:
+            raise ValueError(f"Too many files. A batch may contain at most {BATCH_MAX_FILES}.")
+        names = [os.path.basename(file.filename) for file in files]
+        names += [os.path.basename(member.filename) for member in members]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"File names must be unique within a batch: {', '.join(duplicates)}.")
+        # Sizes come from the zip directory; reads stop there, so a lying header cannot exceed them
+        for member in members:
+            if member.file_size > MAX_UPLOAD_MB * 1024 * 1024:
+                raise ValueError(f"'{member.filename}' unpacks to more than {MAX_UPLOAD_MB} MB.")
+        if sum(member.file_size for member in members) > BATCH_MAX_UNZIPPED_MB * 1024 * 1024:
+            raise ValueError(f"The zip file unpacks to more than {BATCH_MAX_UNZIPPED_MB} MB.")
+
+        uploads = []
+        for file in files:
+            docx_filename = os.path.basename(file.filename)
+            uploads.append((docx_filename, upload_store.save_stream(docx_filename, file.stream)))
+        for member in members:
+            member_name = os.path.basename(member.filename)
+            with archive.open(member) as source:
+                uploads.append((member_name, upload_store.save_stream(member_name, source)))
+
+    return uploads
+
+@app.route('/generate_minutes_batch', methods=['POST'])
+def generate_meeting_minutes_batch():
+    """Generate minutes for many transcripts at once.
+
+    Accepts several ``docx_files`` and/or a ``zip_file`` of DOCX transcripts and returns a
+    manifest with a per-file status. Pass ``async=true`` to run the batch as a job.
+    """
+    try:
+        output_format = request.form.get('output_format', 'pdf')
+        run_async = request.form.get('async', 'false').lower() in ('1', 'true', 'yes')
+
+        if output_format not in minutes_artifacts.writers:
+            return jsonify({"error": "Invalid output format. Choose 'pdf' or 'docx'."}), 400
+
+        if len(request.files.getlist('docx_files')) > BATCH_MAX_FILES:
+            return jsonify({"error": f"Too many files. A batch may contain at most {BATCH_MAX_FILES}."}), 400
+
+        try:
+            uploads = save_batch_uploads()
+        except (ValueError, zipfile.BadZipFile) as e:
+            return jsonify({"error": str(e)}), 400
+
+        if not uploads:
+            return jsonify({"error": "No DOCX files uploaded."}), 400
+
+        if run_async:
+            try:
+                job = job_queue.submit(
+                    run_minutes_batch, uploads, output_format,
+                    description={"docx_files": [name for name, _ in uploads], "output_format": output_format}
+                )
+            except QueueFullError as e:
+                return retry_later(str(e), QUEUE_RETRY_AFTER)
+            return jsonify({
+                "message": "Batch minutes generation queued",
+                "job_id": job.job_id,
+                "status_url": f"/jobs/{job.job_id}",
+                "result_url": f"/jobs/{job.job_id}/result"
+            }), 202
+
+        return jsonify(run_minutes_batch(uploads, output_format)), 200
+
+    except RequestEntityTooLarge:
+        raise
+
+    except Exception as e:
+        logging.error(f"Error in generate_meeting_minutes_batch: {e}")
+        return jsonify({"error": str(e)}), 500
+
 @app.route('/generate_minutes', methods=['POST'])
 def generate_meeting_minutes():
-    """Generate meeting minutes from uploaded DOCX file with LLM fallback."""
+    """Generate meeting minutes from uploaded DOCX file with LLM fallback.
+
+    Pass ``async=true`` to queue the work and receive a job id to poll via /jobs/<job_id>.
+    """
     try:
         if 'docx_file' not in request.files:
             return jsonify({"error": "No DOCX file uploaded."}), 400
 
         file = request.files['docx_file']
         output_format = request.form.get('output_format', 'pdf')  # Default to PDF if not specified
+        run_async = request.form.get('async', 'false').lower() in ('1', 'true', 'yes')
         
         if file.filename == '' or not file.filename.endswith('.docx'):
             return jsonify({"error": "Invalid file. Please upload a DOCX file."}), 400
 
-        docx_path = os.path.join(app.config['UPLOAD_FOLDER'], file.filename)
-        base_filename = os.path.splitext(file.filename)[0]
-        
-        # Determine output file extension and path
-        if output_format == 'pdf':
-            output_path = os.path.join(app.config['OUTPUT_FOLDER'], f"{base_filename}.pdf")
-            generate_func = write_minutes_to_pdf
-        elif output_format == 'docx':
-            output_path = os.path.join(app.config['OUTPUT_FOLDER'], f"{base_filename}_minutes.docx")
-            generate_func = write_minutes_to_docx
-        else:
+        if output_format not in minutes_artifacts.writers:
             return jsonify({"error": "Invalid output format. Choose 'pdf' or 'docx'."}), 400
 
-        file.save(docx_path)
-        transcript = extract_text_from_docx(docx_path)
-        meeting_minutes = generate_comprehensive_minutes(transcript)
-        generate_func(meeting_minutes, output_path)
+        docx_filename = os.path.basename(file.filename)
+
+        if run_async:
+            # Store the upload before queueing, whatever UPLOAD_PERSIST says: a queued job
+            # then holds only its digest, and the upload is not lost with the process
+            digest = upload_store.save_stream(docx_filename, file.stream)
+            try:
+                job = job_queue.submit(
+                    run_minutes_pipeline, docx_filename, output_format, digest=digest,
+                    description={"docx_file": docx_filename, "output_format": output_format}
+                )
+            except QueueFullError as e:
+                return retry_later(str(e), QUEUE_RETRY_AFTER)
+            return jsonify({
+                "message": "Meeting minutes generation queued",
+                "job_id": job.job_id,
+                "status_url": f"/jobs/{job.job_id}",
+                "result_url": f"/jobs/{job.job_id}/result"
+            }), 202
+
+        return jsonify(run_minutes_pipeline(docx_filename, output_format, file.read()))
+
+    except RequestEntityTooLarge:
+        raise
 
-        return jsonify({
-            "message": f"{output_format.upper()} generated successfully",
-            "filename": os.path.basename(output_path),
-            "docx_file": file.filename,
-            "fullPath": output_path
-        })
+    except LLMRetryLaterError as e:
+        return retry_later(str(e), e.retry_after)
+
+    except (LLMResponseError, requests.exceptions.RequestException) as e:
+        logging.error(f"LLM failure in generate_meeting_minutes: {e}")
+        return jsonify({"error": f"LLM service failed: {e}"}), 502
 
     except Exception as e:
         logging.error(f"Error in generate_meeting_minutes: {e}")
         return jsonify({"error": str(e)}), 500
 
+def _wait_seconds() -> float:
+    """Read the optional ``wait`` query parameter used for long-polling."""
+    try:
+        wait = float(request.args.get('wait', 0))
+    except ValueError:
+        wait = 0
+    return max(0.0, min(wait, JOB_MAX_WAIT))
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id: str):
+    """Report the status of a queued minutes generation job."""
+    job = job_queue.get(job_id, wait=_wait_seconds())
+    if job is None:
+        return jsonify({"error": f"Job not found: {job_id}"}), 404
+    return jsonify(job.to_dict()), 200
+
+@app.route('/jobs/<job_id>/result', methods=['GET'])
+def job_result(job_id: str):
+    """Return the result of a finished job. Supports long-polling with ``?wait=<seconds>``."""
+    job = job_queue.get(job_id, wait=_wait_seconds())
+    if job is None:
+        return jsonify({"error": f"Job not found: {job_id}"}), 404
+
+    if job.status == 'completed':
+        return jsonify(job.result), 200
+    if job.status == 'failed':
+        return jsonify({"error": job.error, "job_id": job_id}), 500
+    return jsonify(job.to_dict()), 202
+
+def sse_event(data: Dict[str, Any], event: Optional[str] = None) -> str:
+    """Format one server-sent event with a JSON payload."""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
+
+def sse_response(events: Iterator[str]) -> Response:
+    return Response(
+        stream_with_context(events),
+        mimetype='text/event-stream',
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.route('/generate_minutes_stream', methods=['POST'])
+def generate_meeting_minutes_stream():
+    """Generate meeting minutes and relay the LLM output as server-sent events.
+
+    Emits ``data: {"token": ...}`` events while the minutes are generated, then renders
+    the requested format and finishes with an ``event: done`` carrying the file details.
+    """
+    if 'docx_file' not in request.files:
+        return jsonify({"error": "No DOCX file uploaded."}), 400
+
+    file = request.files['docx_file']
+    output_format = request.form.get('output_format', 'pdf')
+
+    if file.filename == '' or not file.filename.endswith('.docx'):
+        return jsonify({"error": "Invalid file. Please upload a DOCX file."}), 400
+
+    if output_format not in minutes_artifacts.writers:
+        return jsonify({"error": "Invalid output format. Choose 'pdf' or 'docx'."}), 400
+    docx_filename = os.path.basename(file.filename)
+    base_filename = os.path.splitext(docx_filename)[0]
+    upload = file.read()
+
+    def events():
+        try:
+            transcript = load_upload(docx_filename, upload)
+
+            parts = []
+            for delta in stream_comprehensive_minutes(transcript):
+                parts.append(delta)
+                yield sse_event({"token": delta})
+
+            meeting_minutes = ''.join(parts)
+            store_minutes(base_filename, meeting_minutes)
+            minutes_artifacts.render(base_filename, output_format, meeting_minutes)
+            yield sse_event(minutes_result(docx_filename, output_format, rendered=True), event='done')
+
+        except Exception as e:
+            logging.error(f"Error in generate_meeting_minutes_stream: {e}")
+            yield sse_event(error_body(e), event='error')
+
+    return sse_response(events())
+
 @app.route('/ask_question', methods=['POST'])
 def ask_question():
-    """Enhanced question-answering endpoint."""
+    """Enhanced question-answering endpoint.
+
+    Only the transcript passages most relevant to the question are sent to the LLM
+    unless ``full_context`` is true.
+    """
     try:
         data = request.get_json()
         question = data.get('question')
         filename = data.get('filename')
+        full_context = bool(data.get('full_context', QA_FULL_CONTEXT))
 
         if not question or not filename:
             return jsonify({"error": "Question and filename are required."}), 400
@@ -322,35 +1143,266 @@ def ask_question():
             return jsonify({"error": "Could not extract text from the file."}), 400
 
         # Get answer from LLM
-        answer = qa_handler._call_llm_service(transcript, question)
+        context = qa_handler._select_context(filename, transcript, question, full_context)
+        answer = qa_handler._call_llm_service(context, question)
         
         if not answer:
             return jsonify({"error": "Could not generate an answer."}), 500
 
         return jsonify({"answer": answer}), 200
 
+    except LLMRetryLaterError as e:
+        return retry_later(str(e), e.retry_after)
+
     except Exception as e:
         logging.error(f"Error in ask_question: {e}")
         return jsonify({"error": str(e)}), 500
 
+@app.route('/ask_questions', methods=['POST'])
+def ask_questions():
+    """Answer a list of questions about one transcript in a single request.
+
+    Questions are answered concurrently against one extracted transcript and each gets
+    a per-question status, so one failed answer does not fail the others.
+    """
+    try:
+        data = request.get_json()
+        questions = data.get('questions')
+        filename = data.get('filename')
+        full_context = bool(data.get('full_context', QA_FULL_CONTEXT))
+
+        if not filename or not isinstance(questions, list) or not questions:
+            return jsonify({"error": "A filename and a non-empty list of questions are required."}), 400
+
+        if not all(isinstance(question, str) and question.strip() for question in questions):
+            return jsonify({"error": "Every question must be a non-empty string."}), 400
+
+        if len(questions) > QA_BATCH_MAX_QUESTIONS:
+            return jsonify({"error": f"Too many questions. At most {QA_BATCH_MAX_QUESTIONS} may be asked at once."}), 400
+
+        transcript = qa_handler._extract_text_from_file(filename)
+        if not transcript:
+            return jsonify({"error": "Could not extract text from the file."}), 400
+
+        result = answer_questions(filename, transcript, questions, full_context)
+        busy = [entry["retry_after"] for entry in result["answers"] if "retry_after" in entry]
+        if len(busy) == len(result["answers"]):
+            # Every question was turned away by admission control; nothing was answered
+            return retry_later("LLM is busy. Retry later.", max(busy))
+        return jsonify(result), 200
+
+    except Exception as e:
+        logging.error(f"Error in ask_questions: {e}")
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/ask_question_stream', methods=['POST'])
+def ask_question_stream():
+    """Answer a question about a transcript, relaying the answer as server-sent events."""
+    data = request.get_json()
+    question = data.get('question')
+    filename = data.get('filename')
+    full_context = bool(data.get('full_context', QA_FULL_CONTEXT))
+
+    if not question or not filename:
+        return jsonify({"error": "Question and filename are required."}), 400
+
+    transcript = qa_handler._extract_text_from_file(filename)
+    if not transcript:
+        return jsonify({"error": "Could not extract text from the file."}), 400
+
+    context = qa_handler._select_context(filename, transcript, question, full_context)
+
+    def events():
+        try:
+            for delta in qa_handler._stream_llm_service(context, question):
+                yield sse_event({"token": delta})
+            yield sse_event({"filename": filename}, event='done')
+        except Exception as e:
+            logging.error(f"Error in ask_question_stream: {e}")
+            yield sse_event(error_body(e), event='error')
+
+    return sse_response(events())
+
+def live_segments(data: Dict[str, Any]) -> List[str]:
+    """Transcript segments from a request: ``text`` or ``segments`` of strings or {speaker, text} objects."""
+    items = data.get('segments')
+    if items is None:
+        items = [{"speaker": data.get('speaker'), "text": data.get('text')}]
+    if not isinstance(items, list):
+        raise ValueError("segments must be a list.")
+
+    segments = []
+    for item in items:
+        if isinstance(item, str):
+            item = {"text": item}
+        if not isinstance(item, dict) or not isinstance(item.get('text'), str):
+            raise ValueError("Each segment needs a text string.")
+        text = item['text'].strip()
+        if text:
+            speaker = item.get('speaker')
+            segments.append(f"{speaker}: {text}" if speaker else text)
+    if not segments:
+        raise ValueError("No transcript text provided.")
+    return segments
+
+@app.route('/live_sessions', methods=['POST'])
+def create_live_session():
+    """Start a live meeting session that transcript segments can be appended to."""
+    data = request.get_json(silent=True) or {}
+    session = live_sessions.create(data.get('title'))
+    return jsonify({
+        **session.status(),
+        "segments_url": f"/live_sessions/{session.session_id}/segments",
+        "finalize_url": f"/live_sessions/{session.session_id}/finalize"
+    }), 201
+
+@app.route('/live_sessions/<session_id>/segments', methods=['POST'])
+def append_live_segments(session_id: str):
+    """Append transcript segments; the draft minutes are updated in the background."""
+    try:
+        segments = live_segments(request.get_json(silent=True) or {})
+        session = live_sessions.append(session_id, segments)
+        return jsonify(session.status()), 202
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    except SessionNotFoundError:
+        return jsonify({"error": "Live session not found."}), 404
+
+    except SessionFinalizedError as e:
+        return jsonify({"error": str(e)}), 409
+
+    except SessionConflictError as e:
+        return retry_later(str(e), 1)
+
+@app.route('/live_sessions/<session_id>', methods=['GET'])
+def live_session_draft(session_id: str):
+    """Current draft minutes of a live session (?refresh=true to fold pending segments first)."""
+    try:
+        if request.args.get('refresh', 'false').lower() in ('1', 'true', 'yes'):
+            session = live_sessions.refresh(session_id)
+        else:
+            session = live_sessions.get(session_id)
+        return jsonify({**session.status(), "draft_minutes": session.summary}), 200
+
+    except SessionNotFoundError:
+        return jsonify({"error": "Live session not found."}), 404
+
+    except LLMRetryLaterError as e:
+        return retry_later(str(e), e.retry_after)
+
+    except SessionConflictError as e:
+        return retry_later(str(e), 1)
+
+    except Exception as e:
+        logging.error(f"Error refreshing live session {session_id}: {e}")
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/live_sessions/<session_id>/finalize', methods=['POST'])
+def finalize_live_session(session_id: str):
+    """Fold the remaining segments, close the session and store its minutes for download."""
+    try:
+        data = request.get_json(silent=True) or {}
+        output_format = data.get('output_format', 'pdf')
+        if output_format not in minutes_artifacts.writers:
+            return jsonify({"error": "Invalid output format. Choose 'pdf' or 'docx'."}), 400
+
+        session = live_sessions.finalize(session_id)
+        if not session.summary:
+            return jsonify({"error": "No transcript was appended to this session."}), 400
+
+        base_filename = f"live_{session_id}"
+        store_minutes(base_filename, session.summary)
+        if not LAZY_RENDER:
+            minutes_artifacts.render(base_filename, output_format, session.summary)
+
+        result = minutes_result(base_filename, output_format, rendered=not LAZY_RENDER)
+        result.pop("docx_file")
+        return jsonify({**result, "session": session.status()}), 200
+
+    except SessionNotFoundError:
+        return jsonify({"error": "Live session not found."}), 404
+
+    except LLMRetryLaterError as e:
+        return retry_later(str(e), e.retry_after)
+
+    except SessionConflictError as e:
+        return retry_later(str(e), 1)
+
+    except Exception as e:
+        logging.error(f"Error finalizing live session {session_id}: {e}")
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/search', methods=['GET'])
+def search_minutes():
+    """Full-text search across all generated minutes, without calling the LLM.
+
+    ``q`` is matched against the minutes text; ``attendee``, ``category``, ``date_from``
+    and ``date_to`` (YYYY-MM-DD) narrow the results.
+    """
+    query = request.args.get('q', '').strip()
+    attendee = request.args.get('attendee', '').strip() or None
+    category = request.args.get('category', '').strip() or None
+    date_from = request.args.get('date_from') or None
+    date_to = request.args.get('date_to') or None
+
+    if not (query or attendee or category or date_from or date_to):
+        return jsonify({"error": "Provide q or at least one of attendee, category, date_from and date_to."}), 400
+
+    try:
+        limit = min(int(request.args.get('limit', 20)), SEARCH_MAX_RESULTS)
+        for value in (date_from, date_to):
+            if value:
+                datetime.date.fromisoformat(value)
+    except ValueError:
+        return jsonify({"error": "limit must be an integer and dates must be YYYY-MM-DD."}), 400
+
+    start = time.perf_counter()
+    try:
+        results = search_index.search(query, attendee, category, date_from, date_to, max(limit, 1))
+    except Exception as e:
+        logging.error(f"Error in search_minutes: {e}")
+        return jsonify({"error": str(e)}), 500
+
+    for result in results:
+        result["minutes_file"] = minutes_artifacts.minutes_name(result["meeting_id"])
+        result["formats"] = {
+            fmt: minutes_artifacts.output_name(result["meeting_id"], fmt) for fmt in minutes_artifacts.writers
+        }
+    return jsonify({
+        "query": query,
+        "count": len(results),
+        "took_ms": round((time.perf_counter() - start) * 1000, 2),
+        "results": results
+    }), 200
+
 @app.route('/download_file/<filename>', methods=['GET'])
 def download_file(filename: str):
-    """Download generated PDF or DOCX file."""
-    try:
-        file_path = os.path.join(app.config['OUTPUT_FOLDER'], filename)
-        if not os.path.exists(file_path):
-            return jsonify({"error": f"File not found: {filename}"}), 404
+    """Download generated PDF, DOCX or markdown minutes.
 
+    PDF and DOCX files are rendered from the stored minutes on first request.
+    """
+    try:
         # Determine MIME type based on file extension
         if filename.lower().endswith('.pdf'):
             mimetype = 'application/pdf'
         elif filename.lower().endswith('.docx'):
             mimetype = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+        elif filename.lower().endswith(MinutesArtifacts.MINUTES_SUFFIX):
+            mimetype = 'text/markdown'
         else:
             return jsonify({"error": "Unsupported file type"}), 400
 
+        key = filename
+        if mimetype != 'text/markdown':
+            key = minutes_artifacts.ensure_rendered(filename) or key
+        if output_storage.stat(key) is None:
+            return jsonify({"error": f"File not found: {filename}"}), 404
+
+        # Local files are sent from disk; object store bodies are streamed through
         return send_file(
-            file_path,
+            output_storage.local_path(key) or output_storage.open(key),
             mimetype=mimetype,
             as_attachment=True,
             download_name=filename
@@ -358,6 +1410,73 @@ def download_file(filename: str):
     except Exception as e:
         logging.error(f"Error in download_file: {e}")
         return jsonify({"error": str(e)}), 500
+
+@app.errorhandler(RequestEntityTooLarge)
+def upload_too_large(e):
+    return jsonify({"error": f"Upload too large. The maximum size is {MAX_UPLOAD_MB} MB."}), 413
+
+@app.before_request
+def start_request_metrics():
+    g.request_start = time.perf_counter()
+    HTTP_REQUESTS_IN_FLIGHT.inc()
+
+@app.after_request
+def record_request_metrics(response):
+    # Label by route pattern, not raw path, to keep cardinality bounded
+    endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+    HTTP_REQUEST_SECONDS.labels(endpoint, request.method, str(response.status_code)).observe(
+        time.perf_counter() - g.request_start
+    )
+    return response
+
+@app.teardown_request
+def finish_request_metrics(exc):
+    if 'request_start' in g:
+        HTTP_REQUESTS_IN_FLIGHT.dec()
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus metrics: stage latency, LLM usage and failover, in-flight requests and queue depth."""
+    registry = REGISTRY
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        # Under gunicorn, aggregate every worker's metrics, not just this one's
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return Response(generate_latest(registry), mimetype=CONTENT_TYPE_LATEST)
+
+@app.route('/healthz', methods=['GET'])
+def healthz():
+    """Liveness: the process is up and serving requests."""
+    return jsonify({"status": "ok"}), 200
+
+@app.route('/readyz', methods=['GET'])
+def readyz():
+    """Readiness: accepting new work, i.e. not draining and storage is writable."""
+    if draining.is_set():
+        return jsonify({"status": "draining", "jobs_pending": job_queue.depth}), 503
+    for area, storage in (("uploads", upload_storage), ("output", output_storage)):
+        if not storage.writable():
+            return jsonify({"status": "unavailable", "error": f"{area} storage is not writable"}), 503
+    return jsonify({"status": "ready", "jobs_pending": job_queue.depth}), 200
+
+@app.route('/llm_status', methods=['GET'])
+def llm_status():
+    """Report LLM client call counts and latency, scheduler queues and the circuit state of each endpoint."""
+    return jsonify({
+        "client": llm_client.stats(),
+        "scheduler": llm_scheduler.stats(),
+        "failover": llm_failover.snapshot()
+    }), 200
+
+@app.route('/cache_stats', methods=['GET'])
+def cache_stats():
+    """Report cache hit/miss counts and how many duplicate in-flight LLM calls were coalesced."""
+    return jsonify({
+        "minutes": minutes_cache.stats(),
+        "transcripts": transcript_cache.stats(),
+        "coalescing": {"minutes": minutes_flight.stats(), "qa": qa_flight.stats()}
+    }), 200
+
 @app.route('/')
 def index():
     """
@@ -369,11 +1488,28 @@ def index():
         "service": "Meeting Minutes Generation API",
         "version": "1.0.0",
         "endpoints": {
-            "/generate_minutes": "POST - Generate meeting minutes from DOCX file",
-            "/ask_question": "POST - Ask questions about a meeting transcript",
-            "/download_file/<filename>": "GET - Download generated minutes"
+            "/generate_minutes": "POST - Generate meeting minutes from DOCX file (async=true to queue a job)",
+            "/jobs/<job_id>": "GET - Status of a queued minutes generation job",
+            "/jobs/<job_id>/result": "GET - Result of a queued job (?wait=<seconds> to long-poll)",
+            "/generate_minutes_batch": "POST - Generate minutes for several DOCX files or a zip archive",
+            "/generate_minutes_stream": "POST - Generate meeting minutes, streaming progress as server-sent events",
+            "/ask_question": "POST - Ask questions about a meeting transcript (full_context=true to skip retrieval)",
+            "/ask_questions": "POST - Ask several questions about one transcript, answered concurrently",
+            "/ask_question_stream": "POST - Ask a question, streaming the answer as server-sent events",
+            "/live_sessions": "POST - Start a live meeting session with rolling draft minutes",
+            "/live_sessions/<session_id>/segments": "POST - Append transcript segments to a live session",
+            "/live_sessions/<session_id>": "GET - Draft minutes of a live session (?refresh=true to include pending)",
+            "/live_sessions/<session_id>/finalize": "POST - Finalize a live session and store its minutes",
+            "/search": "GET - Search all generated minutes (?q=, attendee, category, date_from, date_to)",
+            "/download_file/<filename>": "GET - Download generated minutes (PDF/DOCX rendered on first request)",
+            "/llm_status": "GET - LLM client call counts, latency, scheduler queues and circuit breaker state",
+            "/cache_stats": "GET - Minutes and transcript cache hit/miss counts and coalesced LLM calls",
+            "/metrics": "GET - Prometheus metrics",
+            "/healthz": "GET - Liveness probe",
+            "/readyz": "GET - Readiness probe (503 while draining on shutdown)"
         }
     }), 200
 if __name__ == '__main__':
+    # Development server only; production runs under gunicorn (see gunicorn.conf.py)
     # Use environment variable for port, with fallback to 5000
     app.run(host='0.0.0.0', port=PORT, debug=True)
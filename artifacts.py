@@ -0,0 +1,101 @@
+import os
+import logging
+import tempfile
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+from storage import Storage
+
+Writer = Callable[[str, str], None]
+
+# Renders of the same file are serialized through a fixed set of locks, so request
+# filenames (including ones that do not exist) cannot grow a per-file lock table
+LOCK_STRIPES = 64
+
+
+class MinutesArtifacts:
+    """Canonical markdown minutes and the PDF/DOCX renditions derived from them.
+
+    Generation stores ``<base>.md`` once; renditions are rendered from it the first
+    time they are requested and kept until the markdown changes. Everything lives in
+    ``storage`` under its download filename, so any replica can serve or render it.
+    """
+
+    MINUTES_SUFFIX = '.md'
+
+    def __init__(self, storage: Storage, writers: Dict[str, Tuple[str, Writer]]):
+        # writers maps an output format to (filename suffix, writer function)
+        self.storage = storage
+        self.writers = writers
+        self._locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+    def output_name(self, base_filename: str, output_format: str) -> Optional[str]:
+        if output_format not in self.writers:
+            return None
+        return f"{base_filename}{self.writers[output_format][0]}"
+
+    def minutes_name(self, base_filename: str) -> str:
+        return f"{base_filename}{self.MINUTES_SUFFIX}"
+
+    def parse_output_name(self, filename: str) -> Optional[Tuple[str, str]]:
+        """Map a rendition filename back to its (base filename, output format)."""
+        # Longest suffix first so '_minutes.docx' wins over a bare '.docx'
+        for output_format, (suffix, _) in sorted(self.writers.items(), key=lambda item: -len(item[1][0])):
+            if filename.endswith(suffix) and len(filename) > len(suffix):
+                return filename[:-len(suffix)], output_format
+        return None
+
+    def save_minutes(self, base_filename: str, meeting_minutes: str) -> str:
+        """Persist the canonical markdown minutes and return their storage key."""
+        key = self.minutes_name(base_filename)
+        self.storage.write(key, meeting_minutes.encode('utf-8'))
+        return key
+
+    def load_minutes(self, base_filename: str) -> Optional[str]:
+        try:
+            return self.storage.read(self.minutes_name(base_filename)).decode('utf-8')
+        except FileNotFoundError:
+            return None
+
+    def render(self, base_filename: str, output_format: str, meeting_minutes: Optional[str] = None) -> str:
+        """Render one format now, from ``meeting_minutes`` or the stored markdown; returns its key."""
+        suffix, writer = self.writers[output_format]
+        key = f"{base_filename}{suffix}"
+        if meeting_minutes is None:
+            meeting_minutes = self.load_minutes(base_filename)
+            if meeting_minutes is None:
+                raise FileNotFoundError(f"No minutes stored for {base_filename}")
+
+        # Writers need a real file; render to a temp file and stream it into storage
+        fd, tmp_path = tempfile.mkstemp(suffix=os.path.splitext(suffix)[1])
+        os.close(fd)
+        try:
+            writer(meeting_minutes, tmp_path)
+            with open(tmp_path, 'rb') as f:
+                self.storage.write(key, f)
+        finally:
+            os.remove(tmp_path)
+        return key
+
+    def ensure_rendered(self, filename: str) -> Optional[str]:
+        """Return the storage key of a rendition, rendering it from stored minutes if needed.
+
+        Returns None when ``filename`` is not a known rendition or no minutes exist.
+        """
+        parsed = self.parse_output_name(filename)
+        if parsed is None:
+            return None
+        base_filename, output_format = parsed
+
+        with self._lock_for(filename):
+            minutes = self.storage.stat(self.minutes_name(base_filename))
+            rendition = self.storage.stat(filename)
+            if minutes is None:
+                return filename if rendition is not None else None
+            if rendition is not None and rendition.modified >= minutes.modified:
+                return filename
+            logging.info(f"Rendering {filename} on demand")
+            return self.render(base_filename, output_format)
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        return self._locks[hash(key) % len(self._locks)]
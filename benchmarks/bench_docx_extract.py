@@ -0,0 +1,113 @@
+"""Compare peak RSS and throughput of the streaming DOCX extractor against python-docx.
+
+Usage:
+    python benchmarks/bench_docx_extract.py [--paragraphs 2000 20000 100000] [--images 20]
+
+Each extractor runs in a fresh subprocess so its peak RSS is not polluted by the other
+one or by document generation. On Linux the peak is VmHWM, because ru_maxrss carries the
+parent's high-water mark across fork.
+"""
+import os
+import sys
+import json
+import zlib
+import random
+import struct
+import argparse
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+RUNNER = r'''
+import sys, time, json, resource
+sys.path.insert(0, sys.argv[1])
+from docx import Document
+from docx_stream import extract_docx_text
+
+def peak_kb():
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+baseline = peak_kb()
+start = time.perf_counter()
+if sys.argv[2] == 'stream':
+    text = extract_docx_text(sys.argv[3])
+else:
+    text = '\n'.join(p.text for p in Document(sys.argv[3]).paragraphs)
+elapsed = time.perf_counter() - start
+peak = peak_kb()
+print(json.dumps({"seconds": elapsed, "peak_kb": peak, "delta_kb": peak - baseline, "chars": len(text)}))
+'''
+
+
+def noise_png(path: str, size: int = 400, seed: int = 0) -> None:
+    """Write an incompressible RGB PNG so embedded images bulk up the package."""
+    rng = random.Random(seed)
+    rows = b''.join(b'\x00' + rng.randbytes(size * 3) for _ in range(size))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', size, size, 8, 2, 0, 0, 0)))
+        f.write(chunk(b'IDAT', zlib.compress(rows)))
+        f.write(chunk(b'IEND', b''))
+
+
+def synthetic_docx(path: str, paragraphs: int, images: int, workdir: str) -> None:
+    from docx import Document
+    from docx.shared import Inches
+
+    rng = random.Random(paragraphs)
+    speakers = ["Alice", "Bob", "Carmen", "Deepak"]
+    words = "budget roadmap hiring customer launch review security migration vendor target".split()
+    doc = Document()
+    image_every = paragraphs // images if images else 0
+    for i in range(paragraphs):
+        doc.add_paragraph(f"{rng.choice(speakers)}: " + ' '.join(rng.choice(words) for _ in range(25)))
+        if image_every and i % image_every == 0:
+            image_path = os.path.join(workdir, f'img{i}.png')
+            noise_png(image_path, seed=i)
+            doc.add_picture(image_path, width=Inches(2))
+    doc.save(path)
+
+
+def run(engine: str, path: str) -> dict:
+    output = subprocess.run([sys.executable, '-c', RUNNER, ROOT, engine, path],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--paragraphs', type=int, nargs='+', default=[2000, 20000, 100000])
+    parser.add_argument('--images', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'paragraphs':>10} {'docx MB':>8} {'engine':>11} {'seconds':>8} {'MB/s':>7} {'peak MB':>8} {'delta MB':>9}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for paragraphs in args.paragraphs:
+            path = os.path.join(workdir, f'transcript_{paragraphs}.docx')
+            synthetic_docx(path, paragraphs, args.images, workdir)
+            size_mb = os.path.getsize(path) / 1e6
+
+            results = {engine: run(engine, path) for engine in ('python-docx', 'stream')}
+            if results['stream']['chars'] != results['python-docx']['chars']:
+                print(f"warning: extractors disagree on {path}", file=sys.stderr)
+            for engine, result in results.items():
+                print(f"{paragraphs:>10} {size_mb:>8.1f} {engine:>11} {result['seconds']:>8.2f}"
+                      f" {size_mb / result['seconds']:>7.1f} {result['peak_kb'] / 1024:>8.1f}"
+                      f" {result['delta_kb'] / 1024:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
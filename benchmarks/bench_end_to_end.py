@@ -0,0 +1,234 @@
+"""End-to-end latency, throughput and memory of the API against the mock LLM.
+
+Usage:
+    python benchmarks/bench_end_to_end.py [--sizes 100 1000 5000] [--requests 8] [--concurrency 4]
+                                          [--server gunicorn|dev] [--llm-latency 0.2]
+                                          [--tokens-per-second 0] [--error-rate 0]
+
+For each transcript size (in speaker turns) synthetic DOCX transcripts are generated,
+then three stages are driven in order: /generate_minutes, /ask_question and
+/download_file (first download renders the PDF, the second serves it). Each stage
+reports p50/p95/p99 latency, throughput and the server's peak and added RSS, summed
+over the server's process group. The server's own per-stage histograms from
+/metrics are printed at the end.
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple
+
+import requests
+from docx import Document
+from prometheus_client.parser import text_string_to_metric_families
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mock_llm_server import MockLLMServer  # noqa: E402
+from bench_server_load import free_port, start_api, stop_api  # noqa: E402
+
+SPEAKERS = ["Alice", "Bob", "Carmen", "Deepak", "Erin", "Farid"]
+TOPICS = ["budget", "hiring", "roadmap", "security audit", "customer churn", "cloud migration"]
+QUESTIONS = ["What was decided about the budget?", "Who owns the security audit follow-up?",
+             "What are the next steps for the cloud migration?", "Which hiring decisions were made?"]
+
+
+def write_transcript(path: str, turns: int, seed: int) -> None:
+    rng = random.Random(seed)
+    doc = Document()
+    # A unique first line keeps every transcript a minutes cache miss
+    doc.add_paragraph(f"Meeting {seed} transcript")
+    for i in range(turns):
+        topic = rng.choice(TOPICS)
+        doc.add_paragraph(f"{rng.choice(SPEAKERS)}: On the {topic}, item {i} needs review. "
+                          f"We agreed to revisit the {topic} plan and its dependencies next week.")
+    doc.save(path)
+
+
+def group_rss_mb(pgid: int) -> float:
+    """Resident memory of every process in the group, in MB."""
+    total_kb = 0
+    for pid in filter(str.isdigit, os.listdir('/proc')):
+        try:
+            with open(f'/proc/{pid}/stat') as f:
+                fields = f.read().rsplit(')', 1)[1].split()
+            if int(fields[2]) != pgid:  # pgrp is the 5th field; the first two precede ')'
+                continue
+            with open(f'/proc/{pid}/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        total_kb += int(line.split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+    return total_kb / 1024
+
+
+class MemorySampler:
+    """Tracks peak process-group RSS while a stage runs."""
+
+    def __init__(self, pgid: int, interval: float = 0.05):
+        self.pgid = pgid
+        self.interval = interval
+        self.peak = 0.0
+        self._stop = threading.Event()
+
+    def __enter__(self) -> 'MemorySampler':
+        self.before = group_rss_mb(self.pgid)
+        self.peak = self.before
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, group_rss_mb(self.pgid))
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.after = group_rss_mb(self.pgid)
+        self.peak = max(self.peak, self.after)
+
+
+def run_stage(calls: List[Callable[[], requests.Response]], concurrency: int) -> Tuple[List[float], int, float]:
+    latencies, errors = [], 0
+    lock = threading.Lock()
+
+    def timed(call: Callable[[], requests.Response]) -> None:
+        nonlocal errors
+        start = time.perf_counter()
+        try:
+            ok = call().ok
+        except requests.RequestException:
+            ok = False
+        with lock:
+            if ok:
+                latencies.append(time.perf_counter() - start)
+            else:
+                errors += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(timed, calls))
+    return latencies, errors, time.perf_counter() - start
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] if ordered else float('nan')
+
+
+def report(size: int, stage: str, latencies: List[float], errors: int, elapsed: float,
+           memory: MemorySampler) -> None:
+    print(f"{size:>6} {stage:<16} {len(latencies):>4} {errors:>4} {len(latencies) / elapsed:>7.2f} "
+          f"{percentile(latencies, 50):>7.3f} {percentile(latencies, 95):>7.3f} {percentile(latencies, 99):>7.3f} "
+          f"{memory.peak:>8.1f} {memory.after - memory.before:>+8.1f}")
+
+
+def server_stage_histograms(base_url: str) -> Dict[str, Tuple[float, float]]:
+    """(count, total seconds) per stage from the server's meeting_minutes_stage_seconds histogram."""
+    stages: Dict[str, List[float]] = {}
+    text = requests.get(f"{base_url}/metrics", timeout=10).text
+    for family in text_string_to_metric_families(text):
+        if family.name != 'meeting_minutes_stage_seconds':
+            continue
+        for sample in family.samples:
+            totals = stages.setdefault(sample.labels['stage'], [0.0, 0.0])
+            if sample.name.endswith('_count'):
+                totals[0] += sample.value
+            elif sample.name.endswith('_sum'):
+                totals[1] += sample.value
+    return {stage: (count, total) for stage, (count, total) in stages.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 5000], help='Speaker turns per transcript')
+    parser.add_argument('--requests', type=int, default=8, help='Requests per stage and size')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--server', choices=['gunicorn', 'dev'], default='gunicorn')
+    parser.add_argument('--workers', type=int, default=2, help='Gunicorn worker processes')
+    parser.add_argument('--llm-latency', type=float, default=0.2)
+    parser.add_argument('--tokens-per-second', type=float, default=0.0)
+    parser.add_argument('--completion-tokens', type=int, default=600)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='bench-e2e-')
+    upload_folder, output_folder = os.path.join(workdir, 'upload'), os.path.join(workdir, 'output')
+    transcripts_folder = os.path.join(workdir, 'transcripts')
+    for folder in (upload_folder, output_folder, transcripts_folder):
+        os.makedirs(folder)
+
+    mock = MockLLMServer(latency=args.llm_latency, tokens_per_second=args.tokens_per_second,
+                         completion_tokens=args.completion_tokens, error_rate=args.error_rate, seed=1).start()
+    env = {**os.environ, "PRIMARY_LLM_URL": f"{mock.base_url}/chat/completions",
+           "BACKUP_LLM_URL": f"{mock.base_url}/completions", "PRIMARY_LLM_API_KEY": "bench",
+           "UPLOAD_FOLDER": upload_folder, "OUTPUT_FOLDER": output_folder,
+           "GUNICORN_WORKERS": str(args.workers), "GUNICORN_ACCESS_LOG": ""}
+    if args.server == 'gunicorn':
+        env["PROMETHEUS_MULTIPROC_DIR"] = os.path.join(workdir, 'metrics')
+    else:
+        env.pop("PROMETHEUS_MULTIPROC_DIR", None)
+
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    process = start_api(args.server, port, env)
+    print(f"{args.server} server, mock LLM latency {args.llm_latency}s, {args.requests} requests per stage, "
+          f"concurrency {args.concurrency}")
+    print(f"{'turns':>6} {'stage':<16} {'ok':>4} {'err':>4} {'req/s':>7} {'p50 s':>7} {'p95 s':>7} {'p99 s':>7} "
+          f"{'peak MB':>8} {'+MB':>8}")
+    try:
+        for size in args.sizes:
+            names = []
+            for i in range(args.requests):
+                name = f"meeting_{size}_{i}.docx"
+                write_transcript(os.path.join(transcripts_folder, name), size, seed=size * 1000 + i)
+                names.append(name)
+
+            def generate(name: str) -> Callable[[], requests.Response]:
+                def call() -> requests.Response:
+                    with open(os.path.join(transcripts_folder, name), 'rb') as f:
+                        return requests.post(f"{base_url}/generate_minutes", files={"docx_file": (name, f)},
+                                             data={"output_format": "pdf"}, timeout=600)
+                return call
+
+            def ask(name: str, question: str) -> Callable[[], requests.Response]:
+                return lambda: requests.post(f"{base_url}/ask_question",
+                                             json={"filename": name, "question": question}, timeout=300)
+
+            def download(name: str) -> Callable[[], requests.Response]:
+                pdf_name = os.path.splitext(name)[0] + '.pdf'
+                return lambda: requests.get(f"{base_url}/download_file/{pdf_name}", timeout=300)
+
+            stages = [
+                ("generate_minutes", [generate(name) for name in names]),
+                ("ask_question", [ask(name, QUESTIONS[i % len(QUESTIONS)]) for i, name in enumerate(names)]),
+                ("download (render)", [download(name) for name in names]),
+                ("download (cached)", [download(name) for name in names]),
+            ]
+            for stage, calls in stages:
+                with MemorySampler(process.pid) as memory:
+                    latencies, errors, elapsed = run_stage(calls, args.concurrency)
+                report(size, stage, latencies, errors, elapsed, memory)
+
+        print("\nserver-side stage timings (meeting_minutes_stage_seconds)")
+        print(f"{'stage':<12} {'count':>6} {'mean s':>8}")
+        for stage, (count, total) in sorted(server_stage_histograms(base_url).items()):
+            if count:
+                print(f"{stage:<12} {int(count):>6} {total / count:>8.3f}")
+        mock_stats = mock.stats()
+        print(f"\nmock LLM: {mock_stats['requests']} requests, {mock_stats['errors']} injected errors, "
+              f"max {mock_stats['max_in_flight']} in flight")
+    finally:
+        stop_api(process)
+        mock.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""Micro-benchmark of minutes PDF rendering: the single-pass renderer vs the legacy writer.
+
+Usage:
+    python benchmarks/bench_pdf_render.py [--pages 10 50 100] [--repeat 3]
+
+The legacy writer is reproduced here as it was before pdf_renderer existed: a re.split
+and set_font per fragment, and one multi_cell per bold/regular part.
+"""
+import os
+import re
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fpdf import FPDF  # noqa: E402
+from pdf_renderer import MinutesPDFRenderer, render_minutes_pdf  # noqa: E402
+
+
+def legacy_write_minutes_to_pdf(meeting_minutes: str, output_pdf_path: str) -> None:
+    pdf = FPDF()
+    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf.add_page()
+    pdf.set_font("Arial", size=12)
+    pdf.set_font("Arial", style='B', size=16)
+    pdf.cell(200, 10, txt="Meeting Minutes", ln=True, align="C")
+    pdf.ln(10)
+    pdf.set_font("Arial", size=14)
+    for line in meeting_minutes.split('\n'):
+        parts = re.split(r'(\*\*.*?\*\*)', line)
+        for part in parts:
+            if part.startswith('**') and part.endswith('**'):
+                pdf.set_font("Arial", style='B', size=14)
+                pdf.multi_cell(0, 10, part[2:-2])
+            else:
+                pdf.set_font("Arial", size=14)
+                if part.strip():
+                    pdf.multi_cell(0, 10, part)
+    pdf.output(output_pdf_path)
+
+
+def synthetic_minutes(sections: int, seed: int = 11) -> str:
+    rng = random.Random(seed)
+    words = ("budget roadmap hiring customer launch review security migration vendor target "
+             "decision follow-up owner timeline risk dependency").split()
+
+    def sentence(n: int = 18) -> str:
+        text = ' '.join(rng.choice(words) for _ in range(n))
+        return text.replace(rng.choice(words), f"**{rng.choice(words)}**", 1).capitalize() + '.'
+
+    lines = ["**Date:** 2024-09-12", "**Attendees:** Alice, Bob, Carmen, Deepak", ""]
+    for i in range(sections):
+        lines += [f"## Topic {i + 1}", "", f"**Category:** {rng.choice(words).title()}",
+                  ' '.join(sentence() for _ in range(4)), ""]
+        lines += [f"- {sentence(12)}" for _ in range(4)]
+        lines += ["", "**Action Items**", f"1. {sentence(8)}", f"2. {sentence(8)}", ""]
+    return '\n'.join(lines)
+
+
+def timed(render, minutes: str, path: str, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render(minutes, path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, nargs='+', default=[10, 50, 100])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    # Calibrate how many sections fill one page with the new renderer
+    sample = synthetic_minutes(20)
+    sections_per_page = 20 / MinutesPDFRenderer().render(sample).page_no()
+
+    print(f"{'pages':>6} {'engine':>8} {'seconds':>8} {'KB':>8} {'pdf pages':>10}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for pages in args.pages:
+            minutes = synthetic_minutes(max(1, round(pages * sections_per_page)))
+            for engine, render in (('legacy', legacy_write_minutes_to_pdf), ('single', render_minutes_pdf)):
+                path = os.path.join(workdir, f'{engine}_{pages}.pdf')
+                seconds = timed(render, minutes, path, args.repeat)
+                with open(path, 'rb') as f:
+                    page_count = f.read().count(b'/Type /Page\n')
+                print(f"{pages:>6} {engine:>8} {seconds:>8.3f} {os.path.getsize(path) / 1024:>8.1f} {page_count:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""Compare /ask_question prompt size and answer latency: full transcript vs top-k passages.
+
+Usage:
+    python benchmarks/bench_qa_retrieval.py [--turns 200 2000 10000] [--url URL --model MODEL]
+
+Without ``--url`` only prompt sizes and retrieval overhead are measured. With an
+OpenAI-compatible chat completions URL each question is also answered both ways.
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llm_client import LLMClient  # noqa: E402
+from retrieval import PassageIndex  # noqa: E402
+from summarizer import split_transcript  # noqa: E402
+
+SPEAKERS = ["Alice", "Bob", "Carmen", "Deepak", "Erin", "Farid"]
+TOPICS = ["budget", "hiring", "roadmap", "security audit", "customer churn", "cloud migration",
+          "quarterly targets", "vendor contract", "onboarding", "incident review"]
+QUESTIONS = ["What was decided about the budget?", "Who owns the security audit follow-up?",
+             "What are the next steps for the cloud migration?", "Was the vendor contract approved?"]
+
+
+def synthetic_transcript(turns: int, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    lines = []
+    for i in range(turns):
+        topic = rng.choice(TOPICS)
+        lines.append(
+            f"{rng.choice(SPEAKERS)}: On the {topic}, item {i} needs review. "
+            f"We agreed to revisit the {topic} plan and {rng.choice(TOPICS)} dependencies next week."
+        )
+    return '\n'.join(lines)
+
+
+def build_prompt(context: str, question: str) -> str:
+    return (f"Meeting Minutes:\n{context}\n\nQuestion: {question}\n\n"
+            "Provide a concise and direct answer based strictly on the meeting minutes.")
+
+
+def timed_answer(client: LLMClient, url: str, model: str, prompt: str) -> float:
+    payload = {"model": model, "messages": [{"role": "user", "content": prompt}]}
+    return client.post_json(url, payload, {"Content-Type": "application/json"}).latency
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--turns', type=int, nargs='+', default=[200, 2000, 10000])
+    parser.add_argument('--top-k', type=int, default=6)
+    parser.add_argument('--passage-chars', type=int, default=1200)
+    parser.add_argument('--url', help='OpenAI-compatible chat completions URL')
+    parser.add_argument('--model', default='benchmark-model')
+    args = parser.parse_args()
+
+    client = LLMClient(read_timeout=300) if args.url else None
+    print(f"{'turns':>7} {'full chars':>11} {'top-k chars':>12} {'build ms':>9} {'query ms':>9}"
+          f" {'full s':>8} {'top-k s':>8}")
+
+    for turns in args.turns:
+        transcript = synthetic_transcript(turns)
+
+        start = time.perf_counter()
+        index = PassageIndex.build(split_transcript(transcript, args.passage_chars))
+        build_ms = (time.perf_counter() - start) * 1000
+
+        query_times, retrieved_sizes, full_latencies, topk_latencies = [], [], [], []
+        for question in QUESTIONS:
+            start = time.perf_counter()
+            context = '\n...\n'.join(index.top_passages(question, args.top_k))
+            query_times.append((time.perf_counter() - start) * 1000)
+            retrieved_sizes.append(len(build_prompt(context, question)))
+
+            if client is not None:
+                full_latencies.append(timed_answer(client, args.url, args.model, build_prompt(transcript, question)))
+                topk_latencies.append(timed_answer(client, args.url, args.model, build_prompt(context, question)))
+
+        full_chars = len(build_prompt(transcript, QUESTIONS[0]))
+        full_s = f"{statistics.mean(full_latencies):8.3f}" if full_latencies else f"{'-':>8}"
+        topk_s = f"{statistics.mean(topk_latencies):8.3f}" if topk_latencies else f"{'-':>8}"
+        print(f"{turns:>7} {full_chars:>11} {int(statistics.mean(retrieved_sizes)):>12} {build_ms:>9.1f}"
+              f" {statistics.mean(query_times):>9.2f} {full_s} {topk_s}")
+
+
+if __name__ == '__main__':
+    main()
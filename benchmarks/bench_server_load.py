@@ -0,0 +1,135 @@
+"""Requests/sec of the API under the dev server vs gunicorn, against a slow mock LLM.
+
+Usage:
+    python benchmarks/bench_server_load.py [--llm-delay 1.0] [--concurrency 32] [--duration 20]
+                                           [--modes dev gunicorn]
+
+Each mode starts the API as a subprocess pointed at an in-process mock LLM
+(mock_llm_server.py) that takes ``--llm-delay`` seconds per completion, then ``--concurrency`` clients post
+/ask_question for ``--duration`` seconds. Questions are numbered so no two requests
+are identical.
+"""
+import os
+import sys
+import time
+import signal
+import socket
+import argparse
+import tempfile
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from docx import Document
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mock_llm_server import MockLLMServer  # noqa: E402
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_api(mode: str, port: int, env: dict) -> subprocess.Popen:
+    if mode == 'dev':
+        command = [sys.executable, 'MeetingNotesGeneratorAPI.py']
+    else:
+        command = [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'MeetingNotesGeneratorAPI:app']
+    process = subprocess.Popen(command, cwd=ROOT, env={**env, "FLASK_PORT": str(port)},
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            if requests.get(f"http://127.0.0.1:{port}/healthz", timeout=1).ok:
+                return process
+        except requests.RequestException:
+            time.sleep(0.2)
+    stop_api(process)
+    raise RuntimeError(f"{mode} server did not become healthy")
+
+
+def stop_api(process: subprocess.Popen) -> None:
+    # The dev server's reloader forks a child, so signal the whole process group
+    os.killpg(process.pid, signal.SIGTERM)
+    try:
+        process.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        os.killpg(process.pid, signal.SIGKILL)
+
+
+def run_load(port: int, filename: str, concurrency: int, duration: float):
+    url = f"http://127.0.0.1:{port}/ask_question"
+    deadline = time.time() + duration
+    latencies, errors = [], []
+    lock = threading.Lock()
+
+    def client(worker: int) -> None:
+        n = 0
+        while time.time() < deadline:
+            n += 1
+            start = time.perf_counter()
+            try:
+                # A fresh connection per request, as behind a load balancer, so accepts spread over workers
+                ok = requests.post(url, json={"filename": filename, "question": f"Question {worker}-{n}?"},
+                                   timeout=120).ok
+            except requests.RequestException:
+                ok = False
+            with lock:
+                (latencies if ok else errors).append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(client, range(concurrency)))
+    return latencies, errors, time.perf_counter() - start
+
+
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] if ordered else float('nan')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--llm-delay', type=float, default=1.0, help='Seconds the mock LLM takes per call')
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=20)
+    parser.add_argument('--modes', nargs='+', default=['dev', 'gunicorn'], choices=['dev', 'gunicorn'])
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='bench-load-')
+    upload_folder = os.path.join(workdir, 'upload')
+    output_folder = os.path.join(workdir, 'output')
+    os.makedirs(upload_folder)
+    os.makedirs(output_folder)
+    doc = Document()
+    doc.add_paragraph("Alice: The budget was approved for next quarter.")
+    doc.save(os.path.join(upload_folder, 'meeting.docx'))
+
+    mock = MockLLMServer(latency=args.llm_delay, completion_tokens=20).start()
+    env = {**os.environ, "PRIMARY_LLM_URL": f"{mock.base_url}/chat/completions", "PRIMARY_LLM_API_KEY": "bench",
+           "UPLOAD_FOLDER": upload_folder, "OUTPUT_FOLDER": output_folder,
+           "PROMETHEUS_MULTIPROC_DIR": os.path.join(workdir, 'metrics')}
+    print(f"mock LLM delay {args.llm_delay}s, {args.concurrency} clients, {args.duration}s per mode")
+    print(f"{'mode':>9} {'requests':>9} {'errors':>7} {'req/s':>7} {'p50 s':>7} {'p95 s':>7}")
+    for mode in args.modes:
+        if mode == 'dev':
+            mode_env = {k: v for k, v in env.items() if k != 'PROMETHEUS_MULTIPROC_DIR'}
+        else:
+            mode_env = env
+        port = free_port()
+        process = start_api(mode, port, mode_env)
+        try:
+            latencies, errors, elapsed = run_load(port, 'meeting.docx', args.concurrency, args.duration)
+        finally:
+            stop_api(process)
+        print(f"{mode:>9} {len(latencies):>9} {len(errors):>7} {len(latencies) / elapsed:>7.2f} "
+              f"{percentile(latencies, 50):>7.2f} {percentile(latencies, 95):>7.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+import posixpath
+import zipfile
+from typing import IO, Iterator, Union
+
+from lxml import etree
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+OFFICE_DOCUMENT_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+
+
+def _w(tag: str) -> str:
+    return f'{{{W_NS}}}{tag}'
+
+
+BODY = _w('body')
+PARAGRAPH = _w('p')
+RUN = _w('r')
+HYPERLINK = _w('hyperlink')
+TEXT = _w('t')
+BREAK = _w('br')
+BREAK_TYPE = _w('type')
+
+# Run children and their text equivalents, matching python-docx's Run.text
+_RUN_CONTENT = {
+    _w('tab'): '\t',
+    _w('ptab'): '\t',
+    _w('cr'): '\n',
+    _w('noBreakHyphen'): '-',
+}
+
+
+def _main_document_part(archive: zipfile.ZipFile) -> str:
+    """Locate the main document part, normally ``word/document.xml``."""
+    try:
+        rels = etree.fromstring(archive.read('_rels/.rels'))
+    except KeyError:
+        return 'word/document.xml'
+    for rel in rels.iter(f'{{{REL_NS}}}Relationship'):
+        if rel.get('Type') == OFFICE_DOCUMENT_REL:
+            return posixpath.normpath(rel.get('Target').lstrip('/'))
+    return 'word/document.xml'
+
+
+def iter_docx_paragraphs(source: Union[str, IO[bytes]]) -> Iterator[str]:
+    """Yield the text of each body paragraph of a DOCX without building its object model.
+
+    ``word/document.xml`` is stream-parsed straight out of the zip and every finished
+    body element is discarded, so memory stays flat regardless of document size.
+    Output matches ``[p.text for p in Document(source).paragraphs]``: top-level body
+    paragraphs only, including hyperlink text, with tabs and line breaks mapped to
+    ``\\t`` and ``\\n``.
+    """
+    with zipfile.ZipFile(source) as archive:
+        with archive.open(_main_document_part(archive)) as document_xml:
+            # Tags of the currently open ancestors: [document, body, p, (hyperlink,) r, ...]
+            stack = []
+            parts = []
+            for event, elem in etree.iterparse(document_xml, events=('start', 'end')):
+                if event == 'start':
+                    stack.append(elem.tag)
+                    continue
+
+                stack.pop()
+                depth = len(stack)
+                tag = elem.tag
+
+                if depth >= 4 and stack[1] == BODY and stack[2] == PARAGRAPH and stack[-1] == RUN and (
+                        depth == 4 or (depth == 5 and stack[3] == HYPERLINK)):
+                    if tag == TEXT:
+                        parts.append(elem.text or '')
+                    elif tag == BREAK:
+                        parts.append('\n' if elem.get(BREAK_TYPE, 'textWrapping') == 'textWrapping' else '')
+                    elif tag in _RUN_CONTENT:
+                        parts.append(_RUN_CONTENT[tag])
+
+                elif depth == 2 and stack[1] == BODY:
+                    # A direct child of the body is complete; drop it and anything before it
+                    if tag == PARAGRAPH:
+                        yield ''.join(parts)
+                    parts = []
+                    elem.clear(keep_tail=False)
+                    parent = elem.getparent()
+                    while elem.getprevious() is not None:
+                        del parent[0]
+
+
+def extract_docx_text(source: Union[str, IO[bytes]]) -> str:
+    """Extract the paragraph text of a DOCX, one paragraph per line."""
+    return '\n'.join(iter_docx_paragraphs(source))
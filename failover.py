@@ -0,0 +1,297 @@
+import time
+import logging
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Tuple, Type
+
+from metrics import LLM_CIRCUIT_STATE, LLM_FAILOVER_CALLS
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is refused because the endpoint's circuit is open."""
+
+
+class CircuitBreaker:
+    """Per-endpoint circuit breaker driven by error rate and slow-call rate.
+
+    Outcomes of the last ``window_size`` calls are kept. Once at least ``min_calls``
+    are recorded, the circuit opens when the error rate or the rate of calls slower
+    than ``slow_call_seconds`` crosses its threshold. After ``open_seconds`` it lets up
+    to ``half_open_probes`` probe calls through; a successful probe closes the circuit
+    and a failed one re-opens it.
+    """
+
+    def __init__(self, name: str, window_size: int = 20, min_calls: int = 5,
+                 error_rate_threshold: float = 0.5, slow_call_seconds: float = 60.0,
+                 slow_call_rate_threshold: float = 0.8, open_seconds: float = 30.0,
+                 half_open_probes: int = 1):
+        self.name = name
+        self.min_calls = min_calls
+        self.error_rate_threshold = error_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+        self._set_state(CLOSED)
+        # (failed, slow) per call
+        self._outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._times_opened = 0
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self.open_seconds:
+                    return False
+                self._set_state(HALF_OPEN)
+                self._probes_in_flight = 0
+                logging.info(f"Circuit for {self.name} is half-open, probing")
+            if self.state == HALF_OPEN:
+                if self._probes_in_flight >= self.half_open_probes:
+                    return False
+                self._probes_in_flight += 1
+            return True
+
+    def record_success(self, latency: float) -> None:
+        slow = latency >= self.slow_call_seconds
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                if slow:
+                    self._open()
+                else:
+                    self._set_state(CLOSED)
+                    self._outcomes.clear()
+                    logging.info(f"Circuit for {self.name} closed")
+                return
+            self._outcomes.append((False, slow))
+            self._evaluate()
+
+    def record_failure(self, latency: float) -> None:
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                self._open()
+                return
+            self._outcomes.append((True, latency >= self.slow_call_seconds))
+            self._evaluate()
+
+    def release(self) -> None:
+        """Give back a half-open probe for a call that never reached the endpoint."""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def _evaluate(self) -> None:
+        """Open the circuit if the window breaches a threshold. Caller must hold the lock."""
+        calls = len(self._outcomes)
+        if self.state != CLOSED or calls < self.min_calls:
+            return
+        error_rate = sum(failed for failed, _ in self._outcomes) / calls
+        slow_rate = sum(slow for _, slow in self._outcomes) / calls
+        if error_rate >= self.error_rate_threshold or slow_rate >= self.slow_call_rate_threshold:
+            self._open()
+
+    def _set_state(self, state: str) -> None:
+        self.state = state
+        LLM_CIRCUIT_STATE.labels(self.name).set(_STATE_VALUES[state])
+
+    def _open(self) -> None:
+        self._set_state(OPEN)
+        self._opened_at = time.monotonic()
+        self._times_opened += 1
+        self._outcomes.clear()
+        logging.warning(f"Circuit for {self.name} opened for {self.open_seconds}s")
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            calls = len(self._outcomes)
+            return {
+                "state": self.state,
+                "window_calls": calls,
+                "error_rate": sum(f for f, _ in self._outcomes) / calls if calls else 0.0,
+                "slow_call_rate": sum(s for _, s in self._outcomes) / calls if calls else 0.0,
+                "times_opened": self._times_opened,
+                "open_remaining": max(0.0, self.open_seconds - (time.monotonic() - self._opened_at))
+                if self.state == OPEN else 0.0,
+            }
+
+
+class FailoverCaller:
+    """Calls a primary endpoint and fails over to a backup, guarded by circuit breakers.
+
+    When the primary's circuit is open, calls go straight to the backup instead of
+    waiting out a timeout. With ``hedge_percentile`` set, a backup request is also sent
+    once the primary has taken longer than that percentile of its recent latencies for
+    the same operation, and whichever succeeds first wins.
+
+    Exceptions in ``local_errors`` (such as local admission control turning a call
+    away) say nothing about the endpoint: they are re-raised without counting against
+    its breaker or failing over.
+    """
+
+    def __init__(self, primary: CircuitBreaker, backup: CircuitBreaker,
+                 hedge_percentile: Optional[float] = None, hedge_min_samples: int = 20,
+                 max_workers: int = 16, local_errors: Tuple[Type[Exception], ...] = ()):
+        self.primary = primary
+        self.backup = backup
+        self.local_errors = local_errors
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='llm-hedge')
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._counts = {
+            "requests": 0, "primary": 0, "backup": 0, "fallbacks": 0, "hedged": 0, "hedge_wins": 0, "rejected": 0
+        }
+        self._lock = threading.Lock()
+        for outcome in self._counts:
+            LLM_FAILOVER_CALLS.labels(outcome)
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._counts[key] += 1
+        LLM_FAILOVER_CALLS.labels(key).inc()
+
+    def _guarded(self, breaker: CircuitBreaker, operation: str, func: Callable[[], Any]) -> Any:
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"Circuit for {breaker.name} is open")
+        return self._measured(breaker, operation, func)
+
+    def _hedge_delay(self, operation: str) -> Optional[float]:
+        if not self.hedge_percentile:
+            return None
+        with self._lock:
+            samples = sorted(self._latencies.get(operation, ()))
+        if len(samples) < self.hedge_min_samples:
+            return None
+        index = min(len(samples) - 1, int(len(samples) * self.hedge_percentile / 100.0))
+        return samples[index]
+
+    def _backup(self, operation: str, backup_fn: Callable[[], Any], reason: Exception) -> Any:
+        logging.warning(f"Primary LLM unavailable for {operation} ({reason}), using backup")
+        self._count("fallbacks")
+        self._count("backup")
+        try:
+            return self._guarded(self.backup, operation, backup_fn)
+        except CircuitOpenError:
+            self._count("rejected")
+            raise
+
+    def call(self, operation: str, primary_fn: Callable[[], Any],
+             backup_fn: Optional[Callable[[], Any]] = None) -> Any:
+        """Run ``primary_fn``, falling back to (or hedging with) ``backup_fn``."""
+        self._count("requests")
+        if not self.primary.allow_request():
+            error = CircuitOpenError(f"Circuit for {self.primary.name} is open")
+            if backup_fn is None:
+                self._count("rejected")
+                raise error
+            return self._backup(operation, backup_fn, error)
+
+        self._count("primary")
+        hedge_delay = self._hedge_delay(operation) if backup_fn is not None else None
+        if hedge_delay is None:
+            try:
+                return self._measured(self.primary, operation, primary_fn)
+            except Exception as primary_error:
+                if backup_fn is None or isinstance(primary_error, self.local_errors):
+                    raise
+                return self._backup(operation, backup_fn, primary_error)
+
+        primary_future = self._executor.submit(self._measured, self.primary, operation, primary_fn)
+        done, _ = wait([primary_future], timeout=hedge_delay)
+        if done:
+            try:
+                return primary_future.result()
+            except Exception as primary_error:
+                if isinstance(primary_error, self.local_errors):
+                    raise
+                return self._backup(operation, backup_fn, primary_error)
+
+        if not self.backup.allow_request():
+            return primary_future.result()
+        self._count("hedged")
+        self._count("backup")
+        logging.info(f"Hedging {operation} to backup after {hedge_delay:.2f}s")
+        backup_future = self._executor.submit(self._measured, self.backup, operation, backup_fn)
+        pending = {primary_future, backup_future}
+        last_error: Optional[Exception] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    last_error = e
+                    continue
+                if future is backup_future:
+                    self._count("hedge_wins")
+                return result
+        raise last_error
+
+    def _measured(self, breaker: CircuitBreaker, operation: str, func: Callable[[], Any]) -> Any:
+        """Run a call whose breaker slot was already acquired and record its outcome."""
+        start = time.perf_counter()
+        try:
+            result = func()
+        except self.local_errors:
+            breaker.release()
+            raise
+        except Exception:
+            breaker.record_failure(time.perf_counter() - start)
+            raise
+        latency = time.perf_counter() - start
+        breaker.record_success(latency)
+        if breaker is self.primary:
+            with self._lock:
+                self._latencies.setdefault(operation, deque(maxlen=200)).append(latency)
+        return result
+
+    def stream(self, operation: str, primary_stream: Callable[[], Iterator[str]],
+               backup_fn: Optional[Callable[[], str]] = None) -> Iterator[str]:
+        """Relay a streamed primary call, failing over to ``backup_fn`` before the first chunk."""
+        self._count("requests")
+        streamed_any = False
+        start = time.perf_counter()
+        try:
+            if not self.primary.allow_request():
+                raise CircuitOpenError(f"Circuit for {self.primary.name} is open")
+            self._count("primary")
+            try:
+                for chunk in primary_stream():
+                    streamed_any = True
+                    yield chunk
+            except GeneratorExit:
+                # The client went away mid-stream; that says nothing about the endpoint
+                self.primary.record_success(time.perf_counter() - start)
+                raise
+            except self.local_errors:
+                self.primary.release()
+                raise
+            except Exception:
+                self.primary.record_failure(time.perf_counter() - start)
+                raise
+            self.primary.record_success(time.perf_counter() - start)
+        except Exception as primary_error:
+            if streamed_any or backup_fn is None or isinstance(primary_error, self.local_errors):
+                raise
+            yield self._backup(operation, backup_fn, primary_error)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._counts)
+        return {
+            "primary": self.primary.snapshot(),
+            "backup": self.backup.snapshot(),
+            "hedge_percentile": self.hedge_percentile,
+            "counts": counts,
+            "fallback_rate": counts["fallbacks"] / counts["requests"] if counts["requests"] else 0.0,
+        }
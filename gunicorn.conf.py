@@ -0,0 +1,59 @@
+"""Gunicorn settings for running the Meeting Minutes API in production.
+
+    gunicorn -c gunicorn.conf.py MeetingNotesGeneratorAPI:app
+
+Requests spend most of their time waiting on the LLM, so each worker process runs a
+pool of threads (gthread) instead of one request at a time. Total concurrent requests
+per pod is GUNICORN_WORKERS * GUNICORN_THREADS; upstream LLM calls are still capped per
+process by LLM_MAX_CONCURRENCY.
+"""
+import os
+import shutil
+import signal
+
+bind = f"0.0.0.0:{os.environ.get('FLASK_PORT', 5000)}"
+workers = int(os.environ.get('GUNICORN_WORKERS', 2))
+os.environ['GUNICORN_WORKERS'] = str(workers)  # The app splits per-process budgets by worker count
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 16))
+# A request may legitimately wait minutes on a long generation; this only kills hung workers
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 300))
+# Time given to in-flight requests and queued jobs after SIGTERM before workers are killed
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 120))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 0))  # Recycle workers after N requests; 0 disables
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 0))
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-') or None  # Empty disables access logs
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+# Each worker keeps its own metrics; prometheus_client aggregates them through this directory
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', '/tmp/prometheus-multiproc')
+
+
+def on_starting(server):
+    metrics_dir = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+
+def post_worker_init(worker):
+    # Report not-ready as soon as shutdown starts, then hand over to gunicorn's own handler
+    from MeetingNotesGeneratorAPI import draining
+    gunicorn_handler = signal.getsignal(signal.SIGTERM)
+
+    def handle_term(signum, frame):
+        draining.set()
+        gunicorn_handler(signum, frame)
+
+    signal.signal(signal.SIGTERM, handle_term)
+
+
+def worker_exit(server, worker):
+    # In-flight requests are done; let queued jobs and background writes finish too
+    from MeetingNotesGeneratorAPI import drain
+    drain()
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,187 @@
+import json
+import time
+import uuid
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from metrics import JOB_QUEUE_DEPTH
+from storage import Storage
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at its depth limit or shutting down."""
+
+
+class Job:
+    """A unit of background work and its lifecycle state."""
+
+    def __init__(self, job_id: str, description: Optional[Dict[str, Any]] = None):
+        self.job_id = job_id
+        self.description = description or {}
+        self.status = 'queued'
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._done = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job finishes or the timeout expires."""
+        return self._done.wait(timeout)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+            **self.description,
+        }
+
+    def to_record(self) -> Dict[str, Any]:
+        """Everything needed to answer status and result requests from another process."""
+        return {**self.to_dict(), "description": self.description, "result": self.result}
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> 'Job':
+        job = cls(record["job_id"], record["description"])
+        for field in ("status", "result", "error", "created_at", "started_at", "finished_at"):
+            setattr(job, field, record[field])
+        if job.status in ('completed', 'failed'):
+            job._done.set()
+        return job
+
+
+class JobQueue:
+    """Bounded thread pool that runs jobs in the background and tracks their state.
+
+    With ``storage`` every state change is also written to ``jobs/<job_id>.json``, so
+    any worker process or replica sharing that storage can report a job's status and
+    result, not just the one running it.
+    """
+
+    KEY_PREFIX = 'jobs/'
+
+    def __init__(self, max_workers: int = 4, max_queue_depth: int = 100, result_ttl: float = 3600,
+                 storage: Optional[Storage] = None, poll_interval: float = 0.5):
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self.result_ttl = result_ttl
+        self.storage = storage
+        self.poll_interval = poll_interval
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='minutes-job')
+        self._jobs: Dict[str, Job] = {}
+        self._pending = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    @property
+    def depth(self) -> int:
+        """Number of jobs that are queued or running."""
+        with self._lock:
+            return self._pending
+
+    def submit(self, func: Callable[..., Dict[str, Any]], *args,
+               description: Optional[Dict[str, Any]] = None, **kwargs) -> Job:
+        """Queue ``func(*args, **kwargs)`` and return its Job handle."""
+        with self._lock:
+            self._evict_expired()
+            if self._closed:
+                raise QueueFullError("Job queue is shutting down")
+            if self._pending >= self.max_queue_depth:
+                raise QueueFullError(f"Job queue is full ({self.max_queue_depth} pending jobs)")
+            job = Job(uuid.uuid4().hex, description)
+            self._jobs[job.job_id] = job
+            self._pending += 1
+        JOB_QUEUE_DEPTH.inc()
+
+        self._publish(job)
+        self._executor.submit(self._run, job, func, args, kwargs)
+        return job
+
+    def get(self, job_id: str, wait: float = 0) -> Optional[Job]:
+        """Look a job up here or in shared storage, waiting up to ``wait`` seconds for it to finish."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None:
+            if wait:
+                job.wait(wait)
+            return job
+
+        # Another process is running it; poll its published state
+        deadline = time.monotonic() + wait
+        while True:
+            job = self._load(job_id)
+            if job is None or job.done or time.monotonic() >= deadline:
+                return job
+            time.sleep(min(self.poll_interval, max(0.0, deadline - time.monotonic())))
+
+    def _key(self, job_id: str) -> str:
+        return f"{self.KEY_PREFIX}{job_id}.json"
+
+    def _publish(self, job: Job) -> None:
+        if self.storage is None:
+            return
+        try:
+            self.storage.write(self._key(job.job_id), json.dumps(job.to_record()).encode('utf-8'))
+        except Exception as e:
+            # The job still runs; only other processes lose sight of it
+            logging.error(f"Could not publish state of job {job.job_id}: {e}")
+
+    def _load(self, job_id: str) -> Optional[Job]:
+        if self.storage is None or not job_id.isalnum():
+            return None
+        try:
+            job = Job.from_record(json.loads(self.storage.read(self._key(job_id))))
+        except (FileNotFoundError, ValueError, KeyError):
+            return None
+        if job.finished_at is not None and job.finished_at < time.time() - self.result_ttl:
+            return None
+        return job
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting jobs and, with ``wait``, let queued and running jobs finish."""
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, job: Job, func: Callable[..., Dict[str, Any]], args, kwargs) -> None:
+        job.status = 'running'
+        job.started_at = time.time()
+        self._publish(job)
+        try:
+            job.result = func(*args, **kwargs)
+            job.status = 'completed'
+        except Exception as e:
+            logging.error(f"Job {job.job_id} failed: {e}")
+            job.error = str(e)
+            job.status = 'failed'
+        finally:
+            job.finished_at = time.time()
+            self._publish(job)
+            with self._lock:
+                self._pending -= 1
+            JOB_QUEUE_DEPTH.dec()
+            job._done.set()
+
+    def _evict_expired(self) -> None:
+        """Drop finished jobs older than the result TTL. Caller must hold the lock."""
+        cutoff = time.time() - self.result_ttl
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.done and job.finished_at is not None and job.finished_at < cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
+            if self.storage is not None:
+                try:
+                    self.storage.delete(self._key(job_id))
+                except Exception as e:
+                    logging.warning(f"Could not delete state of expired job {job_id}: {e}")
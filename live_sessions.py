@@ -0,0 +1,286 @@
+import json
+import time
+import random
+import uuid
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from storage import Storage
+
+# fold(current summary or '', new transcript text) -> updated summary
+Folder = Callable[[str, str], str]
+
+
+class SessionNotFoundError(KeyError):
+    """Raised for a live session id that does not exist."""
+
+
+class SessionFinalizedError(Exception):
+    """Raised when a finalized live session is modified."""
+
+
+class SessionConflictError(Exception):
+    """Raised when a session update keeps losing to concurrent writers."""
+
+
+class LiveSession:
+    """State of one live meeting: the rolling summary and the segments not yet folded into it."""
+
+    def __init__(self, session_id: str, title: Optional[str] = None):
+        self.session_id = session_id
+        self.title = title
+        self.summary = ''
+        self.pending: List[str] = []
+        self.segments = 0
+        self.transcript_chars = 0
+        self.summarized_chars = 0
+        self.updates = 0
+        self.finalized = False
+        self.last_error: Optional[str] = None
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+
+    @property
+    def pending_chars(self) -> int:
+        return sum(len(segment) + 1 for segment in self.pending)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "title": self.title,
+            "summary": self.summary,
+            "pending": self.pending,
+            "segments": self.segments,
+            "transcript_chars": self.transcript_chars,
+            "summarized_chars": self.summarized_chars,
+            "updates": self.updates,
+            "finalized": self.finalized,
+            "last_error": self.last_error,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LiveSession':
+        session = cls(data["session_id"], data.get("title"))
+        for field in ("summary", "pending", "segments", "transcript_chars", "summarized_chars",
+                      "updates", "finalized", "last_error", "created_at", "updated_at"):
+            setattr(session, field, data[field])
+        return session
+
+    def status(self) -> Dict[str, Any]:
+        """Public view of the session, without the summary text or raw pending segments."""
+        status = self.to_dict()
+        status.pop("summary")
+        status.pop("pending")
+        status["pending_segments"] = len(self.pending)
+        status["pending_chars"] = self.pending_chars
+        return status
+
+
+class LiveSessionManager:
+    """Rolling minutes for meetings that are still in progress.
+
+    Appended segments queue up as ``pending``; once at least ``update_chars`` are waiting
+    they are folded into the running summary in the background. Each fold sends only the
+    current summary and the new segments (at most ``max_fold_chars`` per call), so the
+    cost of an update does not grow with the length of the meeting.
+
+    Session state lives in ``storage`` so drafts survive restarts and any worker or
+    replica can serve a session. Every update is a conditional write against the version
+    that was read and is re-applied to fresh state on a conflict, so concurrent appends
+    are never lost and a batch folded elsewhere is not folded twice. In-process locks
+    only keep a worker's own threads from contending with each other.
+    """
+
+    KEY_PREFIX = 'sessions/'
+
+    def __init__(self, storage: Storage, fold: Folder, update_chars: int = 4000,
+                 max_fold_chars: int = 24000, max_workers: int = 4, max_update_attempts: int = 20):
+        self.storage = storage
+        self.fold = fold
+        self.update_chars = update_chars
+        self.max_fold_chars = max_fold_chars
+        self.max_update_attempts = max_update_attempts
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='live-fold')
+        self._state_locks: Dict[str, threading.Lock] = {}
+        self._fold_locks: Dict[str, threading.Lock] = {}
+        self._scheduled = set()
+        self._locks_guard = threading.Lock()
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.KEY_PREFIX}{session_id}.json"
+
+    def _locks(self, session_id: str):
+        with self._locks_guard:
+            return (self._state_locks.setdefault(session_id, threading.Lock()),
+                    self._fold_locks.setdefault(session_id, threading.Lock()))
+
+    def _forget(self, session_id: str) -> None:
+        """Drop the locks of a session that can no longer change."""
+        with self._locks_guard:
+            self._state_locks.pop(session_id, None)
+            self._fold_locks.pop(session_id, None)
+
+    def _require(self, session_id: str) -> None:
+        """Raise SessionNotFoundError unless ``session_id`` names a stored session."""
+        if '/' in session_id or '.' in session_id or not self.storage.exists(self._key(session_id)):
+            raise SessionNotFoundError(session_id)
+
+    def _load(self, session_id: str) -> Tuple[LiveSession, str]:
+        try:
+            data, version = self.storage.read_versioned(self._key(session_id))
+            return LiveSession.from_dict(json.loads(data)), version
+        except (FileNotFoundError, ValueError):
+            raise SessionNotFoundError(session_id)
+
+    def _encode(self, session: LiveSession) -> bytes:
+        session.updated_at = time.time()
+        return json.dumps(session.to_dict()).encode('utf-8')
+
+    def _update(self, session_id: str, change: Callable[[LiveSession], bool]) -> LiveSession:
+        """Apply ``change`` to the stored session and write it back if it returns True.
+
+        A write that loses to another process is retried on freshly read state; after
+        ``max_update_attempts`` conflicts SessionConflictError is raised and nothing is
+        applied. Exceptions from ``change`` propagate without writing.
+        """
+        state_lock, _ = self._locks(session_id)
+        with state_lock:
+            for attempt in range(self.max_update_attempts):
+                session, version = self._load(session_id)
+                if not change(session):
+                    return session
+                if self.storage.write_if_match(self._key(session_id), self._encode(session), version):
+                    return session
+                time.sleep(random.uniform(0, 0.01 * (attempt + 1)))
+        raise SessionConflictError(f"Session {session_id} is being updated concurrently; retry")
+
+    def create(self, title: Optional[str] = None) -> LiveSession:
+        session = LiveSession(uuid.uuid4().hex, title)
+        self.storage.write_if_match(self._key(session.session_id), self._encode(session), None)
+        return session
+
+    def get(self, session_id: str) -> LiveSession:
+        if '/' in session_id or '.' in session_id:
+            raise SessionNotFoundError(session_id)
+        return self._load(session_id)[0]
+
+    def append(self, session_id: str, segments: List[str]) -> LiveSession:
+        """Queue transcript segments and schedule a background fold once enough have arrived."""
+        # Unknown ids must not leave locks behind
+        self._require(session_id)
+
+        def add(session: LiveSession) -> bool:
+            if session.finalized:
+                raise SessionFinalizedError(f"Session {session_id} is finalized")
+            session.pending.extend(segments)
+            session.segments += len(segments)
+            session.transcript_chars += sum(len(segment) + 1 for segment in segments)
+            return True
+
+        try:
+            session = self._update(session_id, add)
+        except SessionFinalizedError:
+            if not self.get(session_id).pending:
+                self._forget(session_id)
+            raise
+
+        if session.pending_chars >= self.update_chars:
+            self._schedule(session_id)
+        return session
+
+    def refresh(self, session_id: str) -> LiveSession:
+        """Fold every pending segment now and return the up-to-date session."""
+        self._fold_pending(session_id, raise_errors=True)
+        return self.get(session_id)
+
+    def finalize(self, session_id: str) -> LiveSession:
+        """Fold the remaining segments and close the session to further appends."""
+        self._require(session_id)
+
+        def close(session: LiveSession) -> bool:
+            if session.finalized:
+                return False
+            session.finalized = True
+            return True
+
+        self._update(session_id, close)
+        # A failed fold leaves the segments pending, so finalize can simply be retried
+        self._fold_pending(session_id, raise_errors=True)
+        return self.get(session_id)
+
+    def _schedule(self, session_id: str) -> None:
+        with self._locks_guard:
+            if session_id in self._scheduled:
+                return
+            self._scheduled.add(session_id)
+        self._executor.submit(self._run_scheduled, session_id)
+
+    def _run_scheduled(self, session_id: str) -> None:
+        with self._locks_guard:
+            self._scheduled.discard(session_id)
+        try:
+            self._fold_pending(session_id, raise_errors=False)
+        except Exception as e:
+            logging.error(f"Background fold failed for live session {session_id}: {e}")
+
+    def _take_batch(self, pending: List[str]) -> List[str]:
+        """Leading pending segments that fit in one fold; always at least one."""
+        batch, size = [], 0
+        for segment in pending:
+            if batch and size + len(segment) + 1 > self.max_fold_chars:
+                break
+            batch.append(segment)
+            size += len(segment) + 1
+        return batch
+
+    def _fold_pending(self, session_id: str, raise_errors: bool) -> None:
+        self._require(session_id)
+        _, fold_lock = self._locks(session_id)
+        # One fold at a time per session in this process; other processes are caught
+        # by the folded-segment check when the result is written
+        with fold_lock:
+            while True:
+                session = self.get(session_id)
+                batch = self._take_batch(session.pending)
+                if not batch:
+                    if session.finalized:
+                        # Finalized and fully folded: nothing can change any more
+                        self._forget(session_id)
+                    return
+                folded = session.segments - len(session.pending)
+
+                new_text = '\n'.join(batch)
+                try:
+                    summary = self.fold(session.summary, new_text)
+                except Exception as e:
+                    logging.error(f"Could not fold {len(batch)} segments into live session {session_id}: {e}")
+
+                    def record_error(fresh: LiveSession) -> bool:
+                        fresh.last_error = str(e)
+                        return True
+
+                    self._update(session_id, record_error)
+                    if raise_errors:
+                        raise
+                    return
+
+                def apply_fold(fresh: LiveSession) -> bool:
+                    if fresh.segments - len(fresh.pending) != folded:
+                        # Another process folded this batch first; its summary stands
+                        return False
+                    # Segments appended during the fold stay queued behind the batch
+                    fresh.pending = fresh.pending[len(batch):]
+                    fresh.summary = summary
+                    fresh.summarized_chars += len(new_text) + 1
+                    fresh.updates += 1
+                    fresh.last_error = None
+                    return True
+
+                self._update(session_id, apply_fold)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,227 @@
+import json
+import math
+import time
+import logging
+import threading
+import itertools
+import requests
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+from llm_scheduler import INTERACTIVE, LLMScheduler, LLMThrottledError, Ticket, parse_retry_after
+from metrics import LLM_CALLS, LLM_ERRORS, LLM_IN_FLIGHT, LLM_LATENCY_SECONDS, LLM_TOKENS
+
+Timeout = Union[float, Tuple[float, float]]
+
+# Upstream statuses that mean "slow down": back off and retry instead of failing
+THROTTLE_STATUSES = (429, 503)
+
+
+class LLMResponse:
+    """JSON body of an LLM call together with how long the call took."""
+
+    def __init__(self, data: Dict[str, Any], latency: float, status_code: int):
+        self.data = data
+        self.latency = latency
+        self.status_code = status_code
+
+
+class LLMClient:
+    """Shared HTTP client for LLM endpoints.
+
+    A single ``requests.Session`` keeps TCP/TLS connections alive across calls, and
+    every request gets separate connect and read timeouts so a hung upstream cannot
+    pin a worker forever. Every call is admitted by ``scheduler`` in its priority lane
+    (at most ``max_concurrency`` in flight when no scheduler is given), and throttled
+    responses are retried after the upstream's Retry-After.
+    """
+
+    def __init__(self, connect_timeout: float = 5.0, read_timeout: float = 120.0,
+                 pool_connections: int = 4, pool_maxsize: int = 16, max_concurrency: int = 16,
+                 scheduler: Optional[LLMScheduler] = None, default_max_tokens: int = 1024):
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.scheduler = scheduler or LLMScheduler(max_concurrency=max_concurrency)
+        self.max_concurrency = self.scheduler.max_concurrency
+        self.default_max_tokens = default_max_tokens
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._stats_lock = threading.Lock()
+        self._calls = 0
+        self._errors = 0
+        self._total_latency = 0.0
+        self._last_latency: Optional[float] = None
+        self._in_flight = 0
+        self._prompt_tokens = 0
+        self._completion_tokens = 0
+
+    def estimate_tokens(self, payload: Dict[str, Any]) -> int:
+        """Tokens to reserve for a call: prompt at about four characters a token plus the completion."""
+        if 'messages' in payload:
+            prompt_chars = sum(len(str(message.get('content', ''))) for message in payload['messages'])
+        else:
+            prompt_chars = len(str(payload.get('prompt', '')))
+        return prompt_chars // 4 + int(payload.get('max_tokens') or self.default_max_tokens)
+
+    def _throttle_delay(self, url: str, response: requests.Response, attempt: int) -> Optional[float]:
+        """Seconds to back off before retrying a throttled response, or None if it was not throttled.
+
+        Raises LLMThrottledError, with the upstream's Retry-After, once the retries are used up.
+        """
+        if response.status_code not in THROTTLE_STATUSES:
+            return None
+        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+        if attempt >= self.scheduler.max_retries:
+            response.close()
+            if retry_after is None:
+                retry_after = min(self.scheduler.backoff_max, self.scheduler.backoff_base * 2 ** attempt)
+            raise LLMThrottledError(f"LLM endpoint {url} is still throttling after {attempt} retries",
+                               float(max(1, math.ceil(retry_after))))
+        delay = self.scheduler.backoff(urlsplit(url).netloc, attempt, retry_after)
+        logging.warning(f"LLM endpoint {url} returned {response.status_code}; retrying in {delay:.2f}s")
+        return delay
+
+    def _settle(self, ticket: Ticket, usage: Optional[Dict[str, Any]]) -> None:
+        if usage and usage.get('total_tokens') is not None:
+            ticket.used_tokens = usage['total_tokens']
+        elif usage:
+            ticket.used_tokens = (usage.get('prompt_tokens') or 0) + (usage.get('completion_tokens') or 0)
+
+    def post_json(self, url: str, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None,
+                  read_timeout: Optional[float] = None, lane: str = INTERACTIVE) -> LLMResponse:
+        """POST a JSON payload and return the decoded response.
+
+        Throttled responses (429/503) are retried up to the scheduler's ``max_retries``.
+        Raises LLMBusyError when the call is not admitted, LLMThrottledError when it is
+        still throttled after that, and the usual ``requests`` exceptions on timeouts,
+        connection failures and other non-2xx responses.
+        """
+        timeout = (self.connect_timeout, read_timeout if read_timeout is not None else self.read_timeout)
+        tokens = self.estimate_tokens(payload)
+        for attempt in itertools.count():
+            ticket = self.scheduler.acquire(lane, tokens, urlsplit(url).netloc)
+            self._track_in_flight(1)
+            start = time.perf_counter()
+            try:
+                response = self.session.post(url, json=payload, headers=headers, timeout=timeout)
+                if self._throttle_delay(url, response, attempt) is not None:
+                    self._record(time.perf_counter() - start, error=True)
+                    continue
+                response.raise_for_status()
+                data = response.json()
+                usage = data.get('usage') if isinstance(data, dict) else None
+                self._settle(ticket, usage)
+            except Exception:
+                self._record(time.perf_counter() - start, error=True)
+                raise
+            finally:
+                self._track_in_flight(-1)
+                self.scheduler.release(ticket)
+
+            latency = time.perf_counter() - start
+            self._record(latency, usage=usage)
+            logging.info(f"LLM call to {url} completed in {latency:.3f}s")
+            return LLMResponse(data, latency, response.status_code)
+
+    def stream_chat(self, url: str, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None,
+                    read_timeout: Optional[float] = None, lane: str = INTERACTIVE) -> Iterator[str]:
+        """Request a streamed chat completion and yield content deltas as they arrive.
+
+        The read timeout applies between chunks rather than to the whole completion.
+        Throttled responses are retried before the first chunk, as in ``post_json``.
+        """
+        timeout = (self.connect_timeout, read_timeout if read_timeout is not None else self.read_timeout)
+        tokens = self.estimate_tokens(payload)
+        for attempt in itertools.count():
+            ticket = self.scheduler.acquire(lane, tokens, urlsplit(url).netloc)
+            self._track_in_flight(1)
+            start = time.perf_counter()
+            try:
+                response = self.session.post(url, json={**payload, "stream": True}, headers=headers,
+                                             timeout=timeout, stream=True)
+                throttled = self._throttle_delay(url, response, attempt) is not None
+            except Exception:
+                self._record(time.perf_counter() - start, error=True)
+                self._track_in_flight(-1)
+                self.scheduler.release(ticket)
+                raise
+            if not throttled:
+                break  # The slot is held until the stream ends
+            response.close()
+            self._record(time.perf_counter() - start, error=True)
+            self._track_in_flight(-1)
+            self.scheduler.release(ticket)
+
+        first_token_latency = None
+        usage = None
+        try:
+            with response:
+                response.raise_for_status()
+                for raw_line in response.iter_lines():
+                    line = raw_line.decode('utf-8')
+                    if not line.startswith('data:'):
+                        continue
+                    data = line[len('data:'):].strip()
+                    if data == '[DONE]':
+                        break
+                    chunk = json.loads(data)
+                    # Servers that report usage on streams send it with the last chunk
+                    usage = chunk.get('usage') or usage
+                    choices = chunk.get('choices') or [{}]
+                    delta = choices[0].get('delta', {}).get('content')
+                    if delta:
+                        if first_token_latency is None:
+                            first_token_latency = time.perf_counter() - start
+                        yield delta
+        except Exception:
+            self._record(time.perf_counter() - start, error=True)
+            raise
+        finally:
+            self._settle(ticket, usage)
+            self._track_in_flight(-1)
+            self.scheduler.release(ticket)
+
+        latency = time.perf_counter() - start
+        self._record(latency, usage=usage)
+        ttft = f"{first_token_latency:.3f}s" if first_token_latency is not None else "n/a"
+        logging.info(f"Streamed LLM call to {url} completed in {latency:.3f}s (first token {ttft})")
+
+    def stats(self) -> Dict[str, Any]:
+        """Aggregate call counts, latency and token usage since startup."""
+        with self._stats_lock:
+            return {
+                "calls": self._calls,
+                "errors": self._errors,
+                "in_flight": self._in_flight,
+                "total_latency": self._total_latency,
+                "avg_latency": self._total_latency / self._calls if self._calls else None,
+                "last_latency": self._last_latency,
+                "prompt_tokens": self._prompt_tokens,
+                "completion_tokens": self._completion_tokens,
+            }
+
+    def _track_in_flight(self, delta: int) -> None:
+        with self._stats_lock:
+            self._in_flight += delta
+        LLM_IN_FLIGHT.inc(delta)
+
+    def _record(self, latency: float, error: bool = False, usage: Optional[Dict[str, Any]] = None) -> None:
+        with self._stats_lock:
+            self._calls += 1
+            self._total_latency += latency
+            self._last_latency = latency
+            if error:
+                self._errors += 1
+            if usage:
+                self._prompt_tokens += usage.get('prompt_tokens') or 0
+                self._completion_tokens += usage.get('completion_tokens') or 0
+        LLM_CALLS.inc()
+        LLM_LATENCY_SECONDS.inc(latency)
+        if error:
+            LLM_ERRORS.inc()
+        if usage:
+            LLM_TOKENS.labels('prompt').inc(usage.get('prompt_tokens') or 0)
+            LLM_TOKENS.labels('completion').inc(usage.get('completion_tokens') or 0)
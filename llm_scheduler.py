@@ -0,0 +1,233 @@
+import math
+import time
+import random
+import threading
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Any, Deque, Dict, Optional
+
+from metrics import (
+    LLM_ADMITTED, LLM_QUEUE_WAIT_SECONDS, LLM_QUEUED, LLM_REJECTED, LLM_THROTTLED, LLM_TOKENS_AVAILABLE
+)
+
+INTERACTIVE = 'interactive'
+BATCH = 'batch'
+LANES = (INTERACTIVE, BATCH)  # Highest priority first
+
+
+class LLMRetryLaterError(Exception):
+    """An LLM call that cannot be made now but may succeed after ``retry_after`` seconds."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class LLMBusyError(LLMRetryLaterError):
+    """Raised when an LLM call is not admitted: its lane is full or it waited too long for a slot."""
+
+
+class LLMThrottledError(LLMRetryLaterError):
+    """Raised when an upstream LLM endpoint is still rate limiting after every retry.
+
+    Unlike LLMBusyError this is the endpoint's doing, so failover still tries the backup.
+    """
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header, given as seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class Ticket:
+    """An admitted (or waiting) LLM call and the tokens reserved for it."""
+
+    def __init__(self, lane: str, tokens: int):
+        self.lane = lane
+        self.tokens = tokens
+        self.used_tokens: Optional[int] = None  # Set from response usage to settle the reservation
+
+
+class LLMScheduler:
+    """Admission control shared by every upstream LLM call in the process.
+
+    Calls wait in per-lane FIFO queues and start when a concurrency slot is free and
+    the tokens-per-minute budget covers their estimated tokens. Both limits apply to
+    this process only; a limit shared by several processes must be split between
+    them when the scheduler is configured. Interactive calls
+    always start before queued batch work. A lane whose queue is full, or a call that
+    waits longer than its lane allows, raises LLMBusyError so the request can be
+    answered with 503 and Retry-After instead of piling more load on the gateway.
+
+    Endpoints that answer 429 or 503 are paused for their Retry-After (or an
+    exponential backoff); new calls to them wait out the pause before queueing.
+    """
+
+    def __init__(self, max_concurrency: int = 8, tokens_per_minute: int = 0,
+                 max_queue: Optional[Dict[str, int]] = None, max_wait: Optional[Dict[str, float]] = None,
+                 max_retries: int = 3, backoff_base: float = 0.5, backoff_max: float = 30.0):
+        self.max_concurrency = max_concurrency
+        self.tokens_per_minute = tokens_per_minute  # 0 disables the token budget
+        self.max_queue = {INTERACTIVE: 64, BATCH: 256, **(max_queue or {})}
+        self.max_wait = {INTERACTIVE: 30.0, BATCH: 300.0, **(max_wait or {})}
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._cond = threading.Condition()
+        self._queues: Dict[str, Deque[Ticket]] = {lane: deque() for lane in LANES}
+        self._in_flight = 0
+        self._tokens = float(tokens_per_minute)
+        self._tokens_updated = time.monotonic()
+        self._paused_until: Dict[str, float] = {}
+        self._counts = {lane: {"admitted": 0, "rejected": 0, "wait_seconds": 0.0} for lane in LANES}
+        self._throttled = 0
+        self._retries = 0
+        for lane in LANES:
+            for metric in (LLM_QUEUED, LLM_ADMITTED, LLM_REJECTED, LLM_QUEUE_WAIT_SECONDS):
+                metric.labels(lane)
+        if tokens_per_minute:
+            LLM_TOKENS_AVAILABLE.set(self._tokens)
+
+    def _set_tokens(self, tokens: float) -> None:
+        """Update the token budget and its gauge. Caller must hold the lock."""
+        self._tokens = tokens
+        if self.tokens_per_minute:
+            LLM_TOKENS_AVAILABLE.set(tokens)
+
+    def _refill(self, now: float) -> None:
+        if self.tokens_per_minute:
+            elapsed = now - self._tokens_updated
+            self._set_tokens(min(float(self.tokens_per_minute), self._tokens + elapsed * self.tokens_per_minute / 60.0))
+        self._tokens_updated = now
+
+    def _reject(self, lane: str) -> None:
+        """Count a call turned away. Caller must hold the lock."""
+        self._counts[lane]["rejected"] += 1
+        LLM_REJECTED.labels(lane).inc()
+
+    def _wait_time(self, ticket: Ticket) -> Optional[float]:
+        """0 if ``ticket`` can start now, seconds until it might, or None to wait for a release."""
+        for lane in LANES:
+            if self._queues[lane]:
+                if self._queues[lane][0] is not ticket:
+                    return None
+                break
+        if self._in_flight >= self.max_concurrency:
+            return None
+        if self.tokens_per_minute and self._tokens < ticket.tokens:
+            return (ticket.tokens - self._tokens) * 60.0 / self.tokens_per_minute
+        return 0.0
+
+    def _retry_after(self, ticket: Ticket) -> float:
+        """Rough seconds until ``ticket``'s call could be admitted. Caller must hold the lock."""
+        waiting = sum(len(queue) for queue in self._queues.values())
+        token_wait = 0.0
+        if self.tokens_per_minute:
+            self._refill(time.monotonic())
+            # The budget must cover everything already queued before this call
+            needed = sum(queued.tokens for queue in self._queues.values() for queued in queue)
+            if ticket not in self._queues[ticket.lane]:
+                needed += ticket.tokens
+            token_wait = max(0.0, needed - self._tokens) * 60.0 / self.tokens_per_minute
+        return float(max(1, math.ceil(token_wait), math.ceil(waiting / max(1, self.max_concurrency))))
+
+    def acquire(self, lane: str, tokens: int = 0, endpoint: Optional[str] = None) -> Ticket:
+        """Wait for a slot in ``lane``; raises LLMBusyError if the lane is full or the wait too long."""
+        deadline = time.monotonic() + self.max_wait[lane]
+        if endpoint is not None:
+            with self._cond:
+                pause = self._paused_until.get(endpoint, 0.0) - time.monotonic()
+            if pause > 0:
+                if time.monotonic() + pause > deadline:
+                    with self._cond:
+                        self._reject(lane)
+                    raise LLMBusyError(f"LLM endpoint is rate limited for {pause:.0f}s", math.ceil(pause))
+                time.sleep(pause)
+
+        if self.tokens_per_minute:
+            tokens = min(tokens, self.tokens_per_minute)  # A call larger than the budget still runs alone
+        ticket = Ticket(lane, tokens)
+        queued_at = time.monotonic()
+        with self._cond:
+            queue = self._queues[lane]
+            if len(queue) >= self.max_queue[lane]:
+                self._reject(lane)
+                raise LLMBusyError(f"Too many queued {lane} LLM calls", self._retry_after(ticket))
+            queue.append(ticket)
+            LLM_QUEUED.labels(lane).inc()
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    wait = self._wait_time(ticket)
+                    if wait == 0:
+                        break
+                    if now >= deadline:
+                        self._reject(lane)
+                        raise LLMBusyError(f"Timed out waiting for a {lane} LLM slot", self._retry_after(ticket))
+                    self._cond.wait(deadline - now if wait is None else min(wait, deadline - now))
+            except BaseException:
+                queue.remove(ticket)
+                LLM_QUEUED.labels(lane).dec()
+                self._cond.notify_all()
+                raise
+            queue.popleft()
+            LLM_QUEUED.labels(lane).dec()
+            self._in_flight += 1
+            self._set_tokens(self._tokens - ticket.tokens)
+            waited = time.monotonic() - queued_at
+            self._counts[lane]["admitted"] += 1
+            self._counts[lane]["wait_seconds"] += waited
+            LLM_ADMITTED.labels(lane).inc()
+            LLM_QUEUE_WAIT_SECONDS.labels(lane).inc(waited)
+            # The next head of line may be able to start as well
+            self._cond.notify_all()
+        return ticket
+
+    def release(self, ticket: Ticket) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            if self.tokens_per_minute and ticket.used_tokens is not None:
+                # Settle the estimate against what the call really used
+                self._set_tokens(min(float(self.tokens_per_minute), self._tokens + ticket.tokens - ticket.used_tokens))
+            self._cond.notify_all()
+
+    def backoff(self, endpoint: str, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Pause ``endpoint`` after a throttled response and return the delay before retrying."""
+        if retry_after is None:
+            delay = min(self.backoff_max, self.backoff_base * 2 ** attempt) * random.uniform(0.5, 1.0)
+        else:
+            delay = min(self.backoff_max, retry_after)
+        with self._cond:
+            self._throttled += 1
+            self._retries += 1
+            self._paused_until[endpoint] = max(self._paused_until.get(endpoint, 0.0), time.monotonic() + delay)
+        LLM_THROTTLED.inc()
+        return delay
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            self._refill(time.monotonic())
+            now = time.monotonic()
+            return {
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self._in_flight,
+                "tokens_per_minute": self.tokens_per_minute,
+                "tokens_available": round(self._tokens) if self.tokens_per_minute else None,
+                "queued": {lane: len(queue) for lane, queue in self._queues.items()},
+                "lanes": {lane: dict(counts) for lane, counts in self._counts.items()},
+                "throttled": self._throttled,
+                "retries": self._retries,
+                "paused": {
+                    endpoint: round(until - now, 2) for endpoint, until in self._paused_until.items() if until > now
+                },
+            }
@@ -0,0 +1,65 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+PREFIX = 'meeting_minutes'
+
+# LLM calls take seconds to minutes, so the buckets reach well past the default 10s
+STAGE_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300)
+
+STAGE_SECONDS = Histogram(
+    f'{PREFIX}_stage_seconds',
+    'Time spent in each stage of minutes generation and question answering',
+    ['stage'],
+    buckets=STAGE_BUCKETS
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    f'{PREFIX}_http_request_seconds',
+    'HTTP request latency by endpoint',
+    ['endpoint', 'method', 'status'],
+    buckets=STAGE_BUCKETS
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    f'{PREFIX}_http_requests_in_flight',
+    'HTTP requests currently being handled',
+    multiprocess_mode='livesum'
+)
+
+# Counters are incremented and gauges updated where the events happen, so that under
+# gunicorn (PROMETHEUS_MULTIPROC_DIR) every worker's values are aggregated on each scrape.
+# Gauges of per-worker state are summed across live workers.
+LLM_CALLS = Counter(f'{PREFIX}_llm_calls', 'Upstream LLM HTTP calls')
+LLM_ERRORS = Counter(f'{PREFIX}_llm_errors', 'Upstream LLM HTTP calls that failed')
+LLM_LATENCY_SECONDS = Counter(f'{PREFIX}_llm_latency_seconds', 'Total time spent in upstream LLM calls')
+LLM_TOKENS = Counter(f'{PREFIX}_llm_tokens', 'LLM tokens reported in response usage', ['kind'])
+LLM_IN_FLIGHT = Gauge(f'{PREFIX}_llm_in_flight', 'Upstream LLM calls in flight', multiprocess_mode='livesum')
+
+LLM_QUEUED = Gauge(f'{PREFIX}_llm_queued', 'LLM calls waiting for admission', ['lane'], multiprocess_mode='livesum')
+LLM_ADMITTED = Counter(f'{PREFIX}_llm_admitted', 'LLM calls admitted by the scheduler', ['lane'])
+LLM_REJECTED = Counter(f'{PREFIX}_llm_rejected', 'LLM calls turned away with 503 by the scheduler', ['lane'])
+LLM_QUEUE_WAIT_SECONDS = Counter(
+    f'{PREFIX}_llm_queue_wait_seconds', 'Total time LLM calls waited for admission', ['lane']
+)
+LLM_THROTTLED = Counter(f'{PREFIX}_llm_throttled', 'Upstream 429/503 responses that were backed off and retried')
+LLM_TOKENS_AVAILABLE = Gauge(
+    f'{PREFIX}_llm_tokens_available', 'Tokens left in the per-minute budgets of all workers',
+    multiprocess_mode='livesum'
+)
+
+LLM_FAILOVER_CALLS = Counter(f'{PREFIX}_llm_failover_calls', 'Failover caller outcomes', ['outcome'])
+LLM_CIRCUIT_STATE = Gauge(
+    f'{PREFIX}_llm_circuit_state', 'Circuit state per endpoint, worst across workers: 0 closed, 1 half-open, 2 open',
+    ['endpoint'], multiprocess_mode='livemax'
+)
+
+JOB_QUEUE_DEPTH = Gauge(f'{PREFIX}_job_queue_depth', 'Jobs queued or running', multiprocess_mode='livesum')
+
+SINGLE_FLIGHT_EXECUTED = Counter(
+    f'{PREFIX}_single_flight_executed', 'LLM operations run by a single-flight leader', ['operation']
+)
+SINGLE_FLIGHT_COALESCED = Counter(
+    f'{PREFIX}_single_flight_coalesced', 'Duplicate LLM operations that waited on an in-flight call', ['operation']
+)
+
+
+def stage_timer(stage: str):
+    """Decorator and context manager that observes a stage duration."""
+    return STAGE_SECONDS.labels(stage).time()
@@ -0,0 +1,159 @@
+import os
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+def make_cache_key(*parts: Optional[str]) -> str:
+    """Content-addressed key: SHA-256 over the parts, separated so they cannot run together."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update((part or '').encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+class MemoryCacheBackend:
+    """In-process LRU with a maximum entry count and a time-to-live."""
+
+    def __init__(self, max_entries: int = 256, ttl: float = 86400):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: 'OrderedDict[str, Tuple[float, str]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.time() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend:
+    """On-disk store shared by every worker process that points at the same file."""
+
+    def __init__(self, path: str, max_entries: int = 10000, ttl: float = 86400):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS minutes_cache ('
+                'key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS minutes_cache_accessed ON minutes_cache (accessed_at)')
+
+    def _connect(self) -> sqlite3.Connection:
+        # A short-lived connection per operation keeps this safe across threads and processes
+        return sqlite3.connect(self.path, timeout=10)
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute('SELECT value, stored_at FROM minutes_cache WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            value, stored_at = row
+            if now - stored_at > self.ttl:
+                conn.execute('DELETE FROM minutes_cache WHERE key = ?', (key,))
+                return None
+            conn.execute('UPDATE minutes_cache SET accessed_at = ? WHERE key = ?', (now, key))
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO minutes_cache (key, value, stored_at, accessed_at) VALUES (?, ?, ?, ?)',
+                (key, value, now, now)
+            )
+            conn.execute('DELETE FROM minutes_cache WHERE stored_at < ?', (now - self.ttl,))
+            conn.execute(
+                'DELETE FROM minutes_cache WHERE key IN ('
+                'SELECT key FROM minutes_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,)
+            )
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute('SELECT COUNT(*) FROM minutes_cache').fetchone()[0]
+
+
+class MinutesCache:
+    """Cache of generated minutes with an in-process LRU in front of an optional shared store."""
+
+    def __init__(self, memory: Optional[MemoryCacheBackend] = None,
+                 shared: Optional[SQLiteCacheBackend] = None, enabled: bool = True):
+        self.memory = memory
+        self.shared = shared
+        self.enabled = enabled
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+
+        value = self.memory.get(key) if self.memory is not None else None
+        if value is None and self.shared is not None:
+            try:
+                value = self.shared.get(key)
+            except sqlite3.Error as e:
+                logging.warning(f"Shared minutes cache read failed: {e}")
+            if value is not None and self.memory is not None:
+                self.memory.set(key, value)
+
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        if not self.enabled:
+            return
+        if self.memory is not None:
+            self.memory.set(key, value)
+        if self.shared is not None:
+            try:
+                self.shared.set(key, value)
+            except sqlite3.Error as e:
+                logging.warning(f"Shared minutes cache write failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits, misses = self._hits, self._misses
+        return {
+            "enabled": self.enabled,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else None,
+            "memory_entries": len(self.memory) if self.memory is not None else None,
+            "shared_entries": len(self.shared) if self.shared is not None else None,
+        }
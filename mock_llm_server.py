@@ -0,0 +1,247 @@
+"""OpenAI-compatible stand-in LLM for local load testing.
+
+    python mock_llm_server.py --port 8001 --latency 0.5 --tokens-per-second 50 --error-rate 0.05
+
+Then point the API at it:
+
+    PRIMARY_LLM_URL=http://127.0.0.1:8001/v1/chat/completions
+    BACKUP_LLM_URL=http://127.0.0.1:8001/v1/completions
+
+Serves ``/v1/chat/completions`` (optionally streamed as server-sent events) and the
+``/v1/completions`` shape used for the backup LLM. Each call waits ``latency`` seconds
+(plus up to ``jitter``) before the first token, then emits tokens at
+``tokens_per_second``. A fraction ``error_rate`` of calls fails with ``error_status``,
+with a Retry-After header when ``retry_after`` is set (e.g. to mimic 429 rate limiting).
+"""
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional
+
+MINUTES_TEMPLATE = [
+    "**Meeting Summary**", "",
+    "The team reviewed the {topic} and agreed on the next steps.", "",
+    "**Attendees**", "",
+    "- Alice", "- Bob", "- Carmen", "",
+    "**Categories**", "",
+    "- {topic}", "- Planning", "",
+    "**Conclusions**", "",
+    "The {topic} plan was approved pending a final review.", "",
+    "**Action Items**", "",
+    "1. Alice to circulate the updated {topic} plan.",
+    "2. Bob to confirm the budget with finance.",
+]
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count, about four characters per token."""
+    return max(1, len(text) // 4)
+
+
+def completion_words(prompt: str, max_tokens: int) -> List[str]:
+    """Deterministic minutes-shaped text, roughly ``max_tokens`` tokens long."""
+    topic = 'budget' if 'budget' in prompt.lower() else 'roadmap'
+    base = '\n'.join(MINUTES_TEMPLATE).format(topic=topic)
+    words = base.split(' ')
+    while estimate_tokens(' '.join(words)) < max_tokens:
+        words.extend(f"Discussion point {len(words)} on the {topic} was noted.".split(' '))
+    return words[:max(1, max_tokens * 3 // 4)]
+
+
+class MockLLMServer:
+    """Threaded HTTP server exposing the mock endpoints; usable in-process or from the CLI."""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 tokens_per_second: float = 0.0, completion_tokens: int = 300, error_rate: float = 0.0,
+                 error_status: int = 500, retry_after: Optional[float] = None, seed: Optional[int] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.tokens_per_second = tokens_per_second
+        self.completion_tokens = completion_tokens
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "errors": 0, "streams": 0, "in_flight": 0, "max_in_flight": 0}
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> 'MockLLMServer':
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def _begin(self) -> bool:
+        """Count a request and decide whether it fails."""
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["in_flight"] += 1
+            self._stats["max_in_flight"] = max(self._stats["max_in_flight"], self._stats["in_flight"])
+            fail = self._random.random() < self.error_rate
+            if fail:
+                self._stats["errors"] += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+        time.sleep(delay)
+        return fail
+
+    def _end(self) -> None:
+        with self._lock:
+            self._stats["in_flight"] -= 1
+
+    def _token_delay(self) -> float:
+        return 1.0 / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def _send_json(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                if self.path.rstrip('/') in ('/health', '/v1/health'):
+                    self._send_json(200, {"status": "ok"})
+                elif self.path.rstrip('/') in ('/stats', '/v1/stats'):
+                    self._send_json(200, server.stats())
+                else:
+                    self._send_json(404, {"error": "not found"})
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                try:
+                    body = json.loads(self.rfile.read(length) or b'{}')
+                except ValueError:
+                    self._send_json(400, {"error": "invalid JSON"})
+                    return
+
+                path = self.path.split('?')[0].rstrip('/')
+                if path.endswith('/chat/completions'):
+                    prompt = '\n'.join(str(m.get('content', '')) for m in body.get('messages', []))
+                    chat = True
+                elif path.endswith('/completions'):
+                    prompt = str(body.get('prompt', ''))
+                    chat = False
+                else:
+                    self._send_json(404, {"error": "not found"})
+                    return
+
+                try:
+                    if server._begin():
+                        headers = {'Retry-After': f"{server.retry_after:g}"} if server.retry_after is not None else None
+                        self._send_json(server.error_status, {"error": "injected failure"}, headers)
+                        return
+                    max_tokens = min(int(body.get('max_tokens') or server.completion_tokens), server.completion_tokens)
+                    words = completion_words(prompt, max_tokens)
+                    if body.get('stream'):
+                        self._stream(words, prompt, chat, body.get('model'))
+                    else:
+                        self._complete(words, prompt, chat, body.get('model'))
+                finally:
+                    server._end()
+
+            def _usage(self, prompt: str, text: str) -> Dict[str, int]:
+                prompt_tokens, completion_tokens = estimate_tokens(prompt), estimate_tokens(text)
+                return {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                        "total_tokens": prompt_tokens + completion_tokens}
+
+            def _complete(self, words: List[str], prompt: str, chat: bool, model: Optional[str]) -> None:
+                time.sleep(server._token_delay() * len(words))
+                text = ' '.join(words)
+                if chat:
+                    choice = {"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}
+                    body = {"object": "chat.completion", "model": model, "choices": [choice]}
+                else:
+                    # Both the OpenAI completions shape and the generated_text field the API reads
+                    body = {"object": "text_completion", "model": model, "generated_text": text,
+                            "choices": [{"index": 0, "text": text, "finish_reason": "stop"}]}
+                body["usage"] = self._usage(prompt, text)
+                self._send_json(200, body)
+
+            def _stream(self, words: List[str], prompt: str, chat: bool, model: Optional[str]) -> None:
+                with server._lock:
+                    server._stats["streams"] += 1
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Cache-Control', 'no-cache')
+                self.send_header('Connection', 'close')
+                self.end_headers()
+                self.close_connection = True
+
+                def events() -> Iterator[Dict[str, Any]]:
+                    for i, word in enumerate(words):
+                        piece = word if i == 0 else ' ' + word
+                        choice = {"index": 0, "delta": {"content": piece}} if chat else {"index": 0, "text": piece}
+                        yield {"model": model, "choices": [choice]}
+                    yield {"model": model, "choices": [], "usage": self._usage(prompt, ' '.join(words))}
+
+                token_delay = server._token_delay()
+                try:
+                    for event in events():
+                        self.wfile.write(f"data: {json.dumps(event)}\n\n".encode())
+                        self.wfile.flush()
+                        if token_delay:
+                            time.sleep(token_delay)
+                    self.wfile.write(b"data: [DONE]\n\n")
+                    self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8001)
+    parser.add_argument('--latency', type=float, default=0.5, help='Seconds before the first token')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Extra random latency, up to this many seconds')
+    parser.add_argument('--tokens-per-second', type=float, default=0.0, help='Generation rate; 0 is instant')
+    parser.add_argument('--completion-tokens', type=int, default=300, help='Upper bound on completion length')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of calls that fail')
+    parser.add_argument('--error-status', type=int, default=500)
+    parser.add_argument('--retry-after', type=float, help='Retry-After seconds sent with injected failures')
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args()
+
+    server = MockLLMServer(
+        args.host, args.port, latency=args.latency, jitter=args.jitter, tokens_per_second=args.tokens_per_second,
+        completion_tokens=args.completion_tokens, error_rate=args.error_rate, error_status=args.error_status,
+        retry_after=args.retry_after, seed=args.seed
+    )
+    print(f"Mock LLM listening on {server.base_url} (chat: /chat/completions, backup: /completions)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,248 @@
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from fpdf import FPDF
+
+FONT_FAMILY = "Arial"
+TITLE_SIZE = 16
+BODY_SIZE = 12
+HEADING_SIZES = {1: 16, 2: 14, 3: 13}
+LINE_HEIGHT = 7
+PARAGRAPH_SPACING = 2
+BULLET_INDENT = 6
+
+# Block-level patterns, tried once per line
+_HEADING = re.compile(r'^\s{0,3}(#{1,6})\s+(.*?)\s*#*\s*$')
+_BULLET = re.compile(r'^(\s*)[-*+]\s+(.*)$')
+_NUMBERED = re.compile(r'^(\s*)(\d+[.)])\s+(.*)$')
+_RULE = re.compile(r'^\s{0,3}([-*_])(\s*\1){2,}\s*$')
+
+# Inline emphasis: **bold**, __bold__ and *italic*
+_INLINE = re.compile(r'(\*\*|__)(.+?)\1|(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?![\w*])')
+_WORDS = re.compile(r'\S+|\s+')
+
+# Core PDF fonts only cover cp1252; cache per-character fallbacks for everything else
+_CHAR_MAP: Dict[str, str] = {}
+
+Run = Tuple[str, str]  # (style, text) with style '', 'B', 'I' or 'BI'
+
+
+def to_pdf_text(text: str) -> str:
+    """Map text onto the cp1252 range that fpdf's core fonts can encode."""
+    if text.isascii():
+        return text
+    chars = []
+    for char in text:
+        mapped = _CHAR_MAP.get(char)
+        if mapped is None:
+            try:
+                mapped = chr(char.encode('cp1252')[0]) if ord(char) > 255 else char
+            except UnicodeEncodeError:
+                mapped = '?'
+            _CHAR_MAP[char] = mapped
+        chars.append(mapped)
+    return ''.join(chars)
+
+
+def parse_inline(text: str, base_style: str = '') -> List[Run]:
+    """Split a line into styled runs, merging adjacent runs that share a style."""
+    runs: List[Run] = []
+
+    def add(style: str, fragment: str) -> None:
+        if not fragment:
+            return
+        if runs and runs[-1][0] == style:
+            runs[-1] = (style, runs[-1][1] + fragment)
+        else:
+            runs.append((style, fragment))
+
+    position = 0
+    for match in _INLINE.finditer(text):
+        add(base_style, text[position:match.start()])
+        if match.group(2) is not None:
+            add(_combine(base_style, 'B'), match.group(2))
+        else:
+            add(_combine(base_style, 'I'), match.group(3))
+        position = match.end()
+    add(base_style, text[position:])
+    return runs
+
+
+def _combine(style: str, extra: str) -> str:
+    combined = set(style) | set(extra)
+    return ''.join(s for s in 'BI' if s in combined)
+
+
+def tokenize(markdown: str) -> Iterator[Tuple[str, dict]]:
+    """Tokenize minutes markdown into blocks: heading, bullet, paragraph, rule and blank."""
+    for line in markdown.split('\n'):
+        if not line.strip():
+            yield 'blank', {}
+            continue
+
+        match = _HEADING.match(line)
+        if match:
+            yield 'heading', {"level": len(match.group(1)), "runs": parse_inline(match.group(2), 'B')}
+            continue
+
+        if _RULE.match(line):
+            yield 'rule', {}
+            continue
+
+        match = _BULLET.match(line)
+        if match:
+            yield 'bullet', {"depth": len(match.group(1)) // 2, "marker": chr(149),
+                             "runs": parse_inline(match.group(2))}
+            continue
+
+        match = _NUMBERED.match(line)
+        if match:
+            yield 'bullet', {"depth": len(match.group(1)) // 2, "marker": match.group(2),
+                             "runs": parse_inline(match.group(3))}
+            continue
+
+        yield 'paragraph', {"runs": parse_inline(line.strip())}
+
+
+class MinutesPDFRenderer:
+    """Lays out minutes markdown in a single pass over the tokenized blocks.
+
+    Lines are broken here, word by word, from the core fonts' character widths, and
+    each line is emitted as one cell per style run, so mixed bold/italic/regular text
+    flows inline within a paragraph and the font is only switched when the style or
+    size actually changes.
+    """
+
+    def __init__(self):
+        self.pdf = FPDF()
+        self.pdf.set_auto_page_break(auto=True, margin=15)
+        self.pdf.c_margin = 0  # Runs are placed edge to edge; cell padding would open gaps
+        self._font = None
+        self._char_widths: Dict[str, Dict[str, int]] = {}  # style -> character -> width in font units
+
+    def _set_font(self, style: str, size: int) -> None:
+        if self._font != (style, size):
+            self.pdf.set_font(FONT_FAMILY, style=style, size=size)
+            self._font = (style, size)
+            if style not in self._char_widths:
+                self._char_widths[style] = self.pdf.current_font['cw']
+
+    def _style_widths(self, style: str, size: int) -> Dict[str, int]:
+        """Character widths of ``style`` in font units (1/1000 em), loaded on first use."""
+        if style not in self._char_widths:
+            self._set_font(style, self._font[1] if self._font else size)
+        return self._char_widths[style]
+
+    def _width(self, style: str, text: str, size: int) -> float:
+        """Width of ``text`` in user units."""
+        # to_pdf_text leaves only characters the core fonts' width tables cover
+        return sum(map(self._style_widths(style, size).__getitem__, text)) * size / 1000.0 / self.pdf.k
+
+    def _layout(self, runs: List[Run], size: int, first_width: float,
+                width: float) -> List[List[Tuple[str, str, float]]]:
+        """Break styled runs into lines of (style, text, width) fragments, word by word.
+
+        The first line is ``first_width`` wide and every following line ``width``.
+        """
+        lines: List[List[Tuple[str, str, float]]] = [[]]
+        line_width = 0.0
+        max_width = first_width
+
+        scale = size / 1000.0 / self.pdf.k
+        for style, text in runs:
+            char_width = self._style_widths(style, size).__getitem__
+            # Tokens of this run on the current line, emitted as one fragment
+            fragment: List[str] = []
+            fragment_width = 0.0
+            for token in _WORDS.findall(to_pdf_text(text)):
+                if token.isspace() and not (fragment or lines[-1]):
+                    continue  # No leading whitespace on a line
+                token_width = sum(map(char_width, token)) * scale
+                if line_width + token_width > max_width and (fragment or lines[-1]):
+                    if fragment:
+                        lines[-1].append((style, ''.join(fragment), fragment_width))
+                        fragment, fragment_width = [], 0.0
+                    lines.append([])
+                    line_width, max_width = 0.0, width
+                    if token.isspace():
+                        continue
+                while token_width > max_width:
+                    # A single word wider than a whole line: break it by characters
+                    head, token = self._split_word(style, token, size, max_width)
+                    lines[-1].append((style, head, self._width(style, head, size)))
+                    lines.append([])
+                    line_width, max_width = 0.0, width
+                    token_width = self._width(style, token, size)
+                fragment.append(token)
+                fragment_width += token_width
+                line_width += token_width
+            if fragment:
+                lines[-1].append((style, ''.join(fragment), fragment_width))
+
+        return lines
+
+    def _split_word(self, style: str, word: str, size: int, max_width: float) -> Tuple[str, str]:
+        """Split off the longest prefix of ``word`` that fits in ``max_width``."""
+        head = ''
+        for char in word:
+            if head and self._width(style, head + char, size) > max_width:
+                break
+            head += char
+        return head, word[len(head):]
+
+    def _write_runs(self, runs: List[Run], size: int, line_height: float,
+                    indent: Optional[float] = None) -> None:
+        """Write a paragraph from the current x position; wrapped lines start at ``indent``."""
+        pdf = self.pdf
+        indent = pdf.l_margin if indent is None else indent
+        right = pdf.w - pdf.r_margin
+        for number, line in enumerate(self._layout(runs, size, right - pdf.get_x(), right - indent)):
+            if number:
+                pdf.set_x(indent)
+            for style, text, width in line:
+                self._set_font(style, size)
+                pdf.cell(width, line_height, text)
+            pdf.ln(line_height)
+
+    def render(self, markdown: str, title: str = "Meeting Minutes") -> FPDF:
+        pdf = self.pdf
+        pdf.add_page()
+        left_margin = pdf.l_margin
+
+        self._set_font('B', TITLE_SIZE)
+        pdf.cell(0, 10, txt=to_pdf_text(title), ln=True, align="C")
+        pdf.ln(6)
+
+        previous = None
+        for kind, block in tokenize(markdown):
+            if kind == 'blank':
+                if previous not in (None, 'blank'):
+                    pdf.ln(PARAGRAPH_SPACING)
+            elif kind == 'heading':
+                size = HEADING_SIZES.get(block["level"], BODY_SIZE)
+                if previous not in (None, 'blank'):
+                    pdf.ln(PARAGRAPH_SPACING)
+                self._write_runs(block["runs"], size, LINE_HEIGHT + 1)
+            elif kind == 'rule':
+                pdf.line(left_margin, pdf.get_y() + 1, pdf.w - pdf.r_margin, pdf.get_y() + 1)
+                pdf.ln(PARAGRAPH_SPACING + 1)
+            elif kind == 'bullet':
+                indent = left_margin + BULLET_INDENT * (block["depth"] + 1)
+                self._set_font('', BODY_SIZE)
+                marker = to_pdf_text(block["marker"])
+                marker_width = self._width('', marker, BODY_SIZE)
+                pdf.set_x(max(left_margin, indent - marker_width - 2))
+                pdf.cell(marker_width, LINE_HEIGHT, marker)
+                # Wrapped lines hang under the item text rather than the marker
+                pdf.set_x(max(pdf.get_x() + 2, indent))
+                self._write_runs(block["runs"], BODY_SIZE, LINE_HEIGHT, indent=pdf.get_x())
+            else:
+                self._write_runs(block["runs"], BODY_SIZE, LINE_HEIGHT)
+            previous = kind
+
+        return pdf
+
+
+def render_minutes_pdf(meeting_minutes: str, output_pdf_path: str) -> None:
+    """Render minutes markdown to a PDF file."""
+    MinutesPDFRenderer().render(meeting_minutes).output(output_pdf_path)
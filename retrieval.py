@@ -0,0 +1,186 @@
+import re
+import json
+import logging
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from summarizer import split_transcript
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+_STOPWORDS = frozenset(
+    "a an and are as at be but by did do does for from had has have he her his how i if in into is it its "
+    "me my of on or our she so that the their them then there they this to was we were what when where "
+    "which who whom why will with would you your".split()
+)
+
+INDEX_FORMAT_VERSION = 1
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with common stopwords removed."""
+    return [token for token in _TOKEN.findall(text.lower()) if token not in _STOPWORDS]
+
+
+class PassageIndex:
+    """BM25 index over the passages of one transcript.
+
+    Postings are stored term-major (CSC-style): for term ``t`` the passages containing
+    it are ``doc_ids[indptr[t]:indptr[t + 1]]`` with matching ``term_freqs``. Scoring a
+    query gathers the postings of its terms and accumulates them with one bincount.
+    """
+
+    def __init__(self, passages: List[str], vocabulary: Dict[str, int], indptr: np.ndarray,
+                 doc_ids: np.ndarray, term_freqs: np.ndarray, doc_lengths: np.ndarray,
+                 k1: float = 1.5, b: float = 0.75):
+        self.passages = passages
+        self.vocabulary = vocabulary
+        self.indptr = indptr
+        self.doc_ids = doc_ids
+        self.term_freqs = term_freqs
+        self.doc_lengths = doc_lengths
+        self.k1 = k1
+        self.b = b
+
+        n_docs = len(passages)
+        doc_freqs = np.diff(indptr).astype(np.float64)
+        self.idf = np.log1p((n_docs - doc_freqs + 0.5) / (doc_freqs + 0.5))
+        avg_length = doc_lengths.mean() if n_docs else 0.0
+        self._length_norm = k1 * (1 - b + b * doc_lengths / avg_length) if avg_length else np.full(n_docs, k1)
+
+    @classmethod
+    def build(cls, passages: List[str]) -> 'PassageIndex':
+        vocabulary: Dict[str, int] = {}
+        term_ids: List[int] = []
+        doc_ids: List[int] = []
+        term_freqs: List[int] = []
+        doc_lengths = np.zeros(len(passages), dtype=np.float64)
+
+        for doc_id, passage in enumerate(passages):
+            tokens = tokenize(passage)
+            doc_lengths[doc_id] = len(tokens)
+            for term, count in Counter(tokens).items():
+                term_ids.append(vocabulary.setdefault(term, len(vocabulary)))
+                doc_ids.append(doc_id)
+                term_freqs.append(count)
+
+        term_array = np.asarray(term_ids, dtype=np.int64)
+        order = np.argsort(term_array, kind='stable')
+        indptr = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(term_array, minlength=len(vocabulary)), out=indptr[1:])
+
+        return cls(
+            passages, vocabulary, indptr,
+            np.asarray(doc_ids, dtype=np.int64)[order],
+            np.asarray(term_freqs, dtype=np.float64)[order],
+            doc_lengths
+        )
+
+    def scores(self, query: str) -> np.ndarray:
+        """BM25 score of every passage for ``query``."""
+        term_ids = {self.vocabulary[t] for t in tokenize(query) if t in self.vocabulary}
+        if not term_ids:
+            return np.zeros(len(self.passages))
+
+        slices = [np.arange(self.indptr[t], self.indptr[t + 1]) for t in term_ids]
+        postings = np.concatenate(slices)
+        posting_terms = np.repeat(np.fromiter(term_ids, dtype=np.int64), [len(s) for s in slices])
+
+        docs = self.doc_ids[postings]
+        tf = self.term_freqs[postings]
+        weights = self.idf[posting_terms] * tf * (self.k1 + 1) / (tf + self._length_norm[docs])
+        return np.bincount(docs, weights=weights, minlength=len(self.passages))
+
+    def top_passages(self, query: str, top_k: int) -> List[str]:
+        """The ``top_k`` best-matching passages, returned in transcript order."""
+        scores = self.scores(query)
+        if len(scores) <= top_k:
+            best = np.arange(len(scores))
+        else:
+            best = np.argpartition(-scores, top_k)[:top_k]
+        best = [i for i in best if scores[i] > 0] or list(best)
+        return [self.passages[i] for i in sorted(best)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": INDEX_FORMAT_VERSION,
+            "passages": self.passages,
+            "vocabulary": self.vocabulary,
+            "indptr": self.indptr.tolist(),
+            "doc_ids": self.doc_ids.tolist(),
+            "term_freqs": self.term_freqs.astype(np.int64).tolist(),
+            "doc_lengths": self.doc_lengths.astype(np.int64).tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PassageIndex':
+        return cls(
+            data["passages"], data["vocabulary"],
+            np.asarray(data["indptr"], dtype=np.int64),
+            np.asarray(data["doc_ids"], dtype=np.int64),
+            np.asarray(data["term_freqs"], dtype=np.float64),
+            np.asarray(data["doc_lengths"], dtype=np.float64)
+        )
+
+
+class PassageIndexStore:
+    """Builds passage indexes on demand and caches them in memory and in shared storage.
+
+    Indexes are keyed by the content digest of the transcript, so a stored index is
+    valid for as long as it exists and any replica can reuse one another built.
+    """
+
+    def __init__(self, passage_chars: int = 1200, max_in_memory: int = 32, storage=None):
+        self.passage_chars = passage_chars
+        self.max_in_memory = max_in_memory
+        self.storage = storage
+        self._indexes: 'OrderedDict[str, PassageIndex]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def index_key(self, digest: str) -> str:
+        return f"indexes/{digest}.{self.passage_chars}.json"
+
+    def get_or_build(self, digest: str, load_text: Callable[[], str]) -> PassageIndex:
+        with self._lock:
+            index = self._indexes.get(digest)
+            if index is not None:
+                self._indexes.move_to_end(digest)
+                return index
+
+        index = self._load_stored(digest)
+        if index is None:
+            index = PassageIndex.build(split_transcript(load_text(), self.passage_chars))
+            self._store(digest, index)
+
+        with self._lock:
+            self._indexes[digest] = index
+            while len(self._indexes) > self.max_in_memory:
+                self._indexes.popitem(last=False)
+        return index
+
+    def _load_stored(self, digest: str) -> Optional[PassageIndex]:
+        if self.storage is None:
+            return None
+        try:
+            data = json.loads(self.storage.read(self.index_key(digest)))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable passage index for {digest}: {e}")
+            return None
+
+        if data.get("version") != INDEX_FORMAT_VERSION or data.get("passage_chars") != self.passage_chars:
+            return None
+        return PassageIndex.from_dict(data)
+
+    def _store(self, digest: str, index: PassageIndex) -> None:
+        if self.storage is None:
+            return
+        data = index.to_dict()
+        data.update(passage_chars=self.passage_chars)
+        try:
+            self.storage.write(self.index_key(digest), json.dumps(data).encode('utf-8'))
+        except Exception as e:
+            logging.warning(f"Could not write passage index for {digest}: {e}")
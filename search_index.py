@@ -0,0 +1,335 @@
+import os
+import re
+import time
+import logging
+import sqlite3
+import datetime
+import threading
+from typing import Any, Dict, List, Optional
+
+from storage import Storage
+
+# Headings as the minutes prompt asks for them: '**Attendees**', '**Attendees:** Alice, Bob',
+# '## Action Items' or '- **Categories**:'
+_HEADING = re.compile(r'^\s*(?:[-*]\s+)?(?:#+\s*)?\*\*(?P<bold>[^*]+?)\*\*:?\s*(?P<rest>.*)$|^\s*#+\s*(?P<plain>.+?)\s*$')
+_LIST_ITEM = re.compile(r'^\s*(?:[-*+•]|\d+[.)])\s+')
+_SECTION_KEYWORDS = [
+    ('action_items', ('action item', 'action points', 'next step')),
+    ('attendees', ('attendee', 'participant', 'speaker', 'present')),
+    ('categories', ('categor', 'topic')),
+    ('summary', ('summary', 'overview')),
+    ('conclusions', ('conclusion', 'decision')),
+    ('date', ('date',)),
+]
+_DATE_FORMATS = ('%Y-%m-%d', '%B %d, %Y', '%b %d, %Y', '%d %B %Y', '%d %b %Y', '%B %d %Y', '%m/%d/%Y')
+_DATE_PATTERN = re.compile(
+    r'\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{4}|[A-Z][a-z]+\.? \d{1,2}(?:st|nd|rd|th)?,? \d{4}'
+    r'|\d{1,2}(?:st|nd|rd|th)? [A-Z][a-z]+ \d{4}'
+)
+
+
+def _section_name(heading: str) -> Optional[str]:
+    heading = heading.strip(' :*#').lower()
+    for name, keywords in _SECTION_KEYWORDS:
+        if any(keyword in heading for keyword in keywords):
+            return name
+    return None
+
+
+def _clean(item: str) -> str:
+    return _LIST_ITEM.sub('', item).replace('**', '').strip(' :-*')
+
+
+def _split_inline(text: str) -> List[str]:
+    return [part for part in (_clean(p) for p in re.split(r',|;|\band\b', text)) if part]
+
+
+def _person(item: str) -> str:
+    # 'Alice (Product)', 'Alice - Product', 'Alice: Product' -> 'Alice'
+    return re.split(r'\s*[(:–—]|\s+-\s+', item, maxsplit=1)[0].strip()
+
+
+def parse_date(text: str) -> Optional[str]:
+    """First recognisable date in ``text`` as YYYY-MM-DD, or None."""
+    for match in _DATE_PATTERN.finditer(text):
+        candidate = re.sub(r'(\d)(st|nd|rd|th)', r'\1', match.group(0)).replace('.', '')
+        for fmt in _DATE_FORMATS:
+            try:
+                return datetime.datetime.strptime(candidate, fmt).date().isoformat()
+            except ValueError:
+                continue
+    return None
+
+
+def parse_minutes(minutes: str) -> Dict[str, Any]:
+    """Pull the summary, attendees, categories, action items and date out of markdown minutes."""
+    sections: Dict[str, List[str]] = {}
+    current: Optional[str] = None
+    for line in minutes.splitlines():
+        if not line.strip():
+            continue
+        match = _HEADING.match(line)
+        if match:
+            heading = match.group('bold') or match.group('plain')
+            name = _section_name(heading)
+            if name is not None or not (match.group('rest') or _LIST_ITEM.match(line)):
+                # A bold phrase inside a paragraph or list item is not a heading unless it names a section
+                current = name
+                rest = (match.group('rest') or '').strip()
+                if name is not None and rest:
+                    sections.setdefault(name, []).append(rest)
+                continue
+        if current is not None:
+            sections.setdefault(current, []).append(line)
+
+    def items(name: str) -> List[str]:
+        found: List[str] = []
+        for line in sections.get(name, []):
+            if _LIST_ITEM.match(line) or name not in ('attendees', 'categories'):
+                found.append(_clean(line))
+            else:
+                found.extend(_split_inline(line))
+        return [item for item in found if item]
+
+    attendees = []
+    for item in items('attendees'):
+        name = _person(item)
+        if name and name.lower() not in (a.lower() for a in attendees):
+            attendees.append(name)
+
+    date_text = ' '.join(sections.get('date', [])) or minutes[:2000]
+    return {
+        "summary": ' '.join(items('summary') + items('conclusions')),
+        "attendees": attendees,
+        "categories": items('categories'),
+        "action_items": items('action_items'),
+        "meeting_date": parse_date(date_text),
+    }
+
+
+def fts_query(text: str) -> str:
+    """Quote every term so user input cannot be read as FTS5 query syntax."""
+    terms = re.findall(r'\w+', text)
+    return ' '.join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+class MinutesSearchIndex:
+    """SQLite FTS5 index over generated minutes, with attendee, category and date filters.
+
+    Each meeting is indexed when its minutes are stored and replaced if they are
+    generated again, so search never calls the LLM and stays fast across thousands of
+    meetings. The file can be shared by every worker process on a host.
+
+    The index is a local cache of the minutes in ``source`` (``*<suffix>`` objects at
+    its top level): the first search backfills it and later searches re-sync it in the
+    background at most every ``sync_interval`` seconds, picking up minutes generated by
+    other hosts or replicas. The file and its tables are created on first use.
+    """
+
+    def __init__(self, path: str, source: Optional[Storage] = None, suffix: str = '.md',
+                 sync_interval: float = 60.0):
+        self.path = path
+        self.source = source
+        self.suffix = suffix
+        self.sync_interval = sync_interval
+        self._write_lock = threading.Lock()
+        self._ready = False
+        self._ready_lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._synced_at: Optional[float] = None
+
+    def _create(self) -> None:
+        with self._ready_lock:
+            if self._ready:
+                return
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with sqlite3.connect(self.path, timeout=10) as conn:
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute(
+                    'CREATE TABLE IF NOT EXISTS meetings ('
+                    'meeting_id TEXT PRIMARY KEY, fts_rowid INTEGER NOT NULL, meeting_date TEXT, attendees TEXT NOT NULL, '
+                    'categories TEXT NOT NULL, action_items TEXT NOT NULL, indexed_at REAL NOT NULL)'
+                )
+                conn.execute('CREATE INDEX IF NOT EXISTS meetings_date ON meetings (meeting_date)')
+                conn.execute('CREATE UNIQUE INDEX IF NOT EXISTS meetings_fts_rowid ON meetings (fts_rowid)')
+                conn.execute('CREATE TABLE IF NOT EXISTS meeting_attendees (meeting_id TEXT NOT NULL, name TEXT NOT NULL)')
+                conn.execute('CREATE INDEX IF NOT EXISTS meeting_attendees_name ON meeting_attendees (name, meeting_id)')
+                conn.execute('CREATE TABLE IF NOT EXISTS meeting_categories (meeting_id TEXT NOT NULL, name TEXT NOT NULL)')
+                conn.execute('CREATE INDEX IF NOT EXISTS meeting_categories_name ON meeting_categories (name, meeting_id)')
+                conn.execute(
+                    'CREATE VIRTUAL TABLE IF NOT EXISTS minutes_fts USING fts5('
+                    "meeting_id UNINDEXED, summary, attendees, categories, action_items, body, tokenize='porter unicode61')"
+                )
+            self._ready = True
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._ready:
+            self._create()
+        # A short-lived connection per operation keeps this safe across threads and processes
+        return sqlite3.connect(self.path, timeout=10)
+
+    def sync(self) -> int:
+        """Index minutes in ``source`` that are new or changed and drop ones that are gone.
+
+        Returns how many meetings were added, replaced or removed.
+        """
+        # Read the index before listing: anything indexed by then is already stored,
+        # so minutes saved while this runs are never mistaken for deleted ones
+        with self._connect() as conn:
+            indexed = dict(conn.execute('SELECT meeting_id, indexed_at FROM meetings').fetchall())
+        stored = {
+            obj.key[:-len(self.suffix)]: obj.modified
+            for obj in self.source.list(recursive=False) if obj.key.endswith(self.suffix)
+        }
+
+        changed = 0
+        for meeting_id, modified in stored.items():
+            if indexed.get(meeting_id, float('-inf')) >= modified:
+                continue
+            try:
+                minutes = self.source.read(f"{meeting_id}{self.suffix}").decode('utf-8')
+            except FileNotFoundError:
+                continue
+            self.index(meeting_id, minutes)
+            changed += 1
+        for meeting_id in indexed.keys() - stored.keys():
+            self.remove(meeting_id)
+            changed += 1
+        return changed
+
+    def _run_sync(self) -> None:
+        try:
+            changed = self.sync()
+            if changed:
+                logging.info(f"Search index synced {changed} meetings from storage")
+        except Exception as e:
+            logging.warning(f"Could not sync the search index from storage: {e}")
+        finally:
+            self._synced_at = time.monotonic()
+
+    def _sync_in_background(self) -> None:
+        try:
+            self._run_sync()
+        finally:
+            self._sync_lock.release()
+
+    def _maybe_sync(self) -> None:
+        if self.source is None:
+            return
+        if self._synced_at is None:
+            # Backfill before the first search so it sees every stored meeting
+            with self._sync_lock:
+                if self._synced_at is None:
+                    self._run_sync()
+            return
+        if time.monotonic() - self._synced_at < self.sync_interval or not self._sync_lock.acquire(blocking=False):
+            return
+        threading.Thread(target=self._sync_in_background, name='search-sync', daemon=True).start()
+
+    def index(self, meeting_id: str, minutes: str) -> Dict[str, Any]:
+        """Add or replace one meeting; returns the fields parsed from its minutes."""
+        parsed = parse_minutes(minutes)
+        with self._write_lock, self._connect() as conn:
+            self._delete(conn, meeting_id)
+            fts_rowid = conn.execute(
+                'INSERT INTO minutes_fts (meeting_id, summary, attendees, categories, action_items, body) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (meeting_id, parsed["summary"], ' '.join(parsed["attendees"]), ' '.join(parsed["categories"]),
+                 ' '.join(parsed["action_items"]), minutes)
+            ).lastrowid
+            conn.execute(
+                'INSERT INTO meetings (meeting_id, fts_rowid, meeting_date, attendees, categories, action_items, '
+                'indexed_at) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (meeting_id, fts_rowid, parsed["meeting_date"], '\n'.join(parsed["attendees"]),
+                 '\n'.join(parsed["categories"]), '\n'.join(parsed["action_items"]), time.time())
+            )
+            conn.executemany('INSERT INTO meeting_attendees (meeting_id, name) VALUES (?, ?)',
+                             [(meeting_id, name.lower()) for name in parsed["attendees"]])
+            conn.executemany('INSERT INTO meeting_categories (meeting_id, name) VALUES (?, ?)',
+                             [(meeting_id, name.lower()) for name in parsed["categories"]])
+        return parsed
+
+    def remove(self, meeting_id: str) -> None:
+        with self._write_lock, self._connect() as conn:
+            self._delete(conn, meeting_id)
+
+    def _delete(self, conn: sqlite3.Connection, meeting_id: str) -> None:
+        row = conn.execute('SELECT fts_rowid FROM meetings WHERE meeting_id = ?', (meeting_id,)).fetchone()
+        if row is not None:
+            conn.execute('DELETE FROM minutes_fts WHERE rowid = ?', row)
+        for table in ('meetings', 'meeting_attendees', 'meeting_categories'):
+            conn.execute(f'DELETE FROM {table} WHERE meeting_id = ?', (meeting_id,))
+
+    def search(self, query: str = '', attendee: Optional[str] = None, category: Optional[str] = None,
+               date_from: Optional[str] = None, date_to: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """Meetings matching every given filter, best full-text matches first (newest first without a query)."""
+        self._maybe_sync()
+        match = fts_query(query)
+        conditions, params = [], []
+        if match:
+            conditions.append('minutes_fts MATCH ?')
+            params.append(match)
+        if attendee:
+            # Substring match so 'alice' finds 'Alice Smith'
+            conditions.append(
+                'm.meeting_id IN (SELECT meeting_id FROM meeting_attendees WHERE name LIKE ? ESCAPE \'\\\')'
+            )
+            params.append(f"%{_like_escape(attendee.lower())}%")
+        if category:
+            conditions.append(
+                'm.meeting_id IN (SELECT meeting_id FROM meeting_categories WHERE name LIKE ? ESCAPE \'\\\')'
+            )
+            params.append(f"%{_like_escape(category.lower())}%")
+        if date_from:
+            conditions.append('m.meeting_date >= ?')
+            params.append(date_from)
+        if date_to:
+            conditions.append('m.meeting_date <= ?')
+            params.append(date_to)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        columns = 'm.meeting_id, m.meeting_date, m.attendees, m.categories, m.action_items'
+        if match:
+            # Rank and filter first, driven by the full-text match (CROSS JOIN fixes the join order);
+            # snippets are only built for the rows that are returned
+            top = (
+                'SELECT minutes_fts.rowid FROM minutes_fts CROSS JOIN meetings m ON m.fts_rowid = minutes_fts.rowid '
+                f'{where} ORDER BY minutes_fts.rank LIMIT ?'
+            )
+            sql = (
+                f"SELECT {columns}, snippet(minutes_fts, 5, '[', ']', '...', 16), minutes_fts.rank "
+                'FROM minutes_fts CROSS JOIN meetings m ON m.fts_rowid = minutes_fts.rowid '
+                f'WHERE minutes_fts MATCH ? AND minutes_fts.rowid IN ({top}) ORDER BY minutes_fts.rank'
+            )
+            params = [match, *params]
+        else:
+            sql = (
+                f"SELECT {columns}, '', 0 FROM meetings m {where} "
+                'ORDER BY m.meeting_date IS NULL, m.meeting_date DESC, m.indexed_at DESC LIMIT ?'
+            )
+        with self._connect() as conn:
+            rows = conn.execute(sql, (*params, limit)).fetchall()
+
+        return [{
+            "meeting_id": meeting_id,
+            "meeting_date": meeting_date,
+            "attendees": _lines(attendees),
+            "categories": _lines(categories),
+            "action_items": _lines(action_items),
+            "snippet": snippet_text,
+            "score": -rank,  # FTS5 rank (bm25) is lower for better matches
+        } for meeting_id, meeting_date, attendees, categories, action_items, snippet_text, rank in rows]
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute('SELECT COUNT(*) FROM meetings').fetchone()[0]
+
+
+def _like_escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def _lines(text: str) -> List[str]:
+    return text.split('\n') if text else []
@@ -0,0 +1,71 @@
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from metrics import SINGLE_FLIGHT_COALESCED, SINGLE_FLIGHT_EXECUTED
+
+
+class _Call:
+    """One in-flight execution that duplicate callers wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one execution.
+
+    The first caller for a key runs the function; callers that arrive while it is still
+    running wait and receive the same result, or the same exception. Once the call
+    finishes the key is released, so later calls run again (or hit a cache).
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._in_flight: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._executed = 0
+        self._coalesced = 0
+        SINGLE_FLIGHT_EXECUTED.labels(name)
+        SINGLE_FLIGHT_COALESCED.labels(name)
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            self._calls += 1
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = self._in_flight[key] = _Call()
+                self._executed += 1
+            else:
+                self._coalesced += 1
+        (SINGLE_FLIGHT_EXECUTED if leader else SINGLE_FLIGHT_COALESCED).labels(self.name).inc()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "executed": self._executed,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._in_flight),
+                "coalesce_rate": self._coalesced / self._calls if self._calls else 0.0,
+            }
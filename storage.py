@@ -0,0 +1,318 @@
+import io
+import os
+import fcntl
+import shutil
+import hashlib
+import logging
+import tempfile
+import threading
+from typing import IO, Iterator, NamedTuple, Optional, Tuple, Union
+
+Source = Union[bytes, IO[bytes]]
+
+COPY_CHUNK = 1024 * 1024
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+
+class StoredObject(NamedTuple):
+    key: str
+    size: int
+    modified: float  # Seconds since the epoch
+
+
+def content_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class LocalStorage:
+    """Objects stored as files under a root directory; keys are relative paths."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def local_path(self, key: str) -> str:
+        path = os.path.normpath(os.path.join(self.root, key))
+        if os.path.commonpath([os.path.abspath(path), os.path.abspath(self.root)]) != os.path.abspath(self.root):
+            raise ValueError(f"Invalid storage key: {key}")
+        return path
+
+    def location(self, key: str) -> str:
+        return self.local_path(key)
+
+    def write(self, key: str, source: Source) -> None:
+        """Write an object atomically, copying file-like sources in chunks."""
+        path = self.local_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                if isinstance(source, bytes):
+                    f.write(source)
+                else:
+                    shutil.copyfileobj(source, f, COPY_CHUNK)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def open(self, key: str) -> IO[bytes]:
+        """Open an object for streaming reads; raises FileNotFoundError if it is missing."""
+        return open(self.local_path(key), 'rb')
+
+    def read_versioned(self, key: str) -> Tuple[bytes, str]:
+        """Read an object together with the version ``write_if_match`` expects."""
+        data = self.read(key)
+        return data, content_digest(data)
+
+    def write_if_match(self, key: str, data: bytes, version: Optional[str]) -> bool:
+        """Write ``data`` only if the object is still at ``version`` (None: only if it is missing).
+
+        Returns False when another writer got there first. Writers in every process on
+        the host are serialized by an fcntl lock file next to the object.
+        """
+        path = self.local_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f"{path}.lock", 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                try:
+                    current: Optional[str] = content_digest(self.read(key))
+                except FileNotFoundError:
+                    current = None
+                if current != version:
+                    return False
+                self.write(key, data)
+                return True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def read(self, key: str) -> bytes:
+        with self.open(key) as f:
+            return f.read()
+
+    def stat(self, key: str) -> Optional[StoredObject]:
+        try:
+            stat = os.stat(self.local_path(key))
+        except FileNotFoundError:
+            return None
+        return StoredObject(key, stat.st_size, stat.st_mtime)
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self.local_path(key))
+
+    def list(self, prefix: str = '', recursive: bool = True) -> Iterator[StoredObject]:
+        """Objects whose key starts with ``prefix``, in no particular order.
+
+        With ``recursive=False`` keys with a further '/' after the prefix are skipped.
+        """
+        parent = prefix.rpartition('/')[0]
+        top = self.local_path(parent) if parent else self.root
+        for directory, subdirectories, filenames in os.walk(top):
+            if not recursive:
+                subdirectories.clear()
+            for filename in filenames:
+                # Temp files of write() and lock files of write_if_match() are not objects
+                if filename.endswith(('.tmp', '.lock')):
+                    continue
+                path = os.path.join(directory, filename)
+                key = os.path.relpath(path, self.root).replace(os.sep, '/')
+                if not key.startswith(prefix):
+                    continue
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue  # Removed while listing
+                yield StoredObject(key, stat.st_size, stat.st_mtime)
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self.local_path(key))
+        except FileNotFoundError:
+            pass
+
+    def writable(self) -> bool:
+        return os.access(self.root, os.W_OK)
+
+
+class S3Storage:
+    """Objects in an S3-compatible bucket (AWS S3, MinIO, Ceph...) under a key prefix.
+
+    Writes go through ``upload_fileobj`` so large objects are sent as multipart
+    uploads without being buffered whole, and reads return the streaming body.
+    """
+
+    def __init__(self, bucket: str, prefix: str = '', endpoint_url: Optional[str] = None,
+                 region_name: Optional[str] = None, client=None):
+        if client is None:
+            import boto3
+            client = boto3.client('s3', endpoint_url=endpoint_url, region_name=region_name)
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def _key(self, key: str) -> str:
+        if key.startswith('/') or '..' in key.split('/'):
+            raise ValueError(f"Invalid storage key: {key}")
+        return f"{self.prefix}{key}"
+
+    def local_path(self, key: str) -> Optional[str]:
+        return None
+
+    def location(self, key: str) -> str:
+        return f"s3://{self.bucket}/{self._key(key)}"
+
+    def write(self, key: str, source: Source) -> None:
+        if isinstance(source, bytes):
+            source = io.BytesIO(source)
+        self.client.upload_fileobj(source, self.bucket, self._key(key))
+
+    def open(self, key: str) -> IO[bytes]:
+        """Stream an object's body; raises FileNotFoundError if it is missing."""
+        try:
+            return self.client.get_object(Bucket=self.bucket, Key=self._key(key))['Body']
+        except Exception as e:
+            if _is_not_found(e):
+                raise FileNotFoundError(key) from e
+            raise
+
+    def read(self, key: str) -> bytes:
+        body = self.open(key)
+        try:
+            return body.read()
+        finally:
+            body.close()
+
+    def read_versioned(self, key: str) -> Tuple[bytes, str]:
+        """Read an object together with its ETag, the version ``write_if_match`` expects."""
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=self._key(key))
+        except Exception as e:
+            if _is_not_found(e):
+                raise FileNotFoundError(key) from e
+            raise
+        try:
+            return response['Body'].read(), response['ETag']
+        finally:
+            response['Body'].close()
+
+    def write_if_match(self, key: str, data: bytes, version: Optional[str]) -> bool:
+        """Write ``data`` only if the object still has ETag ``version`` (None: only if it is missing).
+
+        Uses S3 conditional writes, so it is safe across processes and replicas. Returns
+        False when another writer got there first.
+        """
+        condition = {'IfMatch': version} if version is not None else {'IfNoneMatch': '*'}
+        try:
+            self.client.put_object(Bucket=self.bucket, Key=self._key(key), Body=data, **condition)
+        except Exception as e:
+            if _error_code(e) in ('412', 'PreconditionFailed', '409', 'ConditionalRequestConflict'):
+                return False
+            raise
+        return True
+
+    def stat(self, key: str) -> Optional[StoredObject]:
+        try:
+            head = self.client.head_object(Bucket=self.bucket, Key=self._key(key))
+        except Exception as e:
+            if _is_not_found(e):
+                return None
+            raise
+        return StoredObject(key, head['ContentLength'], head['LastModified'].timestamp())
+
+    def exists(self, key: str) -> bool:
+        return self.stat(key) is not None
+
+    def list(self, prefix: str = '', recursive: bool = True) -> Iterator[StoredObject]:
+        """Objects whose key starts with ``prefix``, in no particular order.
+
+        With ``recursive=False`` keys with a further '/' after the prefix are skipped.
+        """
+        paginator = self.client.get_paginator('list_objects_v2')
+        delimiter = {} if recursive else {'Delimiter': '/'}
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self._key(prefix), **delimiter):
+            for item in page.get('Contents', []):
+                yield StoredObject(item['Key'][len(self.prefix):], item['Size'], item['LastModified'].timestamp())
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(key))
+
+    def writable(self) -> bool:
+        try:
+            self.client.head_bucket(Bucket=self.bucket)
+            return True
+        except Exception as e:
+            logging.warning(f"Bucket {self.bucket} is not reachable: {e}")
+            return False
+
+
+def _error_code(error: Exception) -> str:
+    response = getattr(error, 'response', None) or {}
+    return str(response.get('Error', {}).get('Code'))
+
+
+def _is_not_found(error: Exception) -> bool:
+    return _error_code(error) in ('404', 'NoSuchKey', 'NotFound')
+
+
+Storage = Union[LocalStorage, S3Storage]
+
+
+class UploadStore:
+    """Uploaded transcripts stored under content-hash keys, with a name index.
+
+    The bytes live once at ``sha256/<digest>.docx`` and ``names/<filename>`` holds the
+    digest of the latest upload under that name. Anything derived from a transcript
+    (extracted text, passage indexes) can be keyed by digest and never goes stale.
+    """
+
+    BLOB_PREFIX = 'sha256/'
+    NAME_PREFIX = 'names/'
+
+    def __init__(self, storage: Storage):
+        self.storage = storage
+
+    def blob_key(self, digest: str) -> str:
+        return f"{self.BLOB_PREFIX}{digest}.docx"
+
+    def name_key(self, filename: str) -> str:
+        return f"{self.NAME_PREFIX}{os.path.basename(filename)}"
+
+    def save(self, filename: str, data: bytes) -> str:
+        """Store an upload and point ``filename`` at it; returns its digest."""
+        digest = content_digest(data)
+        if not self.storage.exists(self.blob_key(digest)):
+            self.storage.write(self.blob_key(digest), data)
+        self.storage.write(self.name_key(filename), digest.encode('ascii'))
+        return digest
+
+    def save_stream(self, filename: str, source: IO[bytes]) -> str:
+        """Like ``save`` for a file-like source, hashing while spooling it in chunks."""
+        hasher = hashlib.sha256()
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as spool:
+            while True:
+                chunk = source.read(COPY_CHUNK)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                spool.write(chunk)
+            digest = hasher.hexdigest()
+            if not self.storage.exists(self.blob_key(digest)):
+                spool.seek(0)
+                self.storage.write(self.blob_key(digest), spool)
+        self.storage.write(self.name_key(filename), digest.encode('ascii'))
+        return digest
+
+    def digest(self, filename: str) -> Optional[str]:
+        """Digest of the latest upload named ``filename``, or None if there is none."""
+        try:
+            return self.storage.read(self.name_key(filename)).decode('ascii').strip()
+        except FileNotFoundError:
+            pass
+        # Uploads saved before content-hash keys sit at their bare filename; index them once
+        legacy_key = os.path.basename(filename)
+        if self.storage.exists(legacy_key):
+            return self.save(filename, self.storage.read(legacy_key))
+        return None
+
+    def read(self, digest: str) -> bytes:
+        return self.storage.read(self.blob_key(digest))
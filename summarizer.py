@@ -0,0 +1,97 @@
+import re
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+# Sentence ends, used to break up single paragraphs that are longer than a chunk
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+
+def split_transcript(transcript: str, max_chars: int) -> List[str]:
+    """Split a transcript into chunks of at most ``max_chars`` characters.
+
+    Chunks break on paragraph (speaker turn) boundaries. A single paragraph that is
+    longer than ``max_chars`` is broken on sentence boundaries, and as a last resort
+    hard-wrapped.
+    """
+    chunks: List[str] = []
+    current: List[str] = []
+    current_len = 0
+
+    def flush():
+        nonlocal current, current_len
+        if current:
+            chunks.append('\n'.join(current))
+        current, current_len = [], 0
+
+    for paragraph in transcript.split('\n'):
+        if not paragraph.strip():
+            continue
+        for piece in _split_long_paragraph(paragraph, max_chars):
+            # +1 accounts for the newline joining paragraphs in a chunk
+            if current and current_len + len(piece) + 1 > max_chars:
+                flush()
+            current.append(piece)
+            current_len += len(piece) + 1
+    flush()
+    return chunks
+
+
+def _split_long_paragraph(paragraph: str, max_chars: int) -> List[str]:
+    if len(paragraph) <= max_chars:
+        return [paragraph]
+
+    pieces: List[str] = []
+    current = ''
+    for sentence in _SENTENCE_END.split(paragraph):
+        while len(sentence) > max_chars:
+            if current:
+                pieces.append(current)
+                current = ''
+            pieces.append(sentence[:max_chars])
+            sentence = sentence[max_chars:]
+        if current and len(current) + len(sentence) + 1 > max_chars:
+            pieces.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+class ChunkedSummarizer:
+    """Map-reduce summarization of long transcripts.
+
+    Chunks are summarized in parallel on a bounded thread pool (map), then the partial
+    notes are combined into the final minutes in a single call (reduce).
+    """
+
+    def __init__(self, max_chunk_chars: int = 24000, max_workers: int = 4):
+        self.max_chunk_chars = max_chunk_chars
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='minutes-map')
+
+    def needs_chunking(self, transcript: str) -> bool:
+        return len(transcript) > self.max_chunk_chars
+
+    def map_notes(self, transcript: str, summarize_chunk: Callable[[str, int, int], str]) -> List[str]:
+        """Summarize every chunk of ``transcript`` in parallel and return the notes in order.
+
+        ``summarize_chunk`` is called as ``(chunk, index, total)`` and must raise on
+        failure so that a partial set of notes is never reduced into minutes.
+        """
+        chunks = split_transcript(transcript, self.max_chunk_chars)
+        logging.info(f"Summarizing transcript of {len(transcript)} chars in {len(chunks)} chunks")
+
+        futures = [
+            self._executor.submit(summarize_chunk, chunk, index, len(chunks))
+            for index, chunk in enumerate(chunks, start=1)
+        ]
+        return [future.result() for future in futures]
+
+    def summarize(self, transcript: str,
+                  summarize_chunk: Callable[[str, int, int], str],
+                  reduce_notes: Callable[[List[str]], str]) -> str:
+        """Summarize ``transcript`` chunk by chunk and reduce the notes to final minutes."""
+        return reduce_notes(self.map_notes(transcript, summarize_chunk))
@@ -0,0 +1,106 @@
+import time
+
+import pytest
+
+from failover import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError, FailoverCaller
+from llm_scheduler import LLMBusyError, LLMThrottledError
+
+
+def opened_breaker(name='primary', **kwargs):
+    breaker = CircuitBreaker(name, window_size=4, min_calls=2, open_seconds=0.1, **kwargs)
+    breaker.record_failure(0.01)
+    breaker.record_failure(0.01)
+    assert breaker.state == OPEN
+    return breaker
+
+
+def test_breaker_opens_on_error_rate_and_refuses_calls():
+    breaker = CircuitBreaker('primary', window_size=4, min_calls=2)
+    breaker.record_failure(0.01)
+    assert breaker.state == CLOSED  # Below min_calls
+    breaker.record_failure(0.01)
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+
+
+def test_half_open_probe_success_closes_the_circuit():
+    breaker = opened_breaker()
+    time.sleep(0.15)
+    assert breaker.allow_request()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow_request()  # Only one probe at a time
+    breaker.record_success(0.01)
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["window_calls"] == 0
+
+
+def test_half_open_probe_failure_reopens_the_circuit():
+    breaker = opened_breaker()
+    time.sleep(0.15)
+    assert breaker.allow_request()
+    breaker.record_failure(0.01)
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+    assert breaker.snapshot()["times_opened"] == 2
+
+
+def test_slow_half_open_probe_reopens_the_circuit():
+    breaker = opened_breaker(slow_call_seconds=1.0)
+    time.sleep(0.15)
+    assert breaker.allow_request()
+    breaker.record_success(2.0)
+    assert breaker.state == OPEN
+
+
+def test_released_probe_can_be_retried():
+    breaker = opened_breaker()
+    time.sleep(0.15)
+    assert breaker.allow_request()
+    breaker.release()
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow_request()
+
+
+def caller(**kwargs):
+    return FailoverCaller(
+        CircuitBreaker('primary', window_size=4, min_calls=2), CircuitBreaker('backup', window_size=4, min_calls=2),
+        local_errors=(LLMBusyError,), **kwargs
+    )
+
+
+def test_throttled_primary_fails_over_to_backup():
+    failover = caller()
+
+    def throttled():
+        raise LLMThrottledError("rate limited", 1)
+
+    assert failover.call('minutes', throttled, lambda: 'backup') == 'backup'
+    snapshot = failover.snapshot()
+    assert snapshot["counts"]["fallbacks"] == 1
+    assert snapshot["primary"]["error_rate"] == 1.0
+
+
+def test_local_busy_error_neither_fails_over_nor_counts_against_primary():
+    failover = caller()
+    backup_calls = []
+
+    def busy():
+        raise LLMBusyError("queue full", 2)
+
+    with pytest.raises(LLMBusyError):
+        failover.call('minutes', busy, lambda: backup_calls.append(1))
+    assert backup_calls == []
+    assert failover.snapshot()["primary"]["window_calls"] == 0
+
+
+def test_open_primary_goes_straight_to_backup():
+    failover = caller()
+    failover.primary.record_failure(0.01)
+    failover.primary.record_failure(0.01)
+
+    def primary():
+        raise AssertionError("primary must not be called while its circuit is open")
+
+    assert failover.call('minutes', primary, lambda: 'backup') == 'backup'
+    with pytest.raises(CircuitOpenError):
+        failover.call('minutes', primary)
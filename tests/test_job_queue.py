@@ -0,0 +1,67 @@
+import time
+import multiprocessing
+
+from job_queue import JobQueue
+from storage import LocalStorage
+
+
+def slow_answer(seconds: float):
+    time.sleep(seconds)
+    return {"answer": 42}
+
+
+def failing_job():
+    raise ValueError("transcript is empty")
+
+
+def run_jobs(root: str, job_ids) -> None:
+    queue = JobQueue(max_workers=2, storage=LocalStorage(root))
+    job_ids.put(queue.submit(slow_answer, 0.5, description={"filename": "weekly.docx"}).job_id)
+    job_ids.put(queue.submit(failing_job).job_id)
+    queue.shutdown(wait=True)
+
+
+def test_jobs_run_by_another_process_can_be_polled(tmp_path):
+    context = multiprocessing.get_context('spawn')
+    job_ids = context.Queue()
+    process = context.Process(target=run_jobs, args=(str(tmp_path), job_ids))
+    process.start()
+    slow_id, failing_id = job_ids.get(timeout=30), job_ids.get(timeout=30)
+
+    queue = JobQueue(storage=LocalStorage(str(tmp_path)), poll_interval=0.05)
+    job = queue.get(slow_id)
+    assert job.status in ('queued', 'running')
+    assert job.description == {"filename": "weekly.docx"}
+
+    job = queue.get(slow_id, wait=30)
+    assert job.status == 'completed'
+    assert job.result == {"answer": 42}
+    failed = queue.get(failing_id, wait=30)
+    assert failed.status == 'failed'
+    assert failed.error == "transcript is empty"
+
+    process.join(30)
+    assert process.exitcode == 0
+    queue.shutdown()
+
+
+def test_unknown_and_malformed_job_ids_are_not_found(tmp_path):
+    storage = LocalStorage(str(tmp_path))
+    storage.write('secret.json', b'{}')
+    queue = JobQueue(storage=storage)
+    assert queue.get('0' * 32) is None
+    assert queue.get('../secret') is None
+    queue.shutdown()
+
+
+def test_expired_results_are_dropped_from_storage(tmp_path):
+    storage = LocalStorage(str(tmp_path))
+    queue = JobQueue(storage=storage, result_ttl=0)
+    job = queue.submit(slow_answer, 0)
+    assert job.wait(5)
+    assert storage.exists(f"jobs/{job.job_id}.json")
+
+    queue.submit(slow_answer, 0)  # Submitting evicts expired jobs
+    assert not storage.exists(f"jobs/{job.job_id}.json")
+    assert JobQueue(storage=storage, result_ttl=0).get(job.job_id) is None
+    queue.shutdown()
@@ -0,0 +1,57 @@
+import multiprocessing
+
+import pytest
+
+from live_sessions import LiveSessionManager, SessionFinalizedError, SessionNotFoundError
+from storage import LocalStorage
+
+PROCESSES = 4
+APPENDS = 25
+
+
+def concat(summary: str, text: str) -> str:
+    return summary + text + '\n'
+
+
+def append_segments(root: str, session_id: str, worker: int) -> None:
+    # Small update_chars so every process also folds, racing the others
+    manager = LiveSessionManager(LocalStorage(root), concat, update_chars=40)
+    for i in range(APPENDS):
+        manager.append(session_id, [f"worker {worker} segment {i}"])
+    manager.shutdown(wait=True)
+
+
+def test_appends_from_several_processes_are_all_kept_and_folded_once(tmp_path):
+    root = str(tmp_path)
+    manager = LiveSessionManager(LocalStorage(root), concat, update_chars=40)
+    session = manager.create('standup')
+
+    context = multiprocessing.get_context('spawn')
+    processes = [context.Process(target=append_segments, args=(root, session.session_id, worker))
+                 for worker in range(PROCESSES)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(60)
+        assert process.exitcode == 0
+
+    session = manager.finalize(session.session_id)
+    expected = sorted(f"worker {w} segment {i}" for w in range(PROCESSES) for i in range(APPENDS))
+    assert session.segments == PROCESSES * APPENDS
+    assert session.pending == []
+    assert session.summarized_chars == session.transcript_chars
+    assert sorted(session.summary.splitlines()) == expected
+    manager.shutdown()
+
+
+def test_finalized_session_rejects_appends(tmp_path):
+    manager = LiveSessionManager(LocalStorage(str(tmp_path)), concat)
+    session = manager.create()
+    manager.append(session.session_id, ['hello'])
+    assert manager.finalize(session.session_id).summary == 'hello\n'
+
+    with pytest.raises(SessionFinalizedError):
+        manager.append(session.session_id, ['too late'])
+    with pytest.raises(SessionNotFoundError):
+        manager.append('../' + session.session_id, ['x'])
+    manager.shutdown()
@@ -0,0 +1,100 @@
+import time
+import threading
+from email.utils import formatdate
+
+import pytest
+
+from llm_scheduler import BATCH, INTERACTIVE, LLMBusyError, LLMScheduler, parse_retry_after
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        time.sleep(0.01)
+
+
+def test_interactive_calls_start_before_queued_batch_calls():
+    scheduler = LLMScheduler(max_concurrency=1)
+    holder = scheduler.acquire(INTERACTIVE)
+    started = []
+
+    def call(lane):
+        ticket = scheduler.acquire(lane)
+        started.append(lane)
+        scheduler.release(ticket)
+
+    batch = threading.Thread(target=call, args=(BATCH,))
+    batch.start()
+    wait_until(lambda: scheduler.stats()["queued"][BATCH] == 1)
+    interactive = threading.Thread(target=call, args=(INTERACTIVE,))
+    interactive.start()
+    wait_until(lambda: scheduler.stats()["queued"][INTERACTIVE] == 1)
+
+    scheduler.release(holder)
+    batch.join(5)
+    interactive.join(5)
+    assert started == [INTERACTIVE, BATCH]
+
+
+def test_calls_wait_for_the_token_budget_to_refill():
+    scheduler = LLMScheduler(tokens_per_minute=6000)  # 100 tokens a second
+    scheduler.release(scheduler.acquire(INTERACTIVE, tokens=6000))
+
+    start = time.monotonic()
+    scheduler.release(scheduler.acquire(INTERACTIVE, tokens=50))
+    assert 0.3 <= time.monotonic() - start < 2.0
+
+
+def test_release_settles_the_estimate_against_used_tokens():
+    scheduler = LLMScheduler(tokens_per_minute=6000)
+    ticket = scheduler.acquire(INTERACTIVE, tokens=1000)
+    assert scheduler.stats()["tokens_available"] <= 5100
+    ticket.used_tokens = 100
+    scheduler.release(ticket)
+    assert scheduler.stats()["tokens_available"] >= 5900
+
+
+def test_full_lane_is_rejected_with_retry_after():
+    scheduler = LLMScheduler(max_concurrency=1, max_queue={INTERACTIVE: 1})
+    holder = scheduler.acquire(INTERACTIVE)
+    waiter = threading.Thread(target=lambda: scheduler.release(scheduler.acquire(INTERACTIVE)))
+    waiter.start()
+    wait_until(lambda: scheduler.stats()["queued"][INTERACTIVE] == 1)
+
+    with pytest.raises(LLMBusyError) as excinfo:
+        scheduler.acquire(INTERACTIVE)
+    assert excinfo.value.retry_after >= 1
+    assert scheduler.stats()["lanes"][INTERACTIVE]["rejected"] == 1
+
+    scheduler.release(holder)
+    waiter.join(5)
+
+
+def test_retry_after_covers_the_tokens_of_queued_calls():
+    scheduler = LLMScheduler(tokens_per_minute=600, max_wait={INTERACTIVE: 0.2})  # 10 tokens a second
+    scheduler.release(scheduler.acquire(INTERACTIVE, tokens=600))
+
+    with pytest.raises(LLMBusyError) as excinfo:
+        scheduler.acquire(INTERACTIVE, tokens=300)
+    assert 25 <= excinfo.value.retry_after <= 31
+
+
+def test_throttled_endpoint_is_paused_for_its_retry_after():
+    scheduler = LLMScheduler(max_wait={INTERACTIVE: 0.5})
+    assert scheduler.backoff('primary', attempt=0, retry_after=3) == 3
+    assert scheduler.stats()["paused"]["primary"] > 2
+
+    with pytest.raises(LLMBusyError) as excinfo:
+        scheduler.acquire(INTERACTIVE, endpoint='primary')
+    assert excinfo.value.retry_after == 3
+    # Other endpoints are not held back
+    scheduler.release(scheduler.acquire(INTERACTIVE, endpoint='backup'))
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('3') == 3.0
+    assert parse_retry_after('-5') == 0.0
+    assert 50 <= parse_retry_after(formatdate(time.time() + 60, usegmt=True)) <= 60
+    assert parse_retry_after('soon') is None
+    assert parse_retry_after(None) is None
@@ -0,0 +1,81 @@
+from search_index import MinutesSearchIndex, fts_query, parse_date, parse_minutes
+from storage import LocalStorage
+
+MINUTES = """# Meeting Minutes
+
+**Date:** March 5th, 2024
+
+**Attendees:** Alice Smith (Product), Bob - Engineering and Carol
+
+## Summary
+The team reviewed the Q3 budget and the hiring plan.
+
+- **Categories**: Budget; Planning
+
+**Action Items**
+- **Alice** to circulate the updated budget.
+- Bob to confirm headcount with finance.
+
+**Conclusions**
+Budget approved pending finance review.
+"""
+
+
+def test_parse_minutes_sections():
+    parsed = parse_minutes(MINUTES)
+    assert parsed["attendees"] == ['Alice Smith', 'Bob', 'Carol']
+    assert parsed["categories"] == ['Budget', 'Planning']
+    assert parsed["action_items"] == [
+        'Alice to circulate the updated budget.', 'Bob to confirm headcount with finance.'
+    ]
+    assert parsed["summary"] == (
+        'The team reviewed the Q3 budget and the hiring plan. Budget approved pending finance review.'
+    )
+    assert parsed["meeting_date"] == '2024-03-05'
+
+
+def test_bold_list_items_are_not_headings():
+    parsed = parse_minutes("**Attendees**\n- **Alice** (host)\n- **Bob**: notes\n**Action Items**\n- **Bob** to send the deck\n")
+    assert parsed["attendees"] == ['Alice', 'Bob']
+    assert parsed["action_items"] == ['Bob to send the deck']
+
+
+def test_parse_date_formats():
+    assert parse_date('Held on 2024-01-31.') == '2024-01-31'
+    assert parse_date('Jan. 2, 2024') == '2024-01-02'
+    assert parse_date('3rd February 2024') == '2024-02-03'
+    assert parse_date('no date here') is None
+
+
+def test_fts_query_quotes_user_input():
+    assert fts_query('budget OR "x" NEAR(') == '"budget" "OR" "x" "NEAR"'
+
+
+def test_index_is_created_lazily_and_backfilled_from_storage(tmp_path):
+    storage = LocalStorage(str(tmp_path / 'output'))
+    storage.write('weekly.md', MINUTES.encode('utf-8'))
+    storage.write('sessions/abc.json', b'{}')
+    index = MinutesSearchIndex(str(tmp_path / 'index' / 'search.sqlite3'), source=storage)
+    assert not (tmp_path / 'index').exists()
+
+    results = index.search('budget', attendee='alice')
+    assert [result["meeting_id"] for result in results] == ['weekly']
+    assert len(index) == 1
+
+
+def test_indexes_on_different_hosts_see_each_others_minutes(tmp_path):
+    storage = LocalStorage(str(tmp_path / 'output'))
+    # Sync explicitly below rather than in the background
+    here = MinutesSearchIndex(str(tmp_path / 'here.sqlite3'), source=storage, sync_interval=3600)
+    there = MinutesSearchIndex(str(tmp_path / 'there.sqlite3'), source=storage, sync_interval=3600)
+    assert here.search('budget') == []
+
+    # Minutes stored and indexed on the other host
+    storage.write('weekly.md', MINUTES.encode('utf-8'))
+    there.index('weekly', MINUTES)
+    assert here.sync() == 1
+    assert [result["meeting_id"] for result in here.search('budget')] == ['weekly']
+
+    storage.delete('weekly.md')
+    assert here.sync() == 1
+    assert here.search('budget') == []
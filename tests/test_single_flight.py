@@ -0,0 +1,57 @@
+import threading
+
+import pytest
+
+from single_flight import SingleFlight
+
+
+def test_concurrent_callers_share_one_execution_and_its_error():
+    flight = SingleFlight('test-errors')
+    release = threading.Event()
+    executions = []
+    errors = []
+
+    def fail():
+        executions.append(1)
+        release.wait(5)
+        raise ValueError("upstream failed")
+
+    def call():
+        try:
+            flight.do('key', fail)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    # Every follower must be waiting on the leader before it fails
+    while flight.stats()["calls"] < 5:
+        threading.Event().wait(0.01)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(executions) == 1
+    assert len(errors) == 5
+    assert all(error is errors[0] for error in errors)
+    assert flight.stats()["coalesced"] == 4
+
+
+def test_key_is_released_after_a_failure():
+    flight = SingleFlight('test-release')
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        flight.do('key', fail)
+    assert flight.stats()["in_flight"] == 0
+    assert flight.do('key', lambda: 'ok') == 'ok'
+    assert flight.stats()["executed"] == 2
+
+
+def test_different_keys_run_separately():
+    flight = SingleFlight('test-keys')
+    assert [flight.do(key, lambda key=key: key.upper()) for key in ('a', 'b')] == ['A', 'B']
+    assert flight.stats()["coalesced"] == 0
@@ -0,0 +1,60 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict
+
+
+class TranscriptCache:
+    """Memory-bounded LRU of extracted transcript text.
+
+    Entries are keyed by the content digest of the upload, so a re-uploaded file
+    gets a new key and is never served stale text. The bound is on the total size
+    of the cached strings.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[str, str]' = OrderedDict()
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: str, loader: Callable[[], str]) -> str:
+        """Return the cached text for ``key``, calling ``loader()`` on a miss."""
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return text
+            self._misses += 1
+
+        text = loader()
+        self.put(key, text)
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """Pre-warm the cache with text that has already been extracted."""
+        size = sys.getsizeof(text)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= sys.getsizeof(previous)
+            self._entries[key] = text
+            self._current_bytes += size
+            while self._current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._current_bytes -= sys.getsizeof(evicted)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "entries": len(self._entries),
+                "bytes": self._current_bytes,
+                "max_bytes": self.max_bytes,
+            }